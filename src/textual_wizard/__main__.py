@@ -1,15 +1,24 @@
+import asyncio
 from random import random
+from typing import TYPE_CHECKING, Optional, get_args
 
-from click_extra import command, option
+from click_extra import Choice, ClickException, IntRange, Path, UsageError, command, option
 from rich.console import Console
 from rich.panel import Panel
 from rich.pretty import pprint
+from rich.table import Table
 from rich.text import Text as RichText
 from textual.validation import Number as Nb
 
+from textual_wizard.definitions import load_definition
+from textual_wizard.exceptions import InvalidSession
 from textual_wizard.inputs import URL, Email, Integer, Number, RadioSet, Select, SelectionList, Text
+from textual_wizard.synthetic import InputKind, synthetic_stages
 from textual_wizard.wizard import MultiStageWizard, Stages
 
+if TYPE_CHECKING:
+    from textual_wizard.benchmark import Profiler
+
 
 @command(params=None, version_fields={"prog_name": "Textual Wizard"})
 @option(
@@ -24,7 +33,106 @@ from textual_wizard.wizard import MultiStageWizard, Stages
     is_flag=True,
     help="Show all the questions on the same page.",
 )
-def textual_wizard(disable_tui: bool, single_page: bool) -> None:
+@option(
+    "-d",
+    "--definition",
+    type=Path(exists=True, dir_okay=False),
+    help="Run the wizard defined in a JSON or TOML file instead of the example.",
+)
+@option(
+    "-n",
+    "--synthetic",
+    type=IntRange(min=1),
+    help="Run a generated wizard with this number of questions per stage instead of the example.",
+)
+@option(
+    "-m",
+    "--options",
+    type=IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="Number of options of each generated Select, SelectionList and RadioSet.",
+)
+@option(
+    "-k",
+    "--kind",
+    type=Choice(get_args(InputKind)),
+    multiple=True,
+    help="Input type of the generated questions, repeat to cycle through types [default: mixed].",
+)
+@option(
+    "--stages",
+    type=IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of generated stages.",
+)
+@option(
+    "-l",
+    "--lazy-mount",
+    is_flag=True,
+    help="Only mount the widgets of the questions around the current one.",
+)
+@option(
+    "-p",
+    "--profile",
+    type=Path(dir_okay=False, writable=True),
+    help="Answer the wizard headlessly with a profiler attached, and write the profile here.",
+)
+@option(
+    "--profiler",
+    # The benchmarks load the TUI, the profilers are listed here to keep the startup fast
+    type=Choice(["cprofile", "sampling"]),
+    default="cprofile",
+    show_default=True,
+    help="cProfile writes pstats data, sampling uses pyinstrument and writes text or HTML.",
+)
+@option(
+    "-b",
+    "--bench",
+    type=Path(dir_okay=False, writable=True),
+    help="Run the benchmarks of the generated wizard headlessly, and write the results here.",
+)
+@option(
+    "--repeat",
+    type=IntRange(min=1),
+    default=3,
+    show_default=True,
+    help="Number of runs of the benchmarks.",
+)
+@option(
+    "-r",
+    "--record",
+    type=Path(dir_okay=False, writable=True),
+    help="Save the keys, pastes and button clicks of the session to this file.",
+)
+@option(
+    "--replay",
+    type=Path(exists=True, dir_okay=False),
+    help="Replay a recorded session headlessly, and report the latency of each type of event.",
+)
+@option(
+    "--realtime",
+    is_flag=True,
+    help="Replay the session with its recorded timings, instead of at full speed.",
+)
+def textual_wizard(
+    disable_tui: bool,
+    single_page: bool,
+    definition: Optional[str],
+    synthetic: Optional[int],
+    options: int,
+    kind: tuple[InputKind, ...],
+    stages: int,
+    lazy_mount: bool,
+    profile: Optional[str],
+    profiler: "Profiler",
+    bench: Optional[str],
+    repeat: int,
+    record: Optional[str],
+    replay: Optional[str],
+    realtime: bool,
+) -> None:
     ANIMALS = ["Cats 😺", "Dogs 🐶", "Monkeys 🐵", "Mice 🐭", "Hamsters 🐹", "Bunnies 🐰", "Other"]
     DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 
@@ -86,14 +194,76 @@ def textual_wizard(disable_tui: bool, single_page: bool) -> None:
             ],
         },
     ]
+    title = "MyApp"
+    if definition is not None:
+        # Compiled definitions are cached, so launching the same wizard again is fast
+        loaded = load_definition(definition)
+        title, MY_QUESTIONS = loaded["title"], loaded["stages"]
+
+    console = Console()
+    if bench is not None:
+        if synthetic is None:
+            raise UsageError("--bench runs a generated wizard, use --synthetic.")
+        from textual_wizard.benchmark import make_case, run_benchmarks, write_results  # noqa: PLC0415
+
+        case = make_case(
+            list(kind) or "mixed",
+            synthetic,
+            options,
+            stage_count=stages,
+            single_page=single_page,
+            lazy_mount=lazy_mount,
+        )
+        write_results(asyncio.run(run_benchmarks([case], repeat=repeat)), bench)
+        console.print(f"Benchmark results written to {bench}")
+        return
+
+    if synthetic is not None:
+        # Generated wizards reproduce the scaling problems of large forms
+        title = "Synthetic wizard"
+        MY_QUESTIONS = synthetic_stages(stages, synthetic, kind or "mixed", options)
+
     wiz = MultiStageWizard(
-        "MyApp",
+        title,
         disable_tui=disable_tui,
         single_page=single_page,
+        lazy_mount=lazy_mount,
+        record_session=record,
     )
-    answers = wiz.run(MY_QUESTIONS)
+    if replay is not None:
+        # A recorded session and the same questions reproduce a slow interaction
+        from textual_wizard.session import read_session, replay_session  # noqa: PLC0415
+
+        try:
+            session = read_session(replay)
+            report = asyncio.run(
+                replay_session(wiz.create_app(MY_QUESTIONS), session, realtime=realtime)
+            )
+        except InvalidSession as e:
+            raise ClickException(str(e)) from e
+
+        table = Table("Event", "Count", "Median", "p95", "p99", "Max", "CPU median", "CPU p95")
+        for event_type, stats in report["latencies"].items():
+            cpu = report["cpu_times"][event_type]
+            durations = [stats[x] for x in ("median", "p95", "p99", "max")]
+            durations += [cpu["median"], cpu["p95"]]
+            table.add_row(
+                event_type, str(int(stats["count"])), *(f"{x * 1000:.2f}ms" for x in durations)
+            )
+        console.print(table)
+        answers = report["answers"]
+    elif profile is not None:
+        # The same app as the one of the wizard, answered headlessly
+        from textual_wizard.benchmark import profile_session  # noqa: PLC0415
+
+        try:
+            answers = profile_session(wiz.create_app(MY_QUESTIONS), profile, profiler)
+        except ImportError as e:
+            raise ClickException(str(e)) from e
+        console.print(f"Profile written to {profile}")
+    else:
+        answers = wiz.run(MY_QUESTIONS)
 
-    console = Console()
     console.print(Panel(RichText.assemble("Result", justify="center", style="bold")))
 
     pprint(answers, expand_all=True)
@@ -0,0 +1,1725 @@
+import asyncio
+from bisect import bisect_left, bisect_right
+from collections.abc import Coroutine
+from contextlib import AbstractContextManager
+from functools import partial
+from itertools import accumulate
+from time import perf_counter
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+from textual import events, on
+from textual.app import App, ComposeResult
+from textual.containers import Container, Horizontal, VerticalScroll
+from textual.errors import NoWidget
+from textual.message import Message
+from textual.reactive import reactive
+from textual.screen import Screen
+from textual.timer import Timer
+from textual.widget import Widget
+from textual.widgets import Button, Header, Input, Label, RadioButton, Static
+from textual.widgets import RadioSet as RadioSet_
+from textual.widgets import Select as Select_
+from textual.widgets import SelectionList as SelectionList_
+from textual.widgets._select import NoSelection, SelectOverlay
+
+from textual_wizard.checkpoint import Checkpoint
+from textual_wizard.conditions import MISSING, ConditionGraph, compile_conditions
+from textual_wizard.exceptions import QuestionNameNotUnique
+from textual_wizard.inputs import (
+    BaseText,
+    InputType,
+    OptionsInput,
+    RadioSet,
+    Select,
+    SelectionList,
+    ValidationResult,
+    match_option,
+)
+from textual_wizard.instrumentation import NO_TIMER, Instrumentation
+from textual_wizard.session import SessionRecorder
+from textual_wizard.sources import AnswerCallback
+from textual_wizard.wizard import WizardStage
+
+# The Textual application running the wizards. This module is only imported when the TUI is used,
+# so the wizards running without it don't pay the import cost of Textual.
+
+InputWidget = Input | Select_ | SelectionList_ | RadioSet_
+
+
+class WizardScreen(Screen[None]):
+    """
+    A screen asking the questions of a single wizard stage.
+
+    Stage screens are installed on the `WizardApp` and stay mounted for the whole session,
+    so switching between stages keeps the widgets, and the values entered in them.
+    """
+
+    class Completed(Message):
+        """Posted when the next button is clicked while on the last question of the stage."""
+
+        def __init__(self, wizard_screen: "WizardScreen") -> None:
+            super().__init__()
+            self.wizard_screen = wizard_screen
+
+    class BackRequested(Message):
+        """Posted when the back button is clicked while on the first question of the stage."""
+
+        def __init__(self, wizard_screen: "WizardScreen") -> None:
+            super().__init__()
+            self.wizard_screen = wizard_screen
+
+    class ConditionsChanged(Message):
+        """Posted when an answer changed the visibility or the default of other questions."""
+
+        def __init__(self, wizard_screen: "WizardScreen", changed: list[str]) -> None:
+            super().__init__()
+            self.wizard_screen = wizard_screen
+            self.changed = changed
+
+    questions: Sequence[InputType]
+    """Questions supplied by the user"""
+
+    answers: dict[str, Any]
+    """Answers to return when the wizard is completed"""
+
+    single_page: bool
+    """Show all the questions on a single page"""
+
+    allow_back: bool = False
+    """
+    Allow the user to click the previous button while on the first question,
+    which will post a `BackRequested` message, used to go back to the previous stage.
+    """
+
+    lazy_mount: bool = False
+    """
+    Only mount the widgets of the questions around the current one.
+    In single_page mode, only the questions in and near the viewport are mounted.
+    """
+
+    lookahead: int = 1
+    """Number of questions kept mounted before and after the current (or visible) ones"""
+
+    validation_delay: float = 0
+    """
+    Time to wait after the last change of a text input before validating it, in seconds.
+    Can be overridden on each question.
+    """
+
+    on_answer: Optional[AnswerCallback] = None
+    """Called with the name and the answer of each question, as soon as it is registered"""
+
+    answer_tasks: list[asyncio.Task[Any]]
+    """Tasks running the async `on_answer` callbacks, which may outlive the wizard"""
+
+    registered_inputs: set[int]
+    """Indexes of the questions whose answer was registered at least once"""
+
+    def __init__(
+        self,
+        questions: Sequence[InputType],
+        *,
+        single_page: bool = False,
+        allow_back: bool = False,
+        sub_title: Optional[str] = None,
+        lazy_mount: bool = False,
+        lookahead: int = 1,
+        validation_delay: float = 0,
+        on_answer: Optional[AnswerCallback] = None,
+        answer_tasks: Optional[list[asyncio.Task[Any]]] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        resume: bool = False,
+        instrumentation: Optional[Instrumentation] = None,
+        conditions: Optional[ConditionGraph] = None,
+    ) -> None:
+        super().__init__()
+        self.questions = questions
+        self.on_answer = on_answer
+        self.answer_tasks = list() if answer_tasks is None else answer_tasks
+        self.instrumentation = instrumentation
+        self.conditions = conditions
+        self.checkpoint = checkpoint
+        self.resume = resume
+        self.single_page = single_page
+        self.allow_back = allow_back
+        self.sub_title = sub_title
+        self.lazy_mount = lazy_mount
+        self.lookahead = lookahead
+        self.validation_delay = validation_delay
+        self.prepared_widgets = dict()
+        # The options may be loading before the stage is composed, see WizardApp.prefetch_stage
+        self.input_widgets = [None] * len(questions)
+        self.loading_options = set()
+        self.skipped = set()
+        self.update_offsets()
+
+    # -------------------- Validation error handling
+    # Validation of the input is triggered:
+    # - On input change, once the input settles if a validation delay is configured
+    # - When the next button is clicked
+    # Async validators run in a worker once the other validators succeeded,
+    # and the navigation resumes when they are done.
+
+    error_labels: list[Label | None]
+    """Widgets showing invalid input errors below the input widgets, None if not mounted"""
+
+    error_texts: reactive[list[str | None]] = reactive([])
+    """The description of the currently shown invalid input errors"""
+
+    invalid_inputs: set[int]
+    """Indexes of the questions currently showing an error"""
+
+    def set_error(self, error: str | None, index: int) -> None:
+        """Set the input error text for the input widget at the provided index"""
+        if self.error_texts[index] == error:
+            return
+
+        self.error_texts[index] = error
+        if error is None:
+            self.invalid_inputs.discard(index)
+        else:
+            self.invalid_inputs.add(index)
+
+        # Only the widgets of the modified question are updated
+        self.update_error_label(index)
+        self.next_button.disabled = len(self.invalid_inputs) > 0
+
+    def error_texts_updated(self) -> None:
+        """Update all the error labels on the screen, and the next button."""
+        for i in range(len(self.error_texts)):
+            self.update_error_label(i)
+        self.next_button.disabled = len(self.invalid_inputs) > 0
+
+    def update_error_label(self, index: int) -> None:
+        """Update the error label and input widget of the question at the provided index"""
+        wid = self.input_widgets[index]
+        error_label = self.error_labels[index]
+        if wid is None or error_label is None:
+            # The error of unmounted questions is shown when they are mounted
+            return
+
+        error_text = self.error_texts[index]
+        if error_text is None:
+            # If there is no error, hide the error label,
+            # Put the input widget in normal mode
+            error_label.add_class("hidden")
+            wid.remove_class("invalid")
+        else:
+            # If there is an error, put the input widget in invalid mode
+            # Show the error label and update it's content
+            wid.add_class("invalid")
+            error_label.remove_class("hidden")
+            error_label.update(error_text)
+
+    def on_input_changed(self, message: Input.Changed) -> None:
+        """Validate the input at every change"""
+        qid = self.get_question_id(message.input)
+        if qid is None:
+            # The widget was unmounted since it changed
+            return
+
+        question = self.questions[qid]
+        if not isinstance(question, BaseText):
+            return
+
+        delay = self.get_validation_delay(question)
+        if delay > 0:
+            self.schedule_validation(qid, delay)
+            return
+
+        self.validate_value(qid, question, message.value)
+
+    validation_timers: dict[int, Timer]
+    """Pending delayed validations, by question index"""
+
+    def get_validation_delay(self, question: BaseText) -> float:
+        """Return the validation delay of a question, falling back to the one of the wizard"""
+        if question.validation_delay is not None:
+            return question.validation_delay
+        return self.validation_delay
+
+    def schedule_validation(self, qid: int, delay: float) -> None:
+        """Validate the question with provided index once its value stops changing"""
+        self.cancel_validation(qid)
+        self.validation_timers[qid] = self.set_timer(delay, partial(self.validate_input, qid))
+
+        # The error of the previous value is cleared, the new one may be valid.
+        # Clicking next always triggers a validation anyway
+        self.set_error(None, qid)
+        self.next_button.disabled = bool(self.invalid_inputs - {qid})
+
+    def cancel_validation(self, qid: int) -> None:
+        """Cancel the pending delayed validation of a question, if any"""
+        timer = self.validation_timers.pop(qid, None)
+        if timer is not None:
+            timer.stop()
+
+    pending_values: dict[int, str]
+    """Values being validated by async validators, by question index"""
+
+    after_validation: Optional[Callable[[], None]] = None
+    """Called once all the pending async validations succeeded, to resume the navigation"""
+
+    def validate_value(self, qid: int, question: BaseText, value: str) -> bool:
+        """
+        Validate a value of a text-based question.
+        Return False if the async validators of the question must run first.
+        """
+        with self.timed("validation", qid):
+            results = question.is_value_accepted(value)
+        if results.valid:
+            cached = question.get_async_result(value)
+            if cached is None:
+                self.start_async_validation(qid, question, value)
+                return False
+            results = cached
+
+        self.cancel_async_validation(qid)
+        return self.handle_validation_result(results, qid)
+
+    def start_async_validation(self, qid: int, question: BaseText, value: str) -> None:
+        """Run the async validators of a question in a worker, unless already running"""
+        if self.pending_values.get(qid) == value:
+            return
+
+        # The other validators succeeded
+        self.set_error(None, qid)
+        wid = self.input_widgets[qid]
+        if wid is not None:
+            wid.add_class("pending")
+
+        # Starting an exclusive worker cancels the validation of the previous value
+        self.pending_values[qid] = value
+        self.run_worker(
+            self.run_async_validation(qid, question, value),
+            group=f"validation-{qid}",
+            exclusive=True,
+        )
+
+    async def run_async_validation(self, qid: int, question: BaseText, value: str) -> None:
+        with self.timed("async_validation", qid):
+            results = await question.is_value_accepted_async(value)
+
+        self.pending_values.pop(qid, None)
+        wid = self.input_widgets[qid]
+        if wid is not None:
+            wid.remove_class("pending")
+
+        if not self.handle_validation_result(results, qid):
+            self.after_validation = None
+            return
+
+        if not self.pending_values and self.after_validation is not None:
+            callback = self.after_validation
+            self.after_validation = None
+            callback()
+
+    def cancel_async_validation(self, qid: int) -> None:
+        """Cancel the pending async validation of a question, if any"""
+        if self.pending_values.pop(qid, None) is None:
+            return
+
+        # The navigation waiting for the cancelled validation is abandoned
+        self.after_validation = None
+        self.workers.cancel_group(self, f"validation-{qid}")
+        wid = self.input_widgets[qid]
+        if wid is not None:
+            wid.remove_class("pending")
+
+    def handle_validation_result(self, vr: ValidationResult, qid: int) -> bool:
+        """Handles the result of every input validation"""
+
+        # There is a better way to do that but the linter isnt happy
+        if vr.valid:
+            self.set_error(None, qid)
+        else:
+            self.set_error(vr.failure_reason, qid)
+        # The conditions read the answers once they are validated
+        self.update_conditions(qid, vr.valid)
+        return vr.valid
+
+    def validate_current_input(self) -> bool:
+        """Triggers a validation for the current input"""
+        if self.single_page:
+            raise Exception("validate_current_input should not be called in single_page mode.")
+        return self.validate_input(self.question_index)
+
+    def validate_input(self, qid: int) -> bool:
+        """Triggers a validation for the given question ID"""
+        self.cancel_validation(qid)
+        if qid in self.skipped:
+            return True
+        wid = self.input_widgets[qid]
+        question = self.questions[qid]
+
+        if wid is None:
+            # Unmounted questions are validated from their saved value
+            if not isinstance(question, BaseText):
+                return True
+            value = self.widget_values.get(qid, question.initial_value)
+            valid = self.validate_value(qid, question, str(value))
+            if not valid and qid not in self.pending_values and self.single_page:
+                self.scroll_view.scroll_to(y=self.offsets[qid], animate=False)
+            return valid
+
+        if isinstance(wid, Input):
+            if not isinstance(question, BaseText):
+                raise Exception(
+                    "We assume the current question is text based if the current"
+                    "widget is a textual Input."
+                )
+            return self.validate_value(qid, question, wid.value)
+        # If the current widget is not an Input, it must be a Select, so no validation required.
+        return True
+
+    def validate_all_inputs(self) -> bool:
+        result = True
+        for i in range(len(self.questions)):
+            result = result and self.validate_input(i)
+
+        return result
+
+    # -------------------- Switching between questions
+    back_button: Button
+    next_button: Button
+
+    question_index: int = 0
+    """Index of the current question within self.questions"""
+
+    input_widgets: list[InputWidget | None]
+    """
+    List of all the input widgets, matching the index of items in self.questions.
+    Questions that are not mounted (see lazy_mount) are None.
+    """
+
+    widget_values: dict[int, object]
+    """Values of the input widgets that were unmounted, restored when they are mounted again"""
+
+    question_ids: dict[Widget, int]
+    """Index of the question of each mounted input widget"""
+
+    pressed_options: dict[int, int]
+    """Index of the pressed option of each mounted radio set, -1 if none"""
+
+    @property
+    def active_input(self) -> InputWidget:
+        if self.single_page:
+            raise Exception("active_input should not be called in single_page mode.")
+        return self.get_input_widget(self.question_index)
+
+    def get_input_widget(self, qid: int) -> InputWidget:
+        """Return the input widget of the question with provided index, which must be mounted"""
+        wid = self.input_widgets[qid]
+        if wid is None:
+            raise Exception(f"The widget of question {qid} is not mounted.")
+        return wid
+
+    @property
+    def selected_question(self) -> InputType:
+        if self.single_page:
+            raise Exception("selected_question should not be called in single_page mode.")
+        return self.questions[self.question_index]
+
+    def read_answer(self, qid: int) -> object:
+        """Return the answer of the question at the provided index, read from its widget"""
+        value: Any = None
+        wid = self.input_widgets[qid]
+        question = self.questions[qid]
+        if wid is None:
+            value = self.get_unmounted_answer(qid)
+        elif isinstance(wid, Select_):
+            value = wid.value
+            if isinstance(value, NoSelection):
+                value = None
+        elif isinstance(wid, SelectionList_):
+            value = [*wid.selected, *self.hidden_selections.get(qid, ())]
+        elif isinstance(question, RadioSet):
+            pressed = self.pressed_options[qid]
+            value = question.options[pressed][1] if pressed >= 0 else None
+        elif isinstance(question, BaseText) and isinstance(wid, Input):
+            value = question.parse_result(wid.value)
+        return value
+
+    def register_input(self, qid: int) -> None:
+        """Registers the value of the input at the provided index into self.answers"""
+        if qid in self.skipped:
+            # Skipped questions are answered with None, and not notified
+            self.answers[self.questions[qid].name] = None
+            return
+
+        with self.timed("register_input", qid):
+            question = self.questions[qid]
+            value = self.read_answer(qid)
+
+            # Unchanged answers are not notified again, when the user navigates back and forth
+            if qid in self.registered_inputs and self.answers[question.name] == value:
+                return
+            self.answers[question.name] = value
+            self.registered_inputs.add(qid)
+            if self.checkpoint is not None:
+                self.checkpoint.record(question.name, value)
+
+            if self.on_answer is not None:
+                result = self.on_answer(question.name, value)
+                if isinstance(result, Coroutine):
+                    # Async callbacks run in the background, while the next questions are answered.
+                    # They are not workers of the screen, so they aren't cancelled when it exits.
+                    self.answer_tasks.append(asyncio.create_task(result))
+
+    def register_all_inputs(self) -> None:
+        """Registers the value of all the inputs into self.answers"""
+        for i in range(len(self.questions)):
+            self.register_input(i)
+
+    def goto(self, question_index: int) -> None:
+        """Go to the question with provided index"""
+        with self.timed("goto", question_index):
+            if self.single_page:
+                raise Exception("goto should not be called in single_page mode.")
+            # A navigation waiting for async validators is replaced by this one
+            self.after_validation = None
+
+            # Do nothing if we are trying to go to the next question while the input is invalid
+            if not self.validate_current_input() and question_index >= self.question_index:
+                # Resume once the async validators of the current input succeeded
+                if self.question_index in self.pending_values:
+                    # The validated answer may show the questions following it
+                    if question_index == self.find_visible(self.question_index + 1, 1):
+                        self.after_validation = self.next_question
+                    else:
+                        self.after_validation = partial(self.goto, question_index)
+                return
+
+            # The validated answer may have skipped the target question
+            if question_index > self.question_index:
+                question_index = self.find_visible(question_index, 1)
+
+            # If we are going to a precedent question, clear the error on the current input
+            self.cancel_async_validation(self.question_index)
+            self.set_error(None, self.question_index)
+
+            # Register the value of the input when navigating to the next question
+            if question_index >= self.question_index:
+                self.register_input(self.question_index)
+                self.save_checkpoint()
+
+            # If the user clicked next on the last question, the stage is completed
+            if question_index >= len(self.questions):
+                self.post_message(self.Completed(self))
+                return
+
+            # Hide the previous questions
+            self.active_input.add_class("hidden")
+
+            self.question_index = question_index
+            if self.lazy_mount:
+                self.update_mounted_inputs()
+
+            # Show the new one
+            self.active_input.remove_class("hidden")
+            self.active_input.focus()
+
+            self.update_back_button()
+
+    def update_back_button(self) -> None:
+        """
+        Enable the back button if this is not the first question (skipped questions aside),
+        or if allow_back is enabled
+        """
+        first = self.find_visible(self.question_index - 1, -1) < 0
+        self.back_button.disabled = first and not self.allow_back
+
+    def find_visible(self, qid: int, step: int) -> int:
+        """
+        Return the index of the first question which is not skipped, from the provided index
+        and moving by step. Return -1 or the number of questions if there is none.
+        """
+        while 0 <= qid < len(self.questions) and qid in self.skipped:
+            qid += step
+        return qid
+
+    @on(Button.Pressed, "#next-button")
+    def next_button_pressed(self) -> None:
+        if self.single_page:
+            if self.validate_all_inputs():
+                self.register_all_inputs()
+                self.save_checkpoint()
+                self.post_message(self.Completed(self))
+            elif self.pending_values:
+                # Try again once the async validators succeeded
+                self.after_validation = self.next_button_pressed
+            return
+
+        self.next_question()
+
+    def next_question(self) -> None:
+        """Go to the next question when the next button is clicked or an input is 'submitted'"""
+        if self.single_page:
+            self.focus_next()
+            return
+
+        # The conditions read the validated answer, so a delayed validation runs first
+        if self.question_index in self.validation_timers:
+            self.validate_input(self.question_index)
+        # go the the next question
+        self.goto(self.find_visible(self.question_index + 1, 1))
+
+    @on(Button.Pressed, "#back-button")
+    def back_button_pressed(self) -> None:
+        previous = self.find_visible(self.question_index - 1, -1)
+        if self.allow_back and (self.single_page or previous < 0):
+            self.post_message(self.BackRequested(self))
+            return
+
+        self.previous_question()
+
+    def previous_question(self) -> None:
+        """Go the the previous question when the back button is clicked"""
+        previous = self.find_visible(self.question_index - 1, -1)
+        if previous >= 0:
+            self.goto(previous)
+
+    def on_input_submitted(self, _: Input.Submitted) -> None:
+        """Simulate a click on the next button when enter is pressed on an input"""
+        self.next_question()
+
+    # -------------------- Lazy mounting
+    # With lazy_mount, only the questions within a window are mounted:
+    # - In paged mode, the questions within `lookahead` of the current one
+    # - In single_page mode, the questions in the viewport, plus `lookahead` on both sides.
+    #   The unmounted questions are replaced by two spacers with their estimated height.
+    # The value of a widget is kept in widget_values when it gets unmounted.
+    # Skipped questions are never mounted, and take no space in single_page mode.
+
+    container: Container
+    buttons: Horizontal
+    scroll_view: VerticalScroll
+    top_spacer: Static
+    bottom_spacer: Static
+
+    mounted_inputs: set[int]
+    """Indexes of the questions whose widgets are currently created"""
+
+    window: tuple[int, int] = (0, 0)
+    """Range of the indexes of the questions to mount"""
+
+    offsets: list[int]
+    """Estimated vertical position of each question in single_page mode, followed by the total"""
+
+    prepared_widgets: dict[int, InputWidget]
+    """Input widgets built before the screen is composed, by index of question"""
+
+    def is_in_window(self, qid: int) -> bool:
+        """Whether or not the question with provided index should be mounted"""
+        if qid in self.skipped:
+            return False
+        if not self.lazy_mount:
+            return True
+        return self.window[0] <= qid < self.window[1]
+
+    def get_window(self) -> tuple[int, int]:
+        """Compute the range of the indexes of the questions to mount"""
+        if not self.single_page:
+            start = self.question_index - self.lookahead
+            end = self.question_index + self.lookahead + 1
+        else:
+            top, height = 0, self.app.size.height
+            if self.is_mounted and self.scroll_view.size.height > 0:
+                top, height = round(self.scroll_view.scroll_y), self.scroll_view.size.height
+            start = bisect_right(self.offsets, top) - 1 - self.lookahead
+            end = bisect_left(self.offsets, top + height) + self.lookahead
+
+        return max(0, start), min(len(self.questions), end)
+
+    def estimate_height(self, question: InputType) -> int:
+        """Estimate the height of the widget of a question, borders included"""
+        if isinstance(question, (SelectionList, RadioSet)):
+            return len(question.options) + 2
+        return 3
+
+    def update_offsets(self) -> None:
+        """Estimate the position of each question, the skipped ones taking no space"""
+        heights = (
+            0 if i in self.skipped else self.estimate_height(x)
+            for i, x in enumerate(self.questions)
+        )
+        self.offsets = [0, *accumulate(heights)]
+
+    def get_initial_inputs(self) -> range:
+        """Indexes of the questions whose widgets are created when the screen is composed"""
+        if not self.lazy_mount:
+            return range(len(self.questions))
+        return range(*self.get_window())
+
+    def prepare_input(self, qid: int) -> None:
+        """Build the widget of a question before the screen is composed"""
+        if qid not in self.prepared_widgets:
+            self.prepared_widgets[qid] = self.build_input(qid)
+
+    def build_input(self, qid: int) -> InputWidget:
+        with self.timed("as_widget", qid):
+            return self.questions[qid].as_widget(f"input-{qid}")
+
+    def create_input(self, qid: int) -> tuple[InputWidget, Label]:
+        """Create the input widget and error label of a question"""
+        wid = self.prepared_widgets.pop(qid, None)
+        if wid is None:
+            wid = self.build_input(qid)
+        wid.add_class("input")
+
+        # Only show the current input is single_page is disabled
+        if qid != self.question_index and not self.single_page:
+            wid.add_class("hidden")
+
+        error_label = Label("", classes="hidden error-label")
+        self.input_widgets[qid] = wid
+        self.question_ids[wid] = qid
+        self.error_labels[qid] = error_label
+        self.mounted_inputs.add(qid)
+
+        question = self.questions[qid]
+        if isinstance(question, RadioSet):
+            self.pressed_options[qid] = question.default_index
+        if qid in self.widget_values:
+            value = self.widget_values.pop(qid)
+            self.set_widget_value(qid, value)
+            # The button is pressed after a refresh, the answer is known right away
+            if isinstance(question, RadioSet) and isinstance(value, int):
+                self.pressed_options[qid] = value
+
+        if isinstance(question, OptionsInput) and not question.options_complete:
+            self.call_after_refresh(self.watch_options, qid)
+        if qid in self.loading_options:
+            self.update_border_subtitle(qid)
+        self.visible_options.pop(qid, None)
+        self.radio_buttons.pop(qid, None)
+        if isinstance(wid, Select_) and question.index is not None:
+            # The filter of a select is cleared when it collapses
+            def expanded_changed(expanded: bool) -> None:
+                if not expanded and qid in self.filters:
+                    self.filter_options(qid, "")
+
+            self.watch(wid, "expanded", expanded_changed, init=False)
+
+        # Show the error of a question that was validated while unmounted
+        if self.error_texts[qid] is not None:
+            self.update_error_label(qid)
+
+        return wid, error_label
+
+    def update_mounted_inputs(self) -> None:
+        """Mount the questions entering the window, and unmount the ones leaving it"""
+        window = self.get_window()
+        if window == self.window:
+            return
+        self.window = window
+        self.sync_mounted_inputs()
+
+    def sync_mounted_inputs(self) -> None:
+        """Mount the questions that should be, and unmount the others"""
+        for qid in [x for x in self.mounted_inputs if not self.is_in_window(x)]:
+            # All the options are shown again, so the value of the widget is complete
+            if qid in self.filters:
+                self.filter_options(qid, "")
+            wid = self.get_input_widget(qid)
+            self.widget_values[qid] = self.get_widget_value(qid)
+            del self.question_ids[wid]
+            wid.remove()
+            error_label = self.error_labels[qid]
+            if error_label is not None:
+                error_label.remove()
+
+            self.input_widgets[qid] = None
+            self.error_labels[qid] = None
+            self.mounted_inputs.discard(qid)
+            self.radio_buttons.pop(qid, None)
+
+        window = self.window if self.lazy_mount else (0, len(self.questions))
+        if not self.single_page:
+            # A single question is shown, the order of the widgets doesn't matter
+            widgets: list[Widget] = list()
+            for qid in range(*window):
+                if qid not in self.mounted_inputs and self.is_in_window(qid):
+                    widgets.extend(self.create_input(qid))
+            if widgets:
+                self.container.mount(*widgets, before=self.buttons)
+            return
+
+        # Questions are mounted in order, before the first mounted question following them
+        parent = self.scroll_view if self.lazy_mount else self.container
+        pending: list[Widget] = list()
+        for qid in range(*window):
+            if qid in self.mounted_inputs:
+                if pending:
+                    parent.mount(*pending, before=self.get_input_widget(qid))
+                    pending = list()
+            elif self.is_in_window(qid):
+                pending.extend(self.create_input(qid))
+        if pending:
+            parent.mount(*pending, before=self.bottom_spacer if self.lazy_mount else self.buttons)
+        if self.lazy_mount:
+            self.update_spacers()
+
+    def update_spacers(self) -> None:
+        """Give the spacers the estimated height of the unmounted questions they replace"""
+        self.top_spacer.styles.height = self.offsets[self.window[0]]
+        self.bottom_spacer.styles.height = self.offsets[-1] - self.offsets[self.window[1]]
+
+    def on_mount(self) -> None:
+        if self.lazy_mount and self.single_page:
+            self.watch(self.scroll_view, "scroll_y", self.update_mounted_inputs, init=False)
+        if self.resume and self.checkpoint is not None:
+            self.resume_at_unanswered()
+
+    def on_resize(self, _: events.Resize) -> None:
+        # The scroll view is resized with the screen, once its layout is refreshed
+        if self.lazy_mount and self.single_page:
+            self.call_after_refresh(self.update_mounted_inputs)
+
+    def get_unmounted_answer(self, qid: int) -> object:
+        """Return the answer of a question whose widget is not mounted"""
+        question = self.questions[qid]
+        value = self.widget_values.get(qid)
+
+        if isinstance(question, BaseText):
+            return question.parse_result(question.initial_value if value is None else str(value))
+        if isinstance(question, SelectionList):
+            return question.options.flagged_values() if value is None else value
+        if isinstance(question, RadioSet):
+            if not isinstance(value, int):
+                return question.default_value
+            return question.options[value][1] if value >= 0 else None
+        if isinstance(question, Select):
+            return question.default_value if value is None else value
+        return value
+
+    def get_widget_value(self, qid: int) -> object:
+        """Return the raw value of the input widget of a question"""
+        wid = self.get_input_widget(qid)
+        if isinstance(wid, SelectionList_):
+            return list(wid.selected)
+        if isinstance(wid, RadioSet_):
+            return self.pressed_options[qid]
+        return wid.value
+
+    def set_widget_value(self, qid: int, value: object) -> None:
+        """Restore the raw value of the input widget of a question, returned by get_widget_value"""
+        wid = self.get_input_widget(qid)
+        if isinstance(wid, SelectionList_) and isinstance(value, list):
+            wid.deselect_all()
+            for x in value:
+                wid.select(x)
+        elif isinstance(wid, RadioSet_) and isinstance(value, int):
+            # The buttons of a radio set are only available once it is mounted
+            def press_button() -> None:
+                if value >= 0:
+                    self.get_radio_buttons(qid, wid)[value].value = True
+
+            self.call_after_refresh(press_button)
+        elif isinstance(wid, Input):
+            wid.value = str(value)
+        elif isinstance(wid, Select_):
+            wid.value = value
+
+    # -------------------- Option providers
+    # Questions whose options are supplied by an OptionProvider load a first page
+    # once their widget is mounted, then the following ones in a worker
+    # when the user scrolls near the end of the loaded options, or while the options
+    # matching the filter don't fill the widget.
+
+    loading_options: set[int]
+    """Indexes of the questions currently loading a page of options"""
+
+    def get_options_scrollable(self, qid: int) -> Widget | None:
+        """Return the widget scrolling through the options of a question, None if unmounted"""
+        wid = self.input_widgets[qid]
+        if isinstance(wid, Select_):
+            return wid.query_one(SelectOverlay)
+        if isinstance(wid, SelectionList_):
+            return wid
+        return None
+
+    def watch_options(self, qid: int) -> None:
+        """Load more options when the user scrolls near the end of the loaded options"""
+        scrollable = self.get_options_scrollable(qid)
+        if scrollable is None:
+            return
+
+        self.watch(scrollable, "scroll_y", lambda _: self.check_options(qid), init=False)
+        wid = self.input_widgets[qid]
+        if isinstance(wid, Select_):
+            # The options of a select are only shown once it is expanded
+            def expanded_changed(_: bool) -> None:
+                self.call_after_refresh(self.check_options, qid)
+
+            self.watch(wid, "expanded", expanded_changed, init=False)
+        self.check_options(qid)
+
+    def check_options(self, qid: int) -> None:
+        """Start loading the next page of options of a question, if they are needed"""
+        question = self.questions[qid]
+        scrollable = self.get_options_scrollable(qid)
+        if (
+            scrollable is None
+            or not isinstance(question, OptionsInput)
+            or question.options_complete
+            or qid in self.loading_options
+        ):
+            return
+
+        height = scrollable.size.height
+        if height == 0:
+            # Hidden options, only the first page is loaded, unless none of them matches
+            # the filter, like a select which isn't expanded without matches
+            needed = len(question.options) == 0 or qid in self.filters
+        else:
+            needed = scrollable.max_scroll_y - scrollable.scroll_y < height
+
+        if needed:
+            self.loading_options.add(qid)
+            self.run_worker(self.load_options(qid), group=f"options-{qid}")
+
+    async def load_options(self, qid: int) -> None:
+        """Load the next page of options of a question, and add them to its widget"""
+        question = self.questions[qid]
+        assert isinstance(question, OptionsInput)
+
+        self.update_border_subtitle(qid)
+        try:
+            await question.load_options()
+        finally:
+            self.loading_options.discard(qid)
+        self.show_loaded_options(qid)
+
+    async def prefetch_options(self, qid: int) -> None:
+        """Load the first page of options of a question, before the stage is shown"""
+        question = self.questions[qid]
+        assert isinstance(question, OptionsInput)
+
+        try:
+            await question.load_options()
+        finally:
+            self.loading_options.discard(qid)
+        # The stage may have been composed while loading
+        self.show_loaded_options(qid)
+
+    def show_loaded_options(self, qid: int) -> None:
+        """Add the loaded options missing from the widget of a question"""
+        question = self.questions[qid]
+        assert isinstance(question, OptionsInput)
+
+        # The widget may have been recreated while loading
+        wid = self.input_widgets[qid]
+        if wid is None:
+            return
+        if not wid.is_mounted:
+            self.call_after_refresh(self.show_loaded_options, qid)
+            return
+        self.update_border_subtitle(qid)
+
+        if qid in self.filters:
+            # Only the new options matching the query are shown
+            self.filter_options(qid, self.filters[qid])
+        elif isinstance(wid, SelectionList_):
+            wid.add_options(question.options[wid.option_count :])
+        elif isinstance(wid, Select_) and isinstance(question, Select):
+            # Setting the options resets the selection and the scroll position of the overlay
+            overlay = wid.query_one(SelectOverlay)
+            value, highlighted, scroll_y = wid.value, overlay.highlighted, overlay.scroll_y
+            wid.set_options(question.options)
+            wid.prompt = "Select"
+            wid.value = question.default_value if isinstance(value, NoSelection) else value
+            if wid.expanded:
+                overlay.highlighted = highlighted
+                overlay.scroll_to(y=scroll_y, animate=False)
+
+        # Keep loading while the options don't fill their widget
+        self.call_after_refresh(self.check_options, qid)
+
+    def update_border_subtitle(self, qid: int) -> None:
+        """Show the filter query of a question, and whether its options are loading"""
+        wid = self.input_widgets[qid]
+        if wid is None:
+            return
+        parts = list()
+        if qid in self.filters:
+            parts.append(f"Filter: {self.filters[qid]}")
+        if qid in self.loading_options:
+            parts.append("Loading...")
+        wid.border_subtitle = " - ".join(parts) or None
+
+    # -------------------- Type to filter
+    # The options of questions having an index are filtered by typing while their widget is
+    # focused. The query is shown in the border of the widget, backspace removes its last
+    # character and escape clears it. Filtering a selection list keeps the hidden options
+    # selected, and a select is filtered while it is expanded.
+
+    filters: dict[int, str]
+    """Filter query of each question whose options are filtered"""
+
+    hidden_selections: dict[int, set[Any]]
+    """Selected values of the selection lists hidden by their filter"""
+
+    visible_options: dict[int, set[int]]
+    """Indexes of the radio buttons shown by the filter of each radio set"""
+
+    radio_buttons: dict[int, list[RadioButton]]
+    """Buttons of each mounted radio set, queried once per widget"""
+
+    def get_radio_buttons(self, qid: int, wid: RadioSet_) -> list[RadioButton]:
+        """Return the buttons of a radio set, which must be mounted"""
+        buttons = self.radio_buttons.get(qid)
+        if buttons is None:
+            buttons = list(wid.query_children(RadioButton))
+            # The buttons are mounted after the radio set
+            if buttons:
+                self.radio_buttons[qid] = buttons
+        return buttons
+
+    def get_focused_question(self) -> int | None:
+        """Return the index of the question whose widget contains the focus, if any"""
+        node = self.focused
+        while node is not None and node is not self:
+            if isinstance(node, Widget) and node in self.question_ids:
+                return self.question_ids[node]
+            node = node.parent
+        return None
+
+    def on_key(self, event: events.Key) -> None:
+        qid = self.get_focused_question()
+        if qid is None or self.questions[qid].index is None:
+            return
+
+        query = self.filters.get(qid, "")
+        if event.key == "backspace" and query:
+            query = query[:-1]
+        elif event.key == "escape" and query:
+            query = ""
+        elif event.is_printable and event.character not in (None, " "):
+            query += event.character or ""
+        else:
+            return
+
+        event.stop()
+        event.prevent_default()
+        self.filter_options(qid, query)
+
+    def filter_options(self, qid: int, query: str) -> None:
+        """Only show the options of a question matching a query, all of them if it is empty"""
+        index = self.questions[qid].index
+        wid = self.input_widgets[qid]
+        if index is None or wid is None:
+            return
+
+        if query:
+            self.filters[qid] = query
+        else:
+            self.filters.pop(qid, None)
+        self.update_border_subtitle(qid)
+        matches = index.search(query)
+
+        if isinstance(wid, SelectionList_):
+            self.filter_selection_list(qid, wid, matches)
+        elif isinstance(wid, Select_):
+            self.filter_select(qid, wid, matches)
+        elif isinstance(wid, RadioSet_):
+            self.filter_radio_set(qid, wid, matches)
+
+        # The matches may not fill the widget, the next pages are searched too
+        self.call_after_refresh(self.check_options, qid)
+
+    def filter_selection_list(self, qid: int, wid: SelectionList_, matches: list[int]) -> None:
+        question = self.questions[qid]
+        assert isinstance(question, SelectionList)
+
+        options = [question.options[i] for i in matches]
+        selected = self.hidden_selections.get(qid, set()) | set(wid.selected)
+        self.hidden_selections[qid] = selected.difference(x[1] for x in options)
+
+        # Clearing the options deselects them, the selection is given back with the options
+        wid.clear_options()
+        wid.add_options([(label, value, value in selected) for label, value, _ in options])
+
+    def filter_select(self, qid: int, wid: Select_, matches: list[int]) -> None:
+        question = self.questions[qid]
+        assert isinstance(question, Select)
+
+        options = [question.options[i] for i in matches]
+        value = wid.value
+        if not isinstance(value, NoSelection) and all(x[1] != value for x in options):
+            # The selected option stays available, so filtering doesn't change the answer
+            options.insert(0, next(x for x in question.options if x[1] == value))
+        if not options:
+            return
+
+        # Setting the options resets the selection
+        wid.set_options(options)
+        if not isinstance(value, NoSelection):
+            wid.value = value
+        wid.expanded = True
+
+    def filter_radio_set(self, qid: int, wid: RadioSet_, matches: list[int]) -> None:
+        buttons = self.get_radio_buttons(qid, wid)
+        visible = set(matches)
+        previous = self.visible_options.get(qid)
+        changed = (
+            range(len(buttons)) if previous is None else previous.symmetric_difference(visible)
+        )
+        self.visible_options[qid] = visible
+
+        # Only the buttons entering or leaving the filter are updated
+        for i in changed:
+            button = buttons[i]
+            button.display = i in visible
+            button.disabled = i not in visible
+
+    # -------------------- Checkpoint
+    # Registered answers are recorded in the checkpoint, which is saved in the background
+    # once per navigation or stage completion. When resuming, the widgets are prefilled with
+    # the saved answers and the first unanswered question is shown.
+
+    checkpoint: Optional[Checkpoint] = None
+    resume: bool = False
+
+    resume_index: int = 0
+    """Index of the first question without a valid saved answer, when resuming"""
+
+    def save_checkpoint(self) -> None:
+        if self.checkpoint is not None:
+            self.checkpoint.save()
+
+    def restore_checkpoint(self, checkpoint: Checkpoint) -> None:
+        """
+        Prefill the widgets with the saved answers, before the questions are composed.
+        Conditions are evaluated along the way, since they depend on the restored answers.
+        """
+        self.resume_index = len(self.questions)
+        for qid, question in enumerate(self.questions):
+            self.evaluate_conditions(qid)
+            if qid in self.skipped:
+                continue
+
+            restored, answer = checkpoint.restore(question)
+            if not restored:
+                self.resume_index = min(self.resume_index, qid)
+            else:
+                self.widget_values[qid] = self.get_raw_value(qid, answer)
+            self.update_conditions(qid)
+
+        if not self.single_page:
+            # Every question answered, the user reviews the last one
+            self.question_index = min(self.resume_index, len(self.questions) - 1)
+
+    def resume_at_unanswered(self) -> None:
+        """Register the answers of the questions skipped when resuming, and show the next one"""
+        if not self.single_page:
+            for qid in range(self.question_index):
+                self.register_input(qid)
+            self.active_input.focus()
+            return
+
+        if self.resume_index >= len(self.questions):
+            return
+        if self.lazy_mount:
+            # The question is mounted once it is scrolled into view
+            self.scroll_view.scroll_to(y=self.offsets[self.resume_index], animate=False)
+
+        def focus_unanswered() -> None:
+            wid = self.input_widgets[self.resume_index]
+            if wid is not None:
+                wid.focus()
+                wid.scroll_visible(animate=False)
+
+        self.call_after_refresh(focus_unanswered)
+
+    # -------------------- Conditions
+    # Questions whose condition doesn't hold are skipped: they are not mounted, not validated,
+    # and their answer is None. Conditions and computed defaults are evaluated in order while
+    # the stage is composed. Then, when an answer read by other questions changes,
+    # only those are evaluated again, and the app forwards the changes to the other stages.
+
+    conditions: Optional[ConditionGraph] = None
+
+    skipped: set[int]
+    """Indexes of the questions whose condition doesn't hold"""
+
+    question_indexes: dict[str, int]
+    """Index of each question of the stage, by name"""
+
+    applied_defaults: dict[int, object]
+    """Raw value of the computed default last given to each widget, see get_widget_value"""
+
+    def evaluate_conditions(self, qid: int) -> None:
+        """Evaluate the condition and the computed default of a question, before it is composed"""
+        conditions = self.conditions
+        if conditions is None:
+            return
+
+        name = self.questions[qid].name
+        conditions.evaluate(name)
+        if conditions.is_skipped(name):
+            self.skipped.add(qid)
+            return
+        self.apply_default(qid)
+        self.update_conditions(qid)
+
+    def update_conditions(self, qid: int, valid: Optional[bool] = None) -> None:
+        """
+        Evaluate the questions depending on the answer of a question, after it changed.
+        `valid` is the result of the validation of a text answer, None if it wasn't validated.
+        """
+        conditions = self.conditions
+        name = self.questions[qid].name
+        if conditions is None or not conditions.has_dependents(name) or qid in self.skipped:
+            return
+
+        with self.timed("conditions", qid):
+            changed = conditions.update(name, self.get_current_answer(qid, valid))
+        if not changed:
+            return
+        # While the stage is composed, its questions are evaluated in order
+        if self.is_mounted:
+            self.apply_conditions(changed)
+        self.post_message(self.ConditionsChanged(self, changed))
+
+    def apply_conditions(self, changed: Sequence[str]) -> None:
+        """Show or hide the questions whose condition changed, and update their default"""
+        if self.conditions is None:
+            return
+
+        updated: list[int] = list()
+        visibility_changed = False
+        for name in changed:
+            qid = self.question_indexes.get(name)
+            if qid is None:
+                # The question is part of another stage
+                continue
+            skipped = self.conditions.is_skipped(name)
+            if skipped != (qid in self.skipped):
+                visibility_changed = True
+                if skipped:
+                    self.skip_input(qid)
+                    continue
+                self.skipped.discard(qid)
+            if not skipped:
+                self.apply_default(qid)
+                updated.append(qid)
+
+        if visibility_changed:
+            self.update_offsets()
+            if self.lazy_mount:
+                self.window = self.get_window()
+            self.sync_mounted_inputs()
+            if not self.single_page and self.question_index in self.skipped:
+                self.leave_skipped_question()
+        # The answers of the questions shown or updated may be read by the next ones
+        for qid in updated:
+            self.update_conditions(qid)
+
+    def skip_input(self, qid: int) -> None:
+        """Skip a question whose condition no longer holds, its widget is unmounted"""
+        self.skipped.add(qid)
+        self.cancel_validation(qid)
+        self.cancel_async_validation(qid)
+        self.set_error(None, qid)
+        self.answers[self.questions[qid].name] = None
+
+    def find_closest_visible(self, qid: int) -> int:
+        """Return the index of the question closest to the provided one which is not skipped"""
+        closest = self.find_visible(qid, 1)
+        if closest >= len(self.questions):
+            closest = self.find_visible(qid, -1)
+        # Stages whose questions are all skipped are never shown
+        return qid if closest < 0 else closest
+
+    def leave_skipped_question(self) -> None:
+        """Show the closest question when the current one is skipped, in paged mode"""
+        qid = self.find_closest_visible(self.question_index)
+        if qid == self.question_index:
+            return
+
+        self.question_index = qid
+        if self.lazy_mount:
+            self.update_mounted_inputs()
+        self.active_input.remove_class("hidden")
+        self.update_back_button()
+
+    def apply_default(self, qid: int) -> None:
+        """Give its computed default to the widget of a question, unless the user changed it"""
+        if self.conditions is None:
+            return
+        default = self.conditions.get_default(self.questions[qid].name)
+        if default is MISSING:
+            return
+
+        wid = self.input_widgets[qid]
+        previous = self.applied_defaults.get(qid, MISSING)
+        if previous is not MISSING:
+            if wid is None:
+                current = self.widget_values.get(qid, previous)
+            else:
+                current = self.get_widget_value(qid)
+            if current != previous:
+                # The value was entered by the user, or restored from the checkpoint
+                return
+
+        value = self.get_raw_value(qid, default)
+        self.applied_defaults[qid] = value
+        if wid is None:
+            self.widget_values[qid] = value
+            return
+        self.set_widget_value(qid, value)
+        if isinstance(wid, RadioSet_) and isinstance(value, int):
+            self.pressed_options[qid] = value
+
+    def get_raw_value(self, qid: int, answer: object) -> object:
+        """Convert an answer to the raw value of the widget of its question"""
+        question = self.questions[qid]
+        if isinstance(question, BaseText):
+            return str(answer)
+        if isinstance(question, SelectionList):
+            selected = answer if isinstance(answer, (list, tuple, set)) else ()
+            return [x for x in question.options.values if x in selected]
+        if isinstance(question, RadioSet):
+            values = question.options.values
+            return values.index(answer) if answer in values else question.default_index
+        if isinstance(question, Select):
+            found, value = match_option(question.options, answer)
+            return value if found else question.default_value
+        return answer
+
+    def get_current_answer(self, qid: int, valid: Optional[bool] = None) -> object:
+        """
+        Return the answer of a question as the user edits it, MISSING while it isn't valid,
+        or while it is being validated. Text answers which weren't validated yet, like the
+        initial ones, are validated by their sync validators.
+        """
+        question = self.questions[qid]
+        if not isinstance(question, BaseText):
+            return self.read_answer(qid)
+
+        pending = qid in self.pending_values or qid in self.validation_timers
+        if valid is False or pending or qid in self.invalid_inputs:
+            return MISSING
+        wid = self.input_widgets[qid]
+        if isinstance(wid, Input):
+            text = wid.value
+        else:
+            text = str(self.widget_values.get(qid, question.initial_value))
+        if valid is None:
+            accepted = question.is_value_accepted(text).valid
+            if not accepted or question.get_async_result(text) is None:
+                return MISSING
+        return question.parse_result(text)
+
+    # -------------------- Instrumentation
+    # When instrumentation is enabled, the hot paths are timed, and the time the user spends
+    # on each question is measured from when it gets the focus until another one gets it.
+
+    instrumentation: Optional[Instrumentation] = None
+
+    focused_question: Optional[int] = None
+    """Index of the question the user is on, when instrumentation is enabled"""
+
+    focused_since: float = 0
+
+    def timed(self, event: str, qid: Optional[int] = None) -> AbstractContextManager[None]:
+        """Return a context manager recording the duration of an event, if enabled"""
+        if self.instrumentation is None:
+            return NO_TIMER
+        question = None
+        if qid is not None and 0 <= qid < len(self.questions):
+            question = self.questions[qid].name
+        return self.instrumentation.time(event, question, self.sub_title)
+
+    def on_descendant_focus(self, event: events.DescendantFocus) -> None:
+        if self.instrumentation is None:
+            return
+        # The focused widget may be part of the input widget, like the overlay of a Select
+        qid = None
+        for node in event.widget.ancestors_with_self:
+            if isinstance(node, Widget) and node in self.question_ids:
+                qid = self.question_ids[node]
+                break
+        # The buttons are part of the current question
+        if qid is None or qid == self.focused_question:
+            return
+        self.end_question_time()
+        self.focused_question = qid
+        self.focused_since = perf_counter()
+
+    def end_question_time(self) -> None:
+        """Record the time spent on the current question, when the user leaves the stage"""
+        if self.instrumentation is None or self.focused_question is None:
+            return
+        self.instrumentation.record(
+            "question_time",
+            perf_counter() - self.focused_since,
+            self.questions[self.focused_question].name,
+            self.sub_title,
+        )
+        self.focused_question = None
+
+    def on_screen_suspend(self) -> None:
+        self.end_question_time()
+
+    def on_unmount(self) -> None:
+        self.end_question_time()
+
+    # --------------------
+
+    def get_question_id(self, wid: Widget) -> int | None:
+        """Return the question id associated with an input widget"""
+        return self.question_ids.get(wid)
+
+    def on_radio_set_changed(self, message: RadioSet_.Changed) -> None:
+        qid = self.get_question_id(message.radio_set)
+        if qid is not None:
+            self.pressed_options[qid] = message.index
+            self.update_conditions(qid)
+
+    def on_select_changed(self, message: Select_.Changed) -> None:
+        qid = self.get_question_id(message.select)
+        if qid is not None:
+            self.update_conditions(qid)
+
+    def on_selection_list_selected_changed(self, message: SelectionList_.SelectedChanged) -> None:
+        qid = self.get_question_id(message.selection_list)
+        if qid is not None:
+            self.update_conditions(qid)
+
+    def compose_questions(self) -> ComposeResult:
+        for i, question in enumerate(self.questions):
+            # Check if the name is not already registered in answers
+            if question.name in self.answers:
+                raise QuestionNameNotUnique(
+                    "Questions name must be unique but multiple questions "
+                    f"named '{question.name}' were supplied."
+                )
+
+            # Initialize the answer as null
+            self.answers[question.name] = None
+
+            # Get a widget for the input, unless it is mounted later on
+            if self.is_in_window(i):
+                yield from self.create_input(i)
+
+    def compose(self) -> ComposeResult:
+        with self.timed("compose"):
+            yield from self.compose_stage()
+
+    def compose_stage(self) -> ComposeResult:
+        # We need to define class properties that are references here to
+        # avoid keeping previous objects when creating a new wizard.
+        self.answers = dict()
+        self.registered_inputs = set()
+        self.input_widgets = [None] * len(self.questions)
+        self.error_labels = [None] * len(self.questions)
+        self.error_texts = [None] * len(self.questions)
+        self.widget_values = dict()
+        self.question_ids = dict()
+        self.pressed_options = dict()
+        self.mounted_inputs = set()
+        self.skipped = set()
+        self.question_indexes = {x.name: i for i, x in enumerate(self.questions)}
+        self.applied_defaults = dict()
+        self.invalid_inputs = set()
+        self.validation_timers = dict()
+        self.pending_values = dict()
+        if self.resume and self.checkpoint is not None:
+            self.restore_checkpoint(self.checkpoint)
+        elif self.conditions is not None:
+            for qid in range(len(self.questions)):
+                self.evaluate_conditions(qid)
+        if self.skipped:
+            self.update_offsets()
+            if not self.single_page:
+                self.question_index = self.find_closest_visible(self.question_index)
+        self.back_button = Button("Back", id="back-button", variant="warning")
+        self.update_back_button()
+        self.next_button = Button("Next", id="next-button", variant="primary")
+        self.filters = dict()
+        self.hidden_selections = dict()
+        self.visible_options = dict()
+        self.radio_buttons = dict()
+        self.window = self.get_window()
+
+        yield Header()
+
+        with Container() as self.container:
+            yield Label(self.sub_title or "", id="label-step")
+            if self.lazy_mount and self.single_page:
+                with VerticalScroll(id="questions") as self.scroll_view:
+                    self.top_spacer = Static(classes="spacer")
+                    yield self.top_spacer
+                    yield from self.compose_questions()
+                    self.bottom_spacer = Static(classes="spacer")
+                    self.update_spacers()
+                    yield self.bottom_spacer
+            else:
+                yield from self.compose_questions()
+
+            with Horizontal(id="buttons") as self.buttons:
+                yield self.back_button
+                yield self.next_button
+
+
+class WizardApp(App[dict[str, Any] | None]):
+    """
+    The Textual application running a wizard.
+    Every stage is shown on its own `WizardScreen`, all hosted by this single app.
+    """
+
+    stages: Sequence[WizardStage]
+    """Stages supplied by the user"""
+
+    single_page: bool = False
+    """Show all the questions of a stage on a single page"""
+
+    lazy_mount: bool = False
+    """Only mount the widgets of the questions around the current (or visible) ones"""
+
+    lookahead: int = 1
+    """Number of questions kept mounted before and after the current (or visible) ones"""
+
+    validation_delay: float = 0
+    """Time to wait after the last change of a text input before validating it, in seconds"""
+
+    on_answer: Optional[AnswerCallback] = None
+    """Called with the name and the answer of each question, as soon as it is registered"""
+
+    checkpoint: Optional[Checkpoint] = None
+    """File where the registered answers are saved, so an interrupted wizard can be resumed"""
+
+    resume: bool = False
+    """Prefill the saved answers of the checkpoint, and start at the first unanswered question"""
+
+    restored_answers: dict[str, Any]
+    """Saved answers of the stages skipped when resuming"""
+
+    instrumentation: Optional[Instrumentation] = None
+    """Records the time spent in the hot paths and on each question, disabled if None"""
+
+    recorder: Optional[SessionRecorder] = None
+    """Records the keys, pastes and button clicks received, to replay them later"""
+
+    conditions: Optional[ConditionGraph] = None
+    """Conditions and computed defaults of the questions of all the stages, None if none"""
+
+    answer_tasks: list[asyncio.Task[Any]]
+    """Tasks running the async `on_answer` callbacks of all the stages"""
+
+    stage_screens: list[WizardScreen]
+    """Screens of the stages up to the current one, matching the index of items in self.stages"""
+
+    stage_index: int = -1
+    """Index of the current stage within self.stages"""
+
+    CSS_PATH = "wizard.tcss"
+
+    def set_stages(self, stages: Sequence[WizardStage]) -> None:
+        self.stages = stages
+        # Questions may depend on the answers of the previous stages
+        self.conditions = compile_conditions([x for stage in stages for x in stage["questions"]])
+
+    def set_questions(self, questions: Sequence[InputType]) -> None:
+        """Use a single stage containing the provided questions"""
+        self.set_stages([{"title": self.sub_title, "questions": questions}])
+
+    def get_stage_screen(self, stage_index: int) -> WizardScreen:
+        """Return the screen of the stage with provided index, creating it on first use"""
+        while len(self.stage_screens) <= stage_index:
+            i = len(self.stage_screens)
+            stage = self.stages[i]
+            screen = WizardScreen(
+                stage["questions"],
+                single_page=self.single_page,
+                allow_back=i > 0,
+                sub_title=stage["title"],
+                lazy_mount=self.lazy_mount,
+                lookahead=self.lookahead,
+                validation_delay=self.validation_delay,
+                on_answer=self.on_answer,
+                answer_tasks=self.answer_tasks,
+                checkpoint=self.checkpoint,
+                resume=self.resume,
+                instrumentation=self.instrumentation,
+                conditions=self.conditions,
+            )
+            # Installed screens are kept mounted when switching to another stage
+            self.install_screen(screen, f"stage-{i}")
+            self.stage_screens.append(screen)
+
+        return self.stage_screens[stage_index]
+
+    def goto_stage(self, stage_index: int) -> None:
+        """Show the stage with provided index"""
+        screen = self.get_stage_screen(stage_index)
+
+        if self.stage_index < 0:
+            self.push_screen(screen)
+        else:
+            self.switch_screen(screen)
+
+        self.stage_index = stage_index
+        self.call_after_refresh(self.prefetch_stage, stage_index + 1)
+
+    # -------------------- Prefetching
+    # While the user answers a stage, the widgets of the next one are built in the background,
+    # one widget per refresh so the current stage keeps responding.
+    # Moving to the next stage then only mounts the widgets.
+
+    def prefetch_stage(self, stage_index: int) -> None:
+        """
+        Start loading the first page of options and building the widgets of the stage with
+        provided index, if any
+        """
+        if stage_index >= len(self.stages):
+            return
+        screen = self.get_stage_screen(stage_index)
+        for qid, question in enumerate(screen.questions):
+            if not isinstance(question, OptionsInput) or question.options_complete:
+                continue
+            if len(question.options) == 0 and qid not in screen.loading_options:
+                screen.loading_options.add(qid)
+                self.run_worker(screen.prefetch_options(qid), group=f"options-{stage_index}")
+        self.prefetch_inputs(screen, iter(screen.get_initial_inputs()))
+
+    def prefetch_inputs(self, screen: WizardScreen, qids: Iterator[int]) -> None:
+        """Build the next widget of a stage screen, and schedule the following one"""
+        # Once the screen is shown, its remaining widgets are built by compose
+        if screen.is_mounted:
+            return
+
+        qid = next(qids, None)
+        if qid is None:
+            return
+
+        # The widgets of the questions loading their options are built with them by compose
+        if qid not in screen.loading_options:
+            screen.prepare_input(qid)
+        self.call_after_refresh(self.prefetch_inputs, screen, qids)
+
+    def on_mount(self) -> None:
+        self.answer_tasks = list()
+        self.stage_screens = list()
+        self.stage_index = -1
+        self.restored_answers = dict()
+        if self.recorder is not None:
+            self.recorder.restart((self.size.width, self.size.height))
+
+        if len(self.stages) == 0:
+            self.exit(dict())
+            return
+
+        stage_index = self.find_stage(self.get_resume_stage(), 1)
+        if stage_index >= len(self.stages):
+            self.exit(self.get_answers())
+            return
+        self.goto_stage(stage_index)
+
+    def get_resume_stage(self) -> int:
+        """
+        Return the index of the first stage having an unanswered question when resuming,
+        and keep the saved answers of the previous stages
+        """
+        if not self.resume or self.checkpoint is None:
+            return 0
+
+        conditions = self.conditions
+        for i, stage in enumerate(self.stages[:-1]):
+            answers = dict()
+            for question in stage["questions"]:
+                if conditions is not None:
+                    conditions.evaluate(question.name)
+                    if conditions.is_skipped(question.name):
+                        answers[question.name] = None
+                        continue
+                restored, answer = self.checkpoint.restore(question)
+                if not restored:
+                    return i
+                answers[question.name] = answer
+                if conditions is not None:
+                    conditions.update(question.name, answer)
+            self.restored_answers.update(answers)
+
+        # Every stage but the last one is answered
+        return len(self.stages) - 1
+
+    def is_stage_skipped(self, stage_index: int) -> bool:
+        """Whether or not all the questions of a stage are skipped"""
+        if self.conditions is None:
+            return False
+        for question in self.stages[stage_index]["questions"]:
+            self.conditions.evaluate(question.name)
+            if not self.conditions.is_skipped(question.name):
+                return False
+        return True
+
+    def find_stage(self, stage_index: int, step: int) -> int:
+        """
+        Return the index of the first stage having a question to ask, from the provided index
+        and moving by step. Return -1 or the number of stages if there is none.
+        """
+        while 0 <= stage_index < len(self.stages) and self.is_stage_skipped(stage_index):
+            stage_index += step
+        return stage_index
+
+    def get_answers(self) -> dict[str, Any]:
+        """Return the answers of all the stages, None for the skipped questions"""
+        answers: dict[str, Any] = {
+            x.name: None for stage in self.stages for x in stage["questions"]
+        }
+        answers.update(self.restored_answers)
+        for screen in self.stage_screens:
+            # Screens of the stages skipped when resuming were never shown
+            if screen.is_mounted:
+                answers.update(screen.answers)
+        return answers
+
+    def on_wizard_screen_completed(self, _: WizardScreen.Completed) -> None:
+        stage_index = self.find_stage(self.stage_index + 1, 1)
+        if stage_index < len(self.stages):
+            self.goto_stage(stage_index)
+            return
+
+        # Return the answers of all the stages when the last one is completed
+        self.exit(self.get_answers())
+
+    def on_wizard_screen_conditions_changed(self, message: WizardScreen.ConditionsChanged) -> None:
+        # The screen whose answer changed already applied the changes
+        for screen in self.stage_screens:
+            if screen is not message.wizard_screen and screen.is_mounted:
+                screen.apply_conditions(message.changed)
+
+    def on_unmount(self) -> None:
+        if self.instrumentation is not None:
+            self.instrumentation.close()
+
+    async def on_event(self, event: events.Event) -> None:
+        if self.recorder is not None and not event.is_forwarded:
+            self.record_event(self.recorder, event)
+        await super().on_event(event)
+
+    def record_event(self, recorder: SessionRecorder, event: events.Event) -> None:
+        """Record the events replayed by `textual_wizard.session.replay_session`"""
+        if isinstance(event, events.Key):
+            recorder.record("key", event.key)
+        elif isinstance(event, events.Paste):
+            recorder.record("paste", event.text)
+        elif isinstance(event, events.MouseUp):
+            # Only clicks on buttons are recorded, by id, so they don't depend on the layout
+            try:
+                widget, _ = self.get_widget_at(*event.screen_offset)
+            except NoWidget:
+                return
+            if not isinstance(widget, Button) or widget.id is None or widget.disabled:
+                return
+            # Buttons ignore clicks while they are animated
+            if not widget.has_class("-active"):
+                recorder.record("click", widget.id)
+
+    def on_wizard_screen_back_requested(self, _: WizardScreen.BackRequested) -> None:
+        stage_index = self.find_stage(self.stage_index - 1, -1)
+        if stage_index >= 0:
+            self.goto_stage(stage_index)
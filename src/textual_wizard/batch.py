@@ -0,0 +1,193 @@
+import pickle
+from functools import partial
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+from textual_wizard.conditions import MISSING, ConditionGraph, compile_conditions
+from textual_wizard.exceptions import QuestionNameNotUnique
+from textual_wizard.inputs import InputType, ValidationResult
+
+# Validation of answers without any user interface, for example to validate answers
+# exported to CSV or JSON files using the questions of a wizard.
+# Answers are validated column by column: each distinct value of a column is only validated once.
+# Likewise, conditions and computed defaults are evaluated once per distinct set of the answers
+# they read. Questions whose condition doesn't hold are skipped, and their answer is None.
+
+Record = Mapping[str, object]
+
+
+class RecordReport:
+    """The validation report of a single record."""
+
+    index: int
+    """Index of the record within the supplied records"""
+
+    answers: dict[str, Any]
+    """Parsed answers, by question name. Invalid answers are None"""
+
+    errors: dict[str, str]
+    """Failure reasons of the invalid answers, by question name"""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.answers = dict()
+        self.errors = dict()
+
+    @property
+    def valid(self) -> bool:
+        return len(self.errors) == 0
+
+
+def validate_column(
+    question: InputType, values: Sequence[object]
+) -> list[tuple[ValidationResult, Any]]:
+    """Validate all the answers to a question, validating identical answers only once"""
+    # Equal values of different types, like 1, 1.0 and True, are converted to different strings
+    known: dict[tuple[type, object], tuple[ValidationResult, Any]] = dict()
+    results = list()
+
+    for value in values:
+        key = (type(value), value)
+        try:
+            result = known.get(key)
+        except TypeError:
+            # Unhashable values, like lists, are always validated
+            results.append(question.validate_answer(value))
+            continue
+
+        if result is None:
+            result = known[key] = question.validate_answer(value)
+        results.append(result)
+
+    return results
+
+
+def evaluate_column(
+    conditions: ConditionGraph, question: InputType, reports: Sequence[RecordReport]
+) -> list[tuple[bool, object]]:
+    """
+    Return whether or not a question is skipped for each record, and its computed default,
+    MISSING if it has none. The functions of the question are not called for the records
+    where an answer they read is invalid, like in the wizard.
+    """
+    functions = [x for x in (question.when, question.compute_default) if x is not None]
+    names = list(dict.fromkeys(x for f in functions for x in conditions.parameters[f]))
+    known: dict[tuple[object, ...], tuple[bool, object]] = dict()
+    results: list[tuple[bool, object]] = list()
+
+    for report in reports:
+        if any(x in report.errors for x in names):
+            results.append((False, MISSING))
+            continue
+
+        answers = {x: report.answers[x] for x in names}
+        key = tuple((type(x), x) for x in answers.values())
+        try:
+            result = known.get(key)
+        except TypeError:
+            # Unhashable answers, like lists, are always evaluated
+            result = None
+            key = None
+        if result is None:
+            conditions.answers = answers
+            skipped = question.when is not None and not conditions.call(question.when)
+            default = MISSING
+            if not skipped and question.compute_default is not None:
+                default = conditions.call(question.compute_default)
+            result = (skipped, default)
+            if key is not None:
+                known[key] = result
+        results.append(result)
+
+    return results
+
+
+def validate_records(
+    questions: Sequence[InputType], records: Sequence[Record], start: int = 0
+) -> list[RecordReport]:
+    """
+    Validate records in the current process.
+
+    Args:
+        questions: The questions the records answer.
+        records: The records to validate.
+        start: Index of the first record, used in the reports.
+    """
+    reports = [RecordReport(start + i) for i in range(len(records))]
+    conditions = compile_conditions(questions)
+
+    for question in questions:
+        column = [record.get(question.name) for record in records]
+        asked = reports
+        conditional = question.when is not None or question.compute_default is not None
+        if conditions is not None and conditional:
+            asked = list()
+            values = list()
+            evaluated = evaluate_column(conditions, question, reports)
+            for report, value, (skipped, default) in zip(reports, column, evaluated):
+                if skipped:
+                    report.answers[question.name] = None
+                    continue
+                asked.append(report)
+                values.append(default if value is None and default is not MISSING else value)
+            column = values
+
+        for report, (result, answer) in zip(asked, validate_column(question, column)):
+            report.answers[question.name] = answer
+            if not result.valid:
+                report.errors[question.name] = result.failure_reason
+
+    return reports
+
+
+def can_pickle_functions(questions: Sequence[InputType]) -> bool:
+    """Whether or not the conditions and computed defaults can be sent to other processes"""
+    try:
+        pickle.dumps([(x.when, x.compute_default) for x in questions])
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+def validate_many(
+    questions: Sequence[InputType],
+    records: Iterable[Record],
+    *,
+    processes: Optional[int] = None,
+    chunk_size: int = 10000,
+) -> list[RecordReport]:
+    """
+    Validate and parse many records at once, without any user interface.
+    Return a report for each record, in the same order.
+
+    Args:
+        questions: The questions the records answer.
+        records: Mappings of question names to answers. Missing answers use the computed
+            default of the question, its default value, or its initial value for text-based
+            questions. Questions whose condition doesn't hold are skipped, their answer is None.
+        processes: Number of processes used to validate the records,
+            None to validate them in the current process. Conditions and computed defaults
+            must be picklable, like functions defined at the top level of a module:
+            lambdas are not, and the records are then validated in the current process.
+        chunk_size: Number of records validated at once by each process.
+    """
+    names = set()
+    for question in questions:
+        if question.name in names:
+            raise QuestionNameNotUnique(
+                "Questions name must be unique but multiple questions "
+                f"named '{question.name}' were supplied."
+            )
+        names.add(question.name)
+
+    records = list(records)
+    if processes is None or len(records) <= chunk_size or not can_pickle_functions(questions):
+        return validate_records(questions, records)
+
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    starts = range(0, len(records), chunk_size)
+    chunks = [records[x : x + chunk_size] for x in starts]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        results = pool.map(partial(validate_records, questions), chunks, starts)
+
+    return [report for reports in results for report in reports]
@@ -0,0 +1,318 @@
+import json
+import platform
+import sys
+from collections import defaultdict
+from datetime import datetime, timezone
+from importlib.metadata import version
+from math import ceil
+from pathlib import Path
+from statistics import fmean, median
+from time import perf_counter
+from typing import Any, Literal, Sequence, TypedDict
+
+from textual.app import ComposeResult
+from textual.widgets import Input
+
+from textual_wizard import __version__
+from textual_wizard.app import WizardApp, WizardScreen
+from textual_wizard.inputs import BaseText
+from textual_wizard.synthetic import (
+    InputKind,
+    synthetic_stages,
+)
+
+# Headless benchmarks of the TUI, running synthetic wizards with Textual's Pilot.
+# Results are written to JSON files, so the timings of two versions can be compared.
+
+RESULTS_FORMAT = 1
+"""Version of the layout of the result files"""
+
+
+class BenchmarkCase(TypedDict):
+    """Shape of a synthetic wizard and the mode it runs in"""
+
+    kind: InputKind | list[InputKind]
+    question_count: int
+    """Number of questions of each stage"""
+
+    option_count: int
+    stage_count: int
+    single_page: bool
+    lazy_mount: bool
+
+
+def make_case(
+    kind: InputKind | list[InputKind] = "mixed",
+    question_count: int = 10,
+    option_count: int = 10,
+    *,
+    stage_count: int = 2,
+    single_page: bool = False,
+    lazy_mount: bool = False,
+) -> BenchmarkCase:
+    return {
+        "kind": kind,
+        "question_count": question_count,
+        "option_count": option_count,
+        "stage_count": stage_count,
+        "single_page": single_page,
+        "lazy_mount": lazy_mount,
+    }
+
+
+DEFAULT_CASES: list[BenchmarkCase] = [
+    *(make_case("text", n) for n in (10, 100, 500)),
+    *(make_case("text", n, single_page=True) for n in (10, 100, 500)),
+    make_case("text", 500, single_page=True, lazy_mount=True),
+    make_case("text", 500, lazy_mount=True),
+    *(make_case(kind, 10, n) for kind in ("select", "selection_list") for n in (10, 1000, 10000)),
+    *(make_case("radio_set", 10, n) for n in (10, 100)),
+    make_case("mixed", 100, 100),
+    make_case("mixed", 100, 100, single_page=True),
+]
+"""Cases run by default, varying the number of questions and options, and the input types"""
+
+
+class TimedScreen(WizardScreen):
+    """A stage screen measuring the time spent composing its widgets"""
+
+    compose_time: float = 0
+
+    def compose(self) -> ComposeResult:
+        start = perf_counter()
+        yield from super().compose()
+        self.compose_time = perf_counter() - start
+
+
+def summarize(samples: Sequence[float]) -> dict[str, float]:
+    """Return the statistics of durations, in seconds. Percentiles use the nearest rank"""
+    ordered = sorted(samples)
+
+    def percentile(p: float) -> float:
+        return ordered[max(ceil(p * len(ordered)) - 1, 0)]
+
+    return {
+        "count": len(ordered),
+        "mean": fmean(ordered),
+        "min": ordered[0],
+        "median": median(ordered),
+        "p95": percentile(0.95),
+        "p99": percentile(0.99),
+        "max": ordered[-1],
+    }
+
+
+def create_app(case: BenchmarkCase) -> WizardApp:
+    app = WizardApp()
+    app.single_page = case["single_page"]
+    app.lazy_mount = case["lazy_mount"]
+    app.set_stages(
+        synthetic_stages(
+            case["stage_count"], case["question_count"], case["kind"], case["option_count"]
+        )
+    )
+    return app
+
+
+async def measure_case(
+    case: BenchmarkCase, keystrokes: int = 50, transitions: int = 20
+) -> dict[str, list[float]]:
+    """
+    Run a synthetic wizard once and return the durations measured, in seconds, by metric:
+
+    - `first_paint`: From the start of the app until its first stage is displayed.
+    - `compose`, `mount`: Composing the widgets of a stage, and mounting them.
+    - `keystroke`: Handling a key pressed on the first question, until the screen is refreshed.
+    - `input_changed`: Handling the change of a text input, without the Textual event loop.
+    - `goto`: Moving to the next question in paged mode, until the screen is refreshed.
+    - `stage_switch`: Moving to another stage, until the screen is refreshed.
+      The first switch to a stage includes composing it.
+    """
+    samples: dict[str, list[float]] = defaultdict(list)
+    app = create_app(case)
+    stage = app.stages[0]
+
+    start = perf_counter()
+    async with app.run_test(size=(100, 40)) as pilot:
+        await pilot.pause()
+        samples["first_paint"].append(perf_counter() - start)
+        screen = app.screen
+        assert isinstance(screen, WizardScreen)
+
+        timed = TimedScreen(
+            stage["questions"], single_page=case["single_page"], lazy_mount=case["lazy_mount"]
+        )
+        start = perf_counter()
+        await app.push_screen(timed)
+        samples["mount"].append(perf_counter() - start - timed.compose_time)
+        samples["compose"].append(timed.compose_time)
+        await app.pop_screen()
+        await pilot.pause()
+
+        # Typing a query, then erasing it, so the first question keeps its default answer
+        query = "Option 12"
+        keys = (list(query) + ["backspace"] * len(query)) * ceil(keystrokes / len(query) / 2)
+        for key in keys[:keystrokes]:
+            start = perf_counter()
+            await pilot.press(key)
+            samples["keystroke"].append(perf_counter() - start)
+
+        if isinstance(stage["questions"][0], BaseText):
+            wid = screen.query_one("#input-0", Input)
+            for i in range(keystrokes):
+                message = Input.Changed(wid, query[: i % len(query) + 1])
+                start = perf_counter()
+                screen.on_input_changed(message)
+                samples["input_changed"].append(perf_counter() - start)
+            wid.value = ""
+            await pilot.pause()
+
+        if not case["single_page"]:
+            for qid in range(1, min(transitions, len(stage["questions"]) - 1) + 1):
+                start = perf_counter()
+                screen.goto(qid)
+                await pilot.pause()
+                samples["goto"].append(perf_counter() - start)
+
+        for i in range(1, transitions + 1 if case["stage_count"] > 1 else 0):
+            start = perf_counter()
+            app.goto_stage(i % 2)
+            await pilot.pause()
+            samples["stage_switch"].append(perf_counter() - start)
+
+    return samples
+
+
+async def run_case(
+    case: BenchmarkCase, repeat: int = 3, keystrokes: int = 50, transitions: int = 20
+) -> dict[str, dict[str, float]]:
+    """Run a case `repeat` times, and return the statistics of each metric"""
+    samples: dict[str, list[float]] = defaultdict(list)
+    for _ in range(repeat):
+        for metric, durations in (await measure_case(case, keystrokes, transitions)).items():
+            samples[metric] += durations
+    return {metric: summarize(durations) for metric, durations in samples.items()}
+
+
+async def run_benchmarks(
+    cases: Sequence[BenchmarkCase] = DEFAULT_CASES,
+    *,
+    repeat: int = 3,
+    keystrokes: int = 50,
+    transitions: int = 20,
+) -> dict[str, Any]:
+    """
+    Run the cases one after the other, and return the results along with
+    the versions of the library, Textual and Python, which can be written with `write_results`.
+    """
+    results = list()
+    for case in cases:
+        metrics = await run_case(case, repeat, keystrokes, transitions)
+        results.append({"case": case, "metrics": metrics})
+
+    return {
+        "format": RESULTS_FORMAT,
+        "version": __version__,
+        "textual": version("textual"),
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "results": results,
+    }
+
+
+def write_results(results: dict[str, Any], path: str | Path) -> None:
+    Path(path).write_text(json.dumps(results, indent=2) + "\n")
+
+
+def read_results(path: str | Path) -> dict[str, Any]:
+    return json.loads(Path(path).read_text())
+
+
+def compare_results(
+    baseline: dict[str, Any], current: dict[str, Any], *, tolerance: float = 0.25
+) -> list[str]:
+    """
+    Return a description of each metric whose median got slower than in the baseline
+    by more than `tolerance`, a fraction of the baseline. Cases missing from either side
+    are ignored.
+    """
+    before = {json.dumps(x["case"], sort_keys=True): x["metrics"] for x in baseline["results"]}
+    regressions = list()
+    for result in current["results"]:
+        key = json.dumps(result["case"], sort_keys=True)
+        for metric, stats in result["metrics"].items():
+            reference = before.get(key, {}).get(metric)
+            if reference is None:
+                continue
+            if stats["median"] > reference["median"] * (1 + tolerance):
+                ratio = stats["median"] / reference["median"]
+                regressions.append(f"{key} {metric}: {ratio:.2f}x slower")
+    return regressions
+
+
+# -------------------- Profiling
+# Scaling problems are reproduced by answering a large wizard headlessly with a profiler attached.
+
+Profiler = Literal["cprofile", "sampling"]
+
+
+async def run_session(
+    app: WizardApp, keys: Sequence[str] = ("o", "backspace")
+) -> dict[str, Any] | None:
+    """
+    Answer every stage of a wizard headlessly, keeping the default answers, and return them.
+    The keys are pressed on each question in paged mode, on the first one in single page mode.
+    """
+    async with app.run_test(size=(100, 40)) as pilot:
+        for _ in app.stages:
+            await pilot.pause()
+            screen = app.screen
+            assert isinstance(screen, WizardScreen)
+            if screen.single_page:
+                await pilot.press(*keys)
+                screen.next_button_pressed()
+                continue
+
+            for _ in screen.questions:
+                await pilot.press(*keys)
+                screen.next_question()
+                await pilot.pause()
+        await pilot.pause()
+    return app.return_value
+
+
+def profile_session(
+    app: WizardApp, path: str | Path, profiler: Profiler = "cprofile"
+) -> dict[str, Any] | None:
+    """
+    Run `run_session` with a profiler attached, and write the profile to a file.
+
+    Args:
+        app: The wizard to answer.
+        path: The file receiving the profile. cProfile writes pstats data, readable by
+            `python -m pstats` or snakeviz. The sampling profiler writes an HTML report if the
+            path ends with `.html`, and a text report otherwise.
+        profiler: "cprofile", or "sampling" which uses pyinstrument and has a lower overhead.
+    """
+    import asyncio  # noqa: PLC0415
+
+    if profiler == "cprofile":
+        import cProfile  # noqa: PLC0415
+
+        with cProfile.Profile() as profile:
+            answers = asyncio.run(run_session(app))
+        profile.dump_stats(path)
+        return answers
+
+    try:
+        from pyinstrument import Profiler as SamplingProfiler  # noqa: PLC0415  # type: ignore
+    except ImportError as e:
+        raise ImportError("pyinstrument must be installed to use the sampling profiler.") from e
+
+    sampler = SamplingProfiler()
+    with sampler:
+        answers = asyncio.run(run_session(app))
+    report = sampler.output_html() if Path(path).suffix == ".html" else sampler.output_text()
+    Path(path).write_text(report)
+    return answers
@@ -0,0 +1,140 @@
+import json
+import os
+import threading
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Optional
+
+from textual_wizard.inputs import (
+    BaseText,
+    InputType,
+    RadioSet,
+    Select,
+    SelectionList,
+    match_option,
+)
+from textual_wizard.sources import DictSource
+
+# Answers are checkpointed to a file while the wizard runs, so a wizard interrupted by a crash
+# or a closed terminal can be resumed. The file is replaced atomically by a background thread:
+# answers registered while a write is in progress are written together by the next one.
+
+
+class Checkpoint:
+    """
+    A file keeping the answers given so far, in JSON.
+
+    Answers that can't be represented in JSON are saved as strings, and matched again
+    with the options or the validators of their question when the wizard is resumed.
+    """
+
+    path: Path
+    answers: dict[str, Any]
+    """Answers recorded or read from the file, by question name"""
+
+    lock: threading.Lock
+    dirty: bool = False
+    """Whether or not answers were recorded since the last write started"""
+
+    writer: Optional[threading.Thread] = None
+    """Thread writing the file, None when no write is in progress"""
+
+    def __init__(self, path: str | Path, *, resume: bool = False) -> None:
+        """
+        Initializes an instance of this class.
+
+        Args:
+            path: The path of the checkpoint file.
+            resume: Read the answers of an existing checkpoint file, instead of starting over.
+        """
+        self.path = Path(path).expanduser()
+        self.answers = dict()
+        self.lock = threading.Lock()
+        if resume:
+            self.answers = self.read()
+
+    def read(self) -> dict[str, Any]:
+        """Return the answers saved in the file, none if it is missing or unreadable"""
+        try:
+            content = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return dict()
+        answers = content.get("answers") if isinstance(content, dict) else None
+        return answers if isinstance(answers, dict) else dict()
+
+    def record(self, name: str, answer: object) -> None:
+        """Record an answer, written by the next call to `save`"""
+        with self.lock:
+            self.answers[name] = answer
+            self.dirty = True
+
+    def save(self) -> None:
+        """Write the recorded answers in the background, unless a write is already pending"""
+        with self.lock:
+            if not self.dirty or self.writer is not None:
+                # The running writer writes the latest answers once it is done
+                return
+            self.writer = threading.Thread(target=self.write_pending, daemon=True)
+            self.writer.start()
+
+    def write_pending(self) -> None:
+        while True:
+            with self.lock:
+                if not self.dirty:
+                    self.writer = None
+                    return
+                self.dirty = False
+                content = json.dumps({"answers": self.answers}, default=str)
+            # The wizard keeps working without a checkpoint, like with a read-only cache
+            with suppress(OSError):
+                self.write(content)
+
+    def write(self, content: str) -> None:
+        """Replace the file atomically, so it always contains a complete checkpoint"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        with temporary.open("w") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.path)
+
+    def flush(self) -> None:
+        """Wait for the recorded answers to be written"""
+        self.save()
+        writer = self.writer
+        if writer is not None:
+            writer.join()
+
+    def clear(self) -> None:
+        """Wait for the pending writes, then remove the file, once the wizard is completed"""
+        self.flush()
+        self.path.unlink(missing_ok=True)
+
+    def as_source(self) -> DictSource:
+        """Return the saved answers as an answer source, used to resume without the TUI"""
+        return DictSource(self.answers)
+
+    def restore(self, question: InputType) -> tuple[bool, Any]:
+        """
+        Return whether or not the question has a saved answer which is still valid,
+        and the parsed answer. Only the loaded options and the synchronous validators are used,
+        so answers can be restored while the TUI is running.
+        """
+        saved = self.answers.get(question.name)
+        if saved is None:
+            return False, None
+
+        if isinstance(question, BaseText):
+            text = str(saved)
+            if not question.is_value_accepted(text).valid:
+                return False, None
+            return True, question.parse_result(text)
+        if isinstance(question, SelectionList):
+            if not isinstance(saved, list):
+                return False, None
+            selected = [match_option(question.options, x) for x in saved]
+            return all(found for found, _ in selected), [value for _, value in selected]
+        if isinstance(question, (Select, RadioSet)):
+            return match_option(question.options, saved)
+        return False, None
@@ -0,0 +1,187 @@
+import inspect
+from heapq import heappop, heappush
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
+
+from textual_wizard.exceptions import InvalidCondition
+
+if TYPE_CHECKING:
+    from textual_wizard.inputs import InputType
+
+# A question can be asked only when a condition on the previous answers holds (`when`),
+# and its default answer can be computed from them (`compute_default`). The answers read by
+# these functions are the ones named by their parameters, so the functions are compiled into
+# a graph from each question to the questions reading its answer. When an answer changes,
+# only those questions are evaluated again, in order, and so on for the ones whose
+# visibility changed, since the answer of a skipped question is None.
+
+AnswerFunction = Callable[..., Any]
+"""A function receiving the answers of previous questions, as arguments named after them"""
+
+MISSING = object()
+"""
+Computed default of the questions that have none, or whose default isn't known yet,
+and answer of the questions whose answer isn't known yet
+"""
+
+
+def get_parameters(function: AnswerFunction, question: str) -> tuple[str, ...]:
+    """Return the names of the questions whose answers are read by a function"""
+    try:
+        parameters = inspect.signature(function).parameters.values()
+    except (TypeError, ValueError) as e:
+        raise InvalidCondition(f"The question '{question}' has an invalid condition: {e}") from e
+    for parameter in parameters:
+        if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+            raise InvalidCondition(
+                f"The conditions of the question '{question}' must name the answers they read."
+            )
+    return tuple(x.name for x in parameters)
+
+
+class ConditionGraph:
+    """
+    The conditions and computed defaults of the questions of a wizard, compiled into
+    a dependency graph, along with the current answers they read.
+    """
+
+    questions: Sequence["InputType"]
+    """Questions of all the stages, in order"""
+
+    positions: dict[str, int]
+    """Index of each question, by name"""
+
+    parameters: dict[AnswerFunction, tuple[str, ...]]
+    """Names of the answers read by each function"""
+
+    dependents: dict[str, list[int]]
+    """Indexes of the questions whose functions read an answer, by question name"""
+
+    answers: dict[str, Any]
+    """Current answers read by the functions, None for the skipped questions"""
+
+    skipped: set[str]
+    """Names of the questions whose condition doesn't hold"""
+
+    defaults: dict[str, Any]
+    """Current computed default of each question having one"""
+
+    def __init__(self, questions: Sequence["InputType"]) -> None:
+        """
+        Compile the functions of the questions.
+        An `InvalidCondition` exception is raised if they read the answer of a question
+        which isn't asked before.
+
+        Args:
+            questions: The questions of all the stages, in order.
+        """
+        self.questions = questions
+        self.positions = dict()
+        self.parameters = dict()
+        self.dependents = dict()
+        self.answers = dict()
+        self.skipped = set()
+        self.defaults = dict()
+
+        for qid, question in enumerate(questions):
+            self.positions[question.name] = qid
+            for function in (question.when, question.compute_default):
+                if function is None:
+                    continue
+                names = get_parameters(function, question.name)
+                for name in names:
+                    if self.positions.get(name, qid) >= qid:
+                        raise InvalidCondition(
+                            f"The question '{question.name}' depends on '{name}', "
+                            "which must be a previous question."
+                        )
+                    dependents = self.dependents.setdefault(name, list())
+                    if not dependents or dependents[-1] != qid:
+                        dependents.append(qid)
+                self.parameters[function] = names
+
+    def has_dependents(self, name: str) -> bool:
+        """Whether or not the answer of a question is read by the functions of others"""
+        return name in self.dependents
+
+    def is_skipped(self, name: str) -> bool:
+        return name in self.skipped
+
+    def get_default(self, name: str) -> object:
+        """Return the computed default of a question, MISSING if it has none"""
+        return self.defaults.get(name, MISSING)
+
+    def call(self, function: AnswerFunction) -> object:
+        return function(**{x: self.answers[x] for x in self.parameters[function]})
+
+    def evaluate(self, name: str) -> bool:
+        """
+        Evaluate the condition and the computed default of a question from the current answers.
+        Return True if its visibility or its default changed. Questions are only evaluated
+        once all the answers they read are known.
+        """
+        question = self.questions[self.positions[name]]
+        functions = [x for x in (question.when, question.compute_default) if x is not None]
+        if any(x not in self.answers for f in functions for x in self.parameters[f]):
+            return False
+
+        changed = False
+        skipped = question.when is not None and not self.call(question.when)
+        if skipped != (name in self.skipped):
+            changed = True
+            if skipped:
+                self.skipped.add(name)
+                self.answers[name] = None
+            else:
+                self.skipped.discard(name)
+                # The answer is given again by the wizard, once the question is shown
+                self.answers.pop(name, None)
+
+        if question.compute_default is not None and not skipped:
+            default = self.call(question.compute_default)
+            if self.defaults.get(name, MISSING) != default:
+                self.defaults[name] = default
+                changed = True
+        return changed
+
+    def update(self, name: str, answer: object) -> list[str]:
+        """
+        Set the answer of a question, and evaluate the questions depending on it.
+        Return the names of the questions whose visibility or computed default changed, in order.
+        The answer is MISSING while it isn't known, like an invalid answer being edited:
+        the questions depending on it are left as they are until it is known again.
+        """
+        if answer is MISSING:
+            self.answers.pop(name, None)
+            return list()
+        if name in self.skipped or (name in self.answers and self.answers[name] == answer):
+            return list()
+        self.answers[name] = answer
+        return self.propagate(name)
+
+    def propagate(self, name: str) -> list[str]:
+        """Evaluate the questions depending on the answer of a question, and so on"""
+        changed: list[str] = list()
+        queue = list(self.dependents.get(name, ()))
+        evaluated: set[int] = set()
+        # Questions are evaluated in order, after all the ones they depend on
+        while queue:
+            qid = heappop(queue)
+            if qid in evaluated:
+                continue
+            evaluated.add(qid)
+            dependent = self.questions[qid].name
+            was_skipped = dependent in self.skipped
+            if not self.evaluate(dependent):
+                continue
+            changed.append(dependent)
+            if was_skipped != (dependent in self.skipped):
+                for x in self.dependents.get(dependent, ()):
+                    heappush(queue, x)
+        return changed
+
+
+def compile_conditions(questions: Sequence["InputType"]) -> Optional[ConditionGraph]:
+    """Return the dependency graph of the questions, None if none of them is conditional"""
+    if all(x.when is None and x.compute_default is None for x in questions):
+        return None
+    return ConditionGraph(questions)
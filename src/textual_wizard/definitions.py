@@ -0,0 +1,228 @@
+import hashlib
+import inspect
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional, TypedDict
+
+from textual_wizard import __version__
+from textual_wizard.exceptions import InvalidDefinition
+from textual_wizard.inputs import (
+    URL,
+    BaseText,
+    Email,
+    InputType,
+    Integer,
+    Number,
+    RadioSet,
+    Select,
+    SelectionList,
+    Text,
+)
+from textual_wizard.validation import LengthRule, NumberRule, RegexRule, Rule, URLRule
+from textual_wizard.wizard import Stages, WizardStage
+
+# Wizards can be defined in JSON or TOML files instead of Python code.
+# A definition is validated and turned into questions once, then this compiled form is cached
+# on disk, keyed by the hash of the file: launching the same wizard again only unpickles it,
+# skipping the parsing, the normalization of the options and the construction of the validators.
+
+COMPILED_FORMAT = 1
+"""Version of the compiled form, part of the cache key along with the version of the library"""
+
+QUESTION_TYPES: dict[str, type[InputType]] = {
+    "text": Text,
+    "email": Email,
+    "url": URL,
+    "integer": Integer,
+    "number": Number,
+    "select": Select,
+    "selection_list": SelectionList,
+    "radio_set": RadioSet,
+}
+"""Question classes, by value of the `type` key of a question"""
+
+RULE_TYPES: dict[str, type[Rule]] = {
+    "length": LengthRule,
+    "number": NumberRule,
+    "regex": RegexRule,
+    "url": URLRule,
+}
+"""Validation rules, by value of the `rule` key of a validator"""
+
+UNSUPPORTED_ARGUMENTS = ("async_validators", "when", "compute_default")
+"""Arguments of the questions that can't be given by a definition, since they are Python objects"""
+
+
+class WizardDefinition(TypedDict):
+    title: str
+    stages: Stages
+
+
+def parse_definition(content: bytes, suffix: str) -> object:
+    """Parse the content of a definition file, TOML if the suffix is `.toml`, JSON otherwise"""
+    if suffix != ".toml":
+        return json.loads(content)
+
+    try:
+        import tomllib  # noqa: PLC0415
+    except ImportError:
+        # Python 3.10
+        try:
+            import tomli as tomllib  # noqa: PLC0415  # type: ignore
+        except ImportError as e:
+            raise ImportError("tomli must be installed to read TOML before Python 3.11.") from e
+    return tomllib.loads(content.decode())
+
+
+def get_arguments(cls: type) -> set[str]:
+    """Return the names of the keyword arguments accepted by the constructor of a class"""
+    parameters = inspect.signature(cls.__init__).parameters
+    return {x for x in parameters if x not in ("self", "name", "label", *UNSUPPORTED_ARGUMENTS)}
+
+
+def expect_mapping(data: object, where: str) -> dict[str, Any]:
+    if not isinstance(data, dict):
+        raise InvalidDefinition(f"{where} must be a mapping.")
+    return data
+
+
+def expect_list(data: object, where: str) -> list[Any]:
+    if not isinstance(data, list):
+        raise InvalidDefinition(f"{where} must be a list.")
+    return data
+
+
+def build_rule(data: object, where: str) -> Rule:
+    """Create a validation rule from its definition, like `{"rule": "length", "minimum": 3}`"""
+    data = expect_mapping(data, where)
+    arguments = dict(data)
+    rule_type = RULE_TYPES.get(arguments.pop("rule", None))
+    if rule_type is None:
+        raise InvalidDefinition(f"{where}.rule must be one of {', '.join(RULE_TYPES)}.")
+
+    unknown = arguments.keys() - get_arguments(rule_type)
+    if unknown:
+        raise InvalidDefinition(f"{where} has unknown keys: {', '.join(sorted(unknown))}.")
+    return rule_type(**arguments)
+
+
+def build_question(data: object, where: str) -> InputType:
+    """Create a question from its definition, a mapping of the arguments of its class"""
+    data = expect_mapping(data, where)
+    arguments = dict(data)
+    question_type = QUESTION_TYPES.get(arguments.pop("type", None))
+    if question_type is None:
+        raise InvalidDefinition(f"{where}.type must be one of {', '.join(QUESTION_TYPES)}.")
+
+    name, label = arguments.pop("name", None), arguments.pop("label", None)
+    if not isinstance(name, str) or not isinstance(label, str):
+        raise InvalidDefinition(f"{where} must have a name and a label.")
+
+    unknown = arguments.keys() - get_arguments(question_type)
+    if unknown:
+        raise InvalidDefinition(f"{where} has unknown keys: {', '.join(sorted(unknown))}.")
+
+    if issubclass(question_type, BaseText) and "validators" in arguments:
+        validators = expect_list(arguments["validators"], f"{where}.validators")
+        arguments["validators"] = [
+            build_rule(x, f"{where}.validators[{i}]") for i, x in enumerate(validators)
+        ]
+    if "options" in arguments:
+        # Options given as arrays are tuples, like ["Label", "value"]
+        options = expect_list(arguments["options"], f"{where}.options")
+        arguments["options"] = [tuple(x) if isinstance(x, list) else x for x in options]
+
+    try:
+        return question_type(name, label, **arguments)
+    except (TypeError, ValueError, IndexError) as e:
+        raise InvalidDefinition(f"{where} is not a valid {data['type']} question: {e}") from e
+
+
+def compile_definition(data: object, where: str = "definition") -> WizardDefinition:
+    """
+    Validate a parsed definition and create its questions.
+
+    A definition has a `title`, and either a list of `stages`, each with a `title` and a list
+    of `questions`, or directly a list of `questions` shown in a single stage.
+    """
+    data = expect_mapping(data, where)
+    title = data.get("title", "Wizard")
+    if "questions" in data:
+        stages_data = [{"title": title, "questions": data["questions"]}]
+    else:
+        stages_data = expect_list(data.get("stages"), f"{where}.stages")
+
+    stages: list[WizardStage] = list()
+    names: set[str] = set()
+    for i, stage in enumerate(stages_data):
+        stage_where = f"{where}.stages[{i}]"
+        stage_data = expect_mapping(stage, stage_where)
+        questions_data = expect_list(stage_data.get("questions"), f"{stage_where}.questions")
+
+        questions = list()
+        for j, question_data in enumerate(questions_data):
+            question = build_question(question_data, f"{stage_where}.questions[{j}]")
+            if question.name in names:
+                raise InvalidDefinition(f"Multiple questions are named '{question.name}'.")
+            names.add(question.name)
+            questions.append(question)
+
+        stages.append({"title": stage_data.get("title", title), "questions": questions})
+
+    return {"title": title, "stages": stages}
+
+
+def get_cache_dir() -> Path:
+    """Return the default directory of the compiled definitions, within the user cache"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "textual-wizard"
+
+
+def load_definition(
+    path: str | Path,
+    *,
+    cache: bool = True,
+    cache_dir: Optional[str | Path] = None,
+) -> WizardDefinition:
+    """
+    Load a wizard definition from a JSON or TOML file.
+
+    The compiled definition is cached on disk and reused as long as the file doesn't change.
+    The cache is trusted like the code of the wizard, so it must not be writable by others.
+
+    Args:
+        path: The path of the definition, TOML is used if it ends with `.toml`.
+        cache: Whether or not to read and write the compiled form of the definition.
+        cache_dir: The directory of the compiled definitions,
+            `$XDG_CACHE_HOME/textual-wizard` by default.
+    """
+    path = Path(path)
+    content = path.read_bytes()
+    if not cache:
+        return compile_definition(parse_definition(content, path.suffix), str(path))
+
+    key = hashlib.sha256(content)
+    key.update(f"{path.suffix}:{COMPILED_FORMAT}:{__version__}".encode())
+    cache_file = Path(cache_dir or get_cache_dir()) / f"{key.hexdigest()}.pickle"
+
+    try:
+        with cache_file.open("rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing or unreadable entries are compiled again
+        pass
+
+    definition = compile_definition(parse_definition(content, path.suffix), str(path))
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Written under another name then renamed, so a concurrent launch never reads half of it
+        temporary = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with temporary.open("wb") as f:
+            pickle.dump(definition, f)
+        os.replace(temporary, cache_file)
+    except OSError:
+        # The wizard still works with a read-only cache
+        pass
+    return definition
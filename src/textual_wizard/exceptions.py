@@ -1 +1,13 @@
 class QuestionNameNotUnique(Exception): ...
+
+
+class InvalidAnswer(Exception): ...
+
+
+class InvalidDefinition(Exception): ...
+
+
+class InvalidSession(Exception): ...
+
+
+class InvalidCondition(Exception): ...
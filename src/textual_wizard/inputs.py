@@ -1,39 +1,123 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Optional, Sequence, TypeVar
-
-import inquirer as inq
-from textual.validation import URL as URL_
-from textual.validation import Integer as IntegerValidator
-from textual.validation import Length, Regex, Validator
-from textual.validation import Number as NumberValidator
-from textual.widgets import Input, RadioButton
-from textual.widgets import RadioSet as RadioSet_
-from textual.widgets import Select as Select_
-from textual.widgets import SelectionList as SelectionList_
-from textual.widgets._input import InputType as InputWidgetType
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Iterator, Optional, Sequence, TypeVar
+
+from textual_wizard.conditions import AnswerFunction
+from textual_wizard.options import OptionProvider, OptionStore
+from textual_wizard.search import OptionIndex
+from textual_wizard.validation import (
+    ACCEPTED,
+    AsyncValidator,
+    CompiledValidator,
+    LengthRule,
+    LRUCache,
+    NumberRule,
+    RegexRule,
+    Rule,
+    URLRule,
+    ValidationResult,
+    compile_validators,
+    is_pure,
+    rejected,
+)
+
+# Textual and Inquirer are imported when a question is first shown,
+# so the wizards only load the one they use.
+if TYPE_CHECKING:
+    from textual.validation import Validator
+    from textual.widgets import Input
+    from textual.widgets import RadioSet as RadioSet_
+    from textual.widgets import Select as Select_
+    from textual.widgets import SelectionList as SelectionList_
+    from textual.widgets._input import InputType as InputWidgetType
 
 EMAIL_REGEX = r"^([^\x00-\x20\x22\x28\x29\x2c\x2e\x3a-\x3c\x3e\x40\x5b-\x5d\x7f-\xff]+|\x22([^\x0d\x22\x5c\x80-\xff]|\x5c[\x00-\x7f])*\x22)(\x2e([^\x00-\x20\x22\x28\x29\x2c\x2e\x3a-\x3c\x3e\x40\x5b-\x5d\x7f-\xff]+|\x22([^\x0d\x22\x5c\x80-\xff]|\x5c[\x00-\x7f])*\x22))*\x40([^\x00-\x20\x22\x28\x29\x2c\x2e\x3a-\x3c\x3e\x40\x5b-\x5d\x7f-\xff]+|\x5b([^\x0d\x5b-\x5d\x80-\xff]|\x5c[\x00-\x7f])*\x5d)(\x2e([^\x00-\x20\x22\x28\x29\x2c\x2e\x3a-\x3c\x3e\x40\x5b-\x5d\x7f-\xff]+|\x5b([^\x0d\x5b-\x5d\x80-\xff]|\x5c[\x00-\x7f])*\x5d))*$"  # noqa: E501
 
 
-class ValidationResult:
-    valid: bool = True
-    failure_reason: str
+NOT_BLANK = LengthRule(1, failure_description="You must provide a value.")
+"""Rule shared by the questions which can't be left blank"""
 
 
-# Base class for all input types
+def match_option(options: Sequence[tuple[Any, ...]], value: object) -> tuple[bool, Any]:
+    """
+    Find the option matching a value given outside of the wizard, for example read from a file.
+    The value can be the actual value of the option, or its displayed text.
+    """
+    for option in options:
+        if option[1] == value:
+            return True, option[1]
+    for option in options:
+        if value in (option[0], str(option[1])):
+            return True, option[1]
+    return False, None
+
+
+def pair_options(options: Sequence[Any]) -> list[tuple[str, Any]]:
+    """Convert simplified options to ("displayed text", actual_value)"""
+    return [x if isinstance(x, tuple) else (str(x), x) for x in options]
+
+
+SEARCH_THRESHOLD = 50
+"""Number of options from which the options of a question can be filtered by default"""
+
+
+def slot_names(cls: type) -> Iterator[str]:
+    """Return the names of the attributes declared in the slots of a class and its parents"""
+    for klass in cls.__mro__:
+        slots = getattr(klass, "__slots__", ())
+        yield from (slots,) if isinstance(slots, str) else slots
+
+
+# Base class for all input types.
+# Questions are slotted, since wizards generated from templates may define thousands of them.
 class InputType(ABC):
+    __slots__ = ("name", "label", "index", "when", "compute_default")
+
     name: str
     label: str
+    index: Optional[OptionIndex]
+    """Index used to filter the options of the question as the user types, None if disabled"""
 
-    def __init__(self, name: str, label: str) -> None:
+    when: Optional[AnswerFunction]
+    """Only ask the question when this function returns True, see `textual_wizard.conditions`"""
+
+    compute_default: Optional[AnswerFunction]
+    """Returns the default answer of the question, see `textual_wizard.conditions`"""
+
+    def __init__(
+        self,
+        name: str,
+        label: str,
+        *,
+        when: Optional[AnswerFunction] = None,
+        compute_default: Optional[AnswerFunction] = None,
+    ) -> None:
         self.name = name
         self.label = label
+        self.index = None
+        self.when = when
+        self.compute_default = compute_default
+
+    @abstractmethod
+    def as_widget(self, qid: str) -> "Input | Select_ | SelectionList_ | RadioSet_": ...
 
     @abstractmethod
-    def as_widget(self, qid: str) -> Input | Select_ | SelectionList_ | RadioSet_: ...
+    def inq_ask(self, default: object = None) -> ...:
+        """
+        Asks the question using Inquirer instead of the Textual User Interface.
+
+        Args:
+            default: The computed default of the question, if any, replacing its initial value.
+        """
 
     @abstractmethod
-    def inq_ask(self) -> ...: ...
+    def validate_answer(self, value: object) -> tuple[ValidationResult, Any]:
+        """
+        Validate and parse an answer given outside of the wizard, for example read from a file.
+        Return the validation result, and the parsed answer if it is valid.
+
+        Args:
+            value: The answer to validate, None if it was not given.
+        """
 
 
 FieldValueType = TypeVar("FieldValueType")
@@ -41,24 +125,52 @@ FieldValueType = TypeVar("FieldValueType")
 
 # Base class for all input types using an `Input` widget
 class BaseText(InputType, Generic[FieldValueType]):
-    validators: list[Validator]
+    __slots__ = (
+        "validators",
+        "compiled_validators",
+        "placeholder",
+        "initial_value",
+        "allow_blank",
+        "default_value",
+        "validation_delay",
+        "async_validators",
+        "async_validation_cache",
+        "validation_cache",
+    )
+
+    validators: "list[Validator | Rule]"
+    compiled_validators: list[CompiledValidator]
     placeholder: str
     initial_value: str
-    input_type: InputWidgetType
+    input_type: "InputWidgetType"
     allow_blank: bool
-    additional_validators: Optional[list[Validator]] = None
+    additional_validators: "Optional[list[Validator | Rule]]" = None
+    blank_value: ClassVar[Any] = None
+    """Default value of the questions of this type, returned when the input is left blank"""
+
     default_value: FieldValueType
+    validation_delay: Optional[float]
+    async_validators: Sequence[AsyncValidator]
+    async_validation_cache: Optional[LRUCache[str, ValidationResult]]
+    """Results of the async validators, None if there are none"""
+    validation_cache: Optional[LRUCache[str, ValidationResult]]
 
     def __init__(
         self,
         name: str,
         label: str,
         *,
-        validators: Optional[list[Validator]] = None,
+        validators: "Optional[list[Validator | Rule]]" = None,
         placeholder: Optional[str] = None,
         initial_value: Optional[str] = None,
         allow_blank: bool = False,
         default_value: Optional[FieldValueType] = None,
+        validation_delay: Optional[float] = None,
+        async_validators: Optional[list[AsyncValidator]] = None,
+        async_cache_size: int = 128,
+        validation_cache_size: int = 0,
+        when: Optional[AnswerFunction] = None,
+        compute_default: Optional[AnswerFunction] = None,
     ) -> None:
         """
         Initializes an instance of this class.
@@ -66,49 +178,79 @@ class BaseText(InputType, Generic[FieldValueType]):
         Args:
             name: The input identifier, used as key in the returned `answers` dict.
             label: The title of the input, displayed to the user.
-            validators: A list of Textual validators,
+            validators: A list of Textual validators or rules,
                 allowing the user to pass to the next question or displaying an error.
             placeholder: Placeholder for the text field.
             initial_value: Initial value entered in the input.
             allow_blank: Whether or not the text field is considered valid when is it empty.
             default_value: The value returned by the input if allow_blank is
                 set to True and the input is empty.
+            validation_delay: Time to wait after the last change before validating the input,
+                in seconds. Defaults to the validation delay of the wizard.
+            async_validators: A list of validators running in the background,
+                once the value satisfies all the other validators.
+            async_cache_size: The number of values whose async validation result is kept.
+            validation_cache_size: The number of values whose validation result is kept,
+                0 to disable the cache. Results are only cached if all the validators are pure,
+                see `is_pure`.
+            when: Only ask the question when this function returns True. Its parameters are
+                named after previous questions, and receive their answers, None for the ones
+                that were skipped. Skipped questions are neither shown nor validated,
+                and their answer is None.
+            compute_default: Returns the default answer of the question, from the answers of
+                previous questions received like with `when`. It replaces the initial value
+                until the user changes it.
         """
-        super().__init__(name, label)
+        super().__init__(name, label, when=when, compute_default=compute_default)
 
-        if validators is None:
-            validators = list()
+        # Copy the list to avoid modifying the one supplied by the user
+        validators = list(validators or [])
         if self.additional_validators is not None:
             validators += self.additional_validators
 
         self.placeholder = placeholder or initial_value or ""
-        if default_value is not None:
-            self.default_value = default_value
+        self.default_value = self.blank_value if default_value is None else default_value
         self.initial_value = initial_value or ""
 
         if not allow_blank:
-            validators.append(Length(1, failure_description="You must provide a value."))
+            validators.append(NOT_BLANK)
 
         self.validators = validators
+        self.compiled_validators = compile_validators(validators)
         self.allow_blank = allow_blank
-
-    def as_widget(self, qid: str) -> Input:
+        self.validation_delay = validation_delay
+        # Questions without async validators share the empty tuple, and have no cache
+        self.async_validators = tuple(async_validators or ())
+        self.async_validation_cache = None
+        if self.async_validators:
+            self.async_validation_cache = LRUCache(async_cache_size)
+
+        self.validation_cache = None
+        if validation_cache_size > 0 and all(is_pure(x) for x in validators):
+            self.validation_cache = LRUCache(validation_cache_size)
+
+    def as_widget(self, qid: str) -> "Input":
         """Returns a Textual input widget with the corresponding information"""
-        wid = Input(
-            placeholder=self.placeholder, validators=self.validators, type=self.input_type, id=qid
-        )
+        from textual.widgets import Input  # noqa: PLC0415
+
+        # Validators are not given to the widget, validation is handled by the wizard
+        wid = Input(placeholder=self.placeholder, type=self.input_type, id=qid)
         wid.border_title = self.label
         wid.value = self.initial_value
 
         return wid
 
-    def inq_ask(self) -> FieldValueType:
-        """
-        Asks a question using Inquirer instead of the Textual User Interface.
-        """
+    def inq_ask(self, default: object = None) -> FieldValueType:
+        import inquirer  # noqa: PLC0415
+
+        initial_value = self.initial_value if default is None else str(default)
         while True:
-            answer = inq.text(self.label, default=self.initial_value)
+            answer = inquirer.text(self.label, default=initial_value)
             validation = self.is_value_accepted(answer)
+            if validation.valid and self.async_validators:
+                import asyncio  # noqa: PLC0415
+
+                validation = asyncio.run(self.is_value_accepted_async(str(answer)))
             if not validation.valid:
                 print(validation.failure_reason)
                 continue
@@ -121,24 +263,92 @@ class BaseText(InputType, Generic[FieldValueType]):
         Args:
             value: The value your want to check the validity of.
         """
-        result = ValidationResult()
-        if self.allow_blank and len(value) == 0:
-            return result
+        if len(value) == 0:
+            if self.allow_blank:
+                return ACCEPTED
+            return rejected("This input cannot be left empty.")
+
+        if self.validation_cache is not None:
+            cached = self.validation_cache.get(value)
+            if cached is not None:
+                return cached
+
+        result = ACCEPTED
+        for check, describe in self.compiled_validators:
+            if check is not None and check(value):
+                continue
+
+            # Failures are only described when a check fails
+            failure_reason = describe(value)
+            if failure_reason is not None:
+                result = rejected(failure_reason)
+                break
 
-        if not self.allow_blank and len(value) == 0:
-            result.failure_reason = "This input cannot be left empty."
-            result.valid = False
+        if self.validation_cache is not None:
+            self.validation_cache.put(value, result)
+        return result
+
+    def get_async_result(self, value: str) -> Optional[ValidationResult]:
+        """
+        Return the cached result of the async validators for a value, None if it is not known.
+        The result is always known when there are no async validators.
+        """
+        if self.async_validation_cache is None or (self.allow_blank and len(value) == 0):
+            return ValidationResult()
+        return self.async_validation_cache.get(value)
+
+    async def is_value_accepted_async(self, value: str) -> ValidationResult:
+        """
+        Determine if a value satisfies all the validators configured on the question,
+        async validators included.
+
+        Args:
+            value: The value your want to check the validity of.
+        """
+        result = self.is_value_accepted(value)
+        if not result.valid:
             return result
 
-        for validator in self.validators:
-            validation = validator.validate(value)
-            if not validation.is_valid:
-                result.failure_reason = validation.failure_descriptions[0]
+        cached = self.get_async_result(value)
+        if cached is not None:
+            return cached
+
+        # The result of the other validators may be cached, so we don't modify it
+        result = ValidationResult()
+        for validator in self.async_validators:
+            if not await validator.is_valid(value):
+                result.failure_reason = validator.failure_description
                 result.valid = False
-                return result
+                break
 
+        if self.async_validation_cache is not None:
+            self.async_validation_cache.put(value, result)
         return result
 
+    def validate_answer(self, value: object) -> tuple[ValidationResult, Any]:
+        text = self.initial_value if value is None else str(value)
+        result = self.is_value_accepted(text)
+        if result.valid and self.async_validators:
+            import asyncio  # noqa: PLC0415
+
+            result = asyncio.run(self.is_value_accepted_async(text))
+        if not result.valid:
+            return result, None
+        return result, self.parse_result(text)
+
+    def __getstate__(self) -> dict[str, object]:
+        state = {x: getattr(self, x) for x in slot_names(type(self)) if hasattr(self, x)}
+        # Subclasses defined without slots keep their attributes in a dict
+        state.update(getattr(self, "__dict__", {}))
+        # Compiled validators are closures, which can't be pickled
+        del state["compiled_validators"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for key, value in state.items():
+            setattr(self, key, value)
+        self.compiled_validators = compile_validators(self.validators)
+
     def parse_result(self, value: str) -> FieldValueType:
         if len(value) == 0 and self.allow_blank:
             return self.default_value
@@ -153,8 +363,10 @@ class Text(BaseText[str]):
     Input widget allowing text to be entered without any restrictions.
     """
 
-    input_type: InputWidgetType = "text"
-    default_value: str = ""
+    __slots__ = ()
+
+    input_type: "InputWidgetType" = "text"
+    blank_value: ClassVar[str] = ""
 
     def _parse_result(self, value: str) -> str:
         return value
@@ -166,8 +378,10 @@ class Email(Text):
     but simply adds an email validator.
     """
 
+    __slots__ = ()
+
     additional_validators = [
-        Regex(
+        RegexRule(
             EMAIL_REGEX,
             failure_description="Must be a valid email address.",
         )
@@ -180,7 +394,9 @@ class URL(Text):
     but simply adds an URL validator.
     """
 
-    additional_validators = [URL_()]
+    __slots__ = ()
+
+    additional_validators = [URLRule()]
 
 
 class Integer(BaseText[int]):
@@ -189,9 +405,11 @@ class Integer(BaseText[int]):
     Only entering digits will work, other keypresses will just be ignored.
     """
 
-    default_value: int = 0
-    input_type: InputWidgetType = "integer"
-    additional_validators = [IntegerValidator()]
+    __slots__ = ()
+
+    blank_value: ClassVar[int] = 0
+    input_type: "InputWidgetType" = "integer"
+    additional_validators = [NumberRule(integer=True)]
 
     def _parse_result(self, value: str) -> int:
         return int(value)
@@ -203,9 +421,11 @@ class Number(BaseText[float]):
     Only entering digits and `.` will work, other keypresses will just be ignored.
     """
 
-    default_value: float = 0
-    input_type: InputWidgetType = "number"
-    additional_validators = [NumberValidator()]
+    __slots__ = ()
+
+    blank_value: ClassVar[float] = 0
+    input_type: "InputWidgetType" = "number"
+    additional_validators = [NumberRule()]
 
     def _parse_result(self, value: str) -> float:
         return float(value)
@@ -214,21 +434,88 @@ class Number(BaseText[float]):
 # Option[T]: tuple[str, T]
 # OptionList[T]: list[Option[T]]
 
+NormalizedOption = TypeVar("NormalizedOption", bound=tuple[Any, ...])
+
+
+# Base class for the input types whose options can be loaded page by page
+class OptionsInput(InputType, Generic[NormalizedOption]):
+    __slots__ = ("options", "provider")
+
+    options: OptionStore[NormalizedOption]
+    provider: Optional[OptionProvider]
+    """Loads the options while the wizard runs, None if they were all supplied up front"""
+
+    option_flags: ClassVar[bool] = False
+    """Whether or not the options have a selected flag, as their third element"""
+
+    def set_options(
+        self, options: Sequence[Any] | OptionProvider, searchable: Optional[bool] = None
+    ) -> None:
+        self.provider = None
+        if isinstance(options, OptionProvider):
+            self.provider = options
+            options = options.loaded
+        self.options = OptionStore(self.normalize_options(options), flags=self.option_flags)
+
+        # The number of provided options is not known in advance
+        if searchable is None:
+            searchable = self.provider is not None or len(self.options) >= SEARCH_THRESHOLD
+        if searchable:
+            self.index = OptionIndex(self.options.labels)
+
+    @abstractmethod
+    def normalize_options(self, options: Sequence[Any]) -> list[NormalizedOption]: ...
+
+    @property
+    def options_complete(self) -> bool:
+        """Whether or not all the options are loaded"""
+        return self.provider is None or self.provider.complete
+
+    async def load_options(self) -> list[NormalizedOption]:
+        """Load the next page of options, and return its options"""
+        if self.provider is None:
+            return list()
+        page = self.normalize_options(await self.provider.fetch())
+        self.options += page
+        if self.index is not None:
+            self.index.add(x[0] for x in page)
+        return page
 
-class SelectionList(InputType, Generic[FieldValueType]):
+    def load_all_options(self) -> None:
+        """Load all the remaining options, used when the TUI is disabled"""
+        if self.options_complete:
+            return
+
+        import asyncio  # noqa: PLC0415
+
+        async def load_remaining() -> None:
+            while not self.options_complete:
+                await self.load_options()
+
+        # Async generators are closed with their event loop, so the pages are loaded in one loop
+        asyncio.run(load_remaining())
+
+
+class SelectionList(OptionsInput[tuple[str, FieldValueType, bool]], Generic[FieldValueType]):
     """
     Allows the user to select multiple options within a predifined list, similar to a checklist.
     """
 
-    options: list[tuple[str, FieldValueType, bool]]
-    wid: SelectionList_[FieldValueType]
+    __slots__ = ()
+
+    option_flags = True
+    wid: "SelectionList_[FieldValueType]"
 
     def __init__(
         self,
         name: str,
         label: str,
         *,
-        options: Sequence[tuple[str, FieldValueType, bool] | tuple[FieldValueType, bool]],
+        options: Sequence[tuple[str, FieldValueType, bool] | tuple[FieldValueType, bool]]
+        | OptionProvider,
+        searchable: Optional[bool] = None,
+        when: Optional[AnswerFunction] = None,
+        compute_default: Optional[AnswerFunction] = None,
     ) -> None:
         """
         Initializes an instance of this class.
@@ -240,9 +527,22 @@ class SelectionList(InputType, Generic[FieldValueType]):
                 An option can be represented:
                 - by a tuple ("display string", actual_value, is_selected)
                 - or the "display string" can be omitted and the value will be converted to a string
+                Options can also be loaded page by page while the wizard runs,
+                by an `OptionProvider`.
+            searchable: Let the user filter the options by typing, which indexes them.
+                Defaults to True when there are at least 50 options, or when they are provided.
+            when: Only ask the question when this function returns True. Its parameters are
+                named after previous questions, and receive their answers, None for the ones
+                that were skipped. Skipped questions are neither shown nor validated,
+                and their answer is None.
+            compute_default: Returns the default answer of the question, from the answers of
+                previous questions received like with `when`. It replaces the initial value
+                until the user changes it.
         """
-        super().__init__(name, label)
+        super().__init__(name, label, when=when, compute_default=compute_default)
+        self.set_options(options, searchable)
 
+    def normalize_options(self, options: Sequence[Any]) -> list[tuple[str, FieldValueType, bool]]:
         # convert simplified options into 3-sized tuples.
         options_ = list()
         for option in options:
@@ -253,9 +553,11 @@ class SelectionList(InputType, Generic[FieldValueType]):
             else:
                 raise Exception("A SelectionList option should be a tuple of 2 or 3 elements.")
 
-        self.options = options_
+        return options_
+
+    def as_widget(self, qid: str) -> "SelectionList_":
+        from textual.widgets import SelectionList as SelectionList_  # noqa: PLC0415
 
-    def as_widget(self, qid: str) -> SelectionList_:
         wid = SelectionList_[FieldValueType](
             *self.options,
             id=qid,
@@ -264,30 +566,55 @@ class SelectionList(InputType, Generic[FieldValueType]):
         wid.border_title = self.label
         return wid
 
-    def inq_ask(self) -> FieldValueType:
-        return inq.checkbox(
+    def validate_answer(self, value: object) -> tuple[ValidationResult, Any]:
+        self.load_all_options()
+        if value is None:
+            return ACCEPTED, self.options.flagged_values()
+
+        # Selected options can be supplied as a comma separated string
+        values = value.split(",") if isinstance(value, str) else value
+        if not isinstance(values, (list, tuple, set)):
+            return rejected("Must be a list of options."), None
+
+        selected = list()
+        for x in values:
+            found, option_value = match_option(self.options, x.strip() if isinstance(x, str) else x)
+            if not found:
+                return rejected(f"Unknown option: {x}."), None
+            selected.append(option_value)
+        return ACCEPTED, selected
+
+    def inq_ask(self, default: object = None) -> FieldValueType:
+        import inquirer  # noqa: PLC0415
+
+        self.load_all_options()
+        return inquirer.checkbox(
             self.label,
-            choices=[(x[0], x[1]) for x in self.options],
-            default=[x[1] for x in self.options if x[2]],
+            choices=list(zip(self.options.labels, self.options.values)),
+            default=self.options.flagged_values() if default is None else default,
         )
 
 
-class Select(InputType, Generic[FieldValueType]):
+class Select(OptionsInput[tuple[str, FieldValueType]], Generic[FieldValueType]):
     """
     Allows the user to select a value within a list of radio buttons
     """
 
-    options: list[tuple[str, FieldValueType]]
-    default_value: FieldValueType
-    wid: Select_[FieldValueType]
+    __slots__ = ("default_value",)
+
+    default_value: Optional[FieldValueType]
+    wid: "Select_[FieldValueType]"
 
     def __init__(
         self,
         name: str,
         label: str,
         *,
-        options: Sequence[tuple[str, FieldValueType] | FieldValueType],
+        options: Sequence[tuple[str, FieldValueType] | FieldValueType] | OptionProvider,
         default_value: Optional[FieldValueType] = None,
+        searchable: Optional[bool] = None,
+        when: Optional[AnswerFunction] = None,
+        compute_default: Optional[AnswerFunction] = None,
     ) -> None:
         """
         Initializes an instance of this class.
@@ -299,59 +626,107 @@ class Select(InputType, Generic[FieldValueType]):
                 An option can be represented by:
                 - any value that can be converted to a string
                 - a tuple ("displayed text", actual_value)
+                Options can also be loaded page by page while the wizard runs,
+                by an `OptionProvider`.
             default_value: The default value of the input.
                 You must identify the default element by its actual value,
                 (the second part of the tuple).
+            searchable: Let the user filter the options by typing, which indexes them.
+                Defaults to True when there are at least 50 options, or when they are provided.
+            when: Only ask the question when this function returns True. Its parameters are
+                named after previous questions, and receive their answers, None for the ones
+                that were skipped. Skipped questions are neither shown nor validated,
+                and their answer is None.
+            compute_default: Returns the default answer of the question, from the answers of
+                previous questions received like with `when`. It replaces the initial value
+                until the user changes it.
         """
-        super().__init__(name, label)
-
-        # Convert simplified options to ("displayed text", actual_value)
-        options_ = list()
-        for option in options:
-            if isinstance(option, tuple):
-                options_ += [option]
-            else:
-                options_ += [(str(option), option)]
-        self.options = options_
-
-        if default_value is None:
-            default_value = self.options[0][1]
-
+        super().__init__(name, label, when=when, compute_default=compute_default)
         self.default_value = default_value
-
-    def as_widget(self, qid: str) -> Select_:
-        wid = Select_[FieldValueType](
-            id=qid,
-            options=self.options,
-            allow_blank=False,
-            value=self.default_value,
-        )
+        self.set_options(options, searchable)
+        self.set_default_value()
+
+    def normalize_options(self, options: Sequence[Any]) -> list[tuple[str, FieldValueType]]:
+        return pair_options(options)
+
+    def set_default_value(self) -> None:
+        # The first option is the default one, once it is loaded
+        if self.default_value is None and len(self.options) > 0:
+            self.default_value = self.options[0][1]
+
+    async def load_options(self) -> list[tuple[str, FieldValueType]]:
+        page = await super().load_options()
+        self.set_default_value()
+        return page
+
+    def as_widget(self, qid: str) -> "Select_":
+        from textual.widgets import Select as Select_  # noqa: PLC0415
+
+        if len(self.options) == 0:
+            # Nothing can be selected until the first page of options is loaded
+            wid = Select_[FieldValueType](
+                [], id=qid, prompt="Loading...", type_to_search=self.index is None
+            )
+        else:
+            # The page of the default value may not be loaded yet
+            options = self.options
+            value = next((x[1] for x in options if x[1] == self.default_value), options[0][1])
+            # Typing filters the options when they are indexed, instead of jumping to them
+            wid = Select_[FieldValueType](
+                id=qid,
+                options=options,
+                allow_blank=False,
+                value=value,
+                type_to_search=self.index is None,
+            )
 
         wid.border_title = self.label
 
         return wid
 
-    def inq_ask(self) -> FieldValueType:
-        # We assume inq.list_input will return a good type
-        return inq.list_input(self.label, choices=self.options, default=self.default_value)  # type: ignore
+    def validate_answer(self, value: object) -> tuple[ValidationResult, Any]:
+        self.load_all_options()
+        if value is None:
+            return ACCEPTED, self.default_value
 
+        found, option_value = match_option(self.options, value)
+        if not found:
+            return rejected(f"Unknown option: {value}."), None
+        return ACCEPTED, option_value
 
-class RadioSet(InputType):
+    def inq_ask(self, default: object = None) -> FieldValueType:
+        import inquirer  # noqa: PLC0415
+
+        self.load_all_options()
+        # We assume inquirer.list_input will return a good type
+        return inquirer.list_input(
+            self.label,
+            choices=list(self.options),
+            default=self.default_value if default is None else default,
+        )  # type: ignore
+
+
+class RadioSet(InputType, Generic[FieldValueType]):
     """
     Allows the user to select a value within a predefined list of options.
     """
 
-    options: list[str]
-    default_value: str
-    wid: RadioSet_
+    __slots__ = ("options", "default_value")
+
+    options: OptionStore[tuple[str, FieldValueType]]
+    default_value: FieldValueType
+    wid: "RadioSet_"
 
     def __init__(
         self,
         name: str,
         label: str,
         *,
-        options: list[str],
-        default_value: Optional[str] = None,
+        options: Sequence[tuple[str, FieldValueType] | FieldValueType],
+        default_value: Optional[FieldValueType] = None,
+        searchable: Optional[bool] = None,
+        when: Optional[AnswerFunction] = None,
+        compute_default: Optional[AnswerFunction] = None,
     ) -> None:
         """
         Initializes an instance of this class.
@@ -360,19 +735,43 @@ class RadioSet(InputType):
             name: The input identifier, used as key in the returned `answers` dict.
             label: The title of the input, displayed to the user.
             options: A list of options that can be selected by the user.
-                An option is represented by a string.
-            default_value: The default value of the input (str).
+                An option is represented by a tuple, containing:
+                - the "display string" of the option,
+                - the actual value of the option.
+                The "display string" can be omitted, the value will be converted to a string.
+            default_value: The default value of the input.
+                You must identify the default element by its actual value,
+                (the second part of the tuple).
+            searchable: Let the user filter the options by typing, which indexes them.
+                Defaults to True when there are at least 50 options.
+            when: Only ask the question when this function returns True. Its parameters are
+                named after previous questions, and receive their answers, None for the ones
+                that were skipped. Skipped questions are neither shown nor validated,
+                and their answer is None.
+            compute_default: Returns the default answer of the question, from the answers of
+                previous questions received like with `when`. It replaces the initial value
+                until the user changes it.
         """
-        super().__init__(name, label)
+        super().__init__(name, label, when=when, compute_default=compute_default)
 
-        self.options = options
+        self.options = OptionStore(pair_options(options))
+        if searchable or (searchable is None and len(options) >= SEARCH_THRESHOLD):
+            self.index = OptionIndex(self.options.labels)
 
         if default_value is None:
-            default_value = options[0]
+            default_value = self.options[0][1]
         self.default_value = default_value
 
-    def as_widget(self, qid: str) -> RadioSet_:
-        buttons = [RadioButton(x, x == self.default_value) for x in self.options]
+    @property
+    def default_index(self) -> int:
+        """Index of the option pressed by default, -1 if none"""
+        return next((i for i, x in enumerate(self.options) if x[1] == self.default_value), -1)
+
+    def as_widget(self, qid: str) -> "RadioSet_":
+        from textual.widgets import RadioButton  # noqa: PLC0415
+        from textual.widgets import RadioSet as RadioSet_  # noqa: PLC0415
+
+        buttons = [RadioButton(label, value == self.default_value) for label, value in self.options]
         wid = RadioSet_(
             id=qid,
             *buttons,
@@ -382,6 +781,21 @@ class RadioSet(InputType):
 
         return wid
 
-    def inq_ask(self) -> list[str]:
-        # We assume inq.list_input will return a good type
-        return inq.list_input(self.label, choices=self.options, default=self.default_value)  # type: ignore
+    def validate_answer(self, value: object) -> tuple[ValidationResult, Any]:
+        if value is None:
+            return ACCEPTED, self.default_value
+
+        found, option_value = match_option(self.options, value)
+        if not found:
+            return rejected(f"Unknown option: {value}."), None
+        return ACCEPTED, option_value
+
+    def inq_ask(self, default: object = None) -> FieldValueType:
+        import inquirer  # noqa: PLC0415
+
+        # We assume inquirer.list_input will return a good type
+        return inquirer.list_input(
+            self.label,
+            choices=list(self.options),
+            default=self.default_value if default is None else default,
+        )  # type: ignore
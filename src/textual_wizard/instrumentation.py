@@ -0,0 +1,217 @@
+import json
+import time
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from time import perf_counter
+from typing import IO, Callable, Optional, TypedDict
+
+# Opt-in timing of the work done while a wizard runs, to find out where the time goes
+# in the field. Without instrumentation, the TUI only checks for None on the hot paths.
+# With it, durations are added to counters, and sent to the hooks as events.
+
+EVENTS = (
+    "compose",
+    "as_widget",
+    "validation",
+    "async_validation",
+    "register_input",
+    "goto",
+    "conditions",
+    "question_time",
+)
+"""
+Events recorded by the TUI:
+
+- `compose`: Composing the widgets of a stage.
+- `as_widget`: Creating the widget of a question.
+- `validation`: Running the synchronous validators of a text-based question.
+- `async_validation`: Running the async validators of a text-based question.
+- `register_input`: Reading the answer of a question from its widget.
+- `goto`: Moving to another question in paged mode, `question` is the new one.
+- `conditions`: Evaluating the questions depending on an answer that changed,
+    `question` is the one whose answer changed.
+- `question_time`: Time the user spent on a question, from when it got the focus
+    until another question got it or the stage was left.
+"""
+
+
+class InstrumentationEvent(TypedDict):
+    event: str
+    """Name of the event, see EVENTS"""
+
+    question: Optional[str]
+    """Name of the question concerned, if any"""
+
+    stage: Optional[str]
+    """Title of the stage"""
+
+    timestamp: float
+    """Time when the event started, in seconds since the epoch"""
+
+    duration: float
+    """In seconds"""
+
+
+Hook = Callable[[InstrumentationEvent], object]
+
+
+class EventStats(TypedDict):
+    event: str
+    question: Optional[str]
+    count: int
+    total: float
+    """Total duration, in seconds"""
+
+    mean: float
+    max: float
+
+
+class EventTimer:
+    """Context manager measuring the duration of an event"""
+
+    __slots__ = ("instrumentation", "event", "question", "stage", "start")
+
+    def __init__(
+        self,
+        instrumentation: "Instrumentation",
+        event: str,
+        question: Optional[str],
+        stage: Optional[str],
+    ) -> None:
+        self.instrumentation = instrumentation
+        self.event = event
+        self.question = question
+        self.stage = stage
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *_: object) -> None:
+        duration = perf_counter() - self.start
+        self.instrumentation.record(self.event, duration, self.question, self.stage)
+
+
+NO_TIMER: AbstractContextManager[None] = nullcontext()
+"""Used in place of an EventTimer when the instrumentation is disabled"""
+
+
+class Instrumentation:
+    """
+    Collects the durations of the events of a wizard session.
+
+    Durations are always added to counters, by event and question, read with `report`.
+    Each event is also sent to the hooks, like a `JSONLinesExporter`.
+    """
+
+    hooks: list[Hook]
+
+    stats: dict[tuple[str, Optional[str]], list[float]]
+    """Count, total and maximum duration, by event and question name"""
+
+    def __init__(self, *hooks: Hook) -> None:
+        """
+        Initializes an instance of this class.
+
+        Args:
+            hooks: Called with each event as soon as it is recorded.
+        """
+        self.hooks = list(hooks)
+        self.stats = dict()
+
+    def add_hook(self, hook: Hook) -> None:
+        self.hooks.append(hook)
+
+    def record(
+        self,
+        event: str,
+        duration: float,
+        question: Optional[str] = None,
+        stage: Optional[str] = None,
+    ) -> None:
+        """Record an event which lasted `duration` seconds, and ended now"""
+        stats = self.stats.get((event, question))
+        if stats is None:
+            self.stats[(event, question)] = [1, duration, duration]
+        else:
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] = max(stats[2], duration)
+
+        if not self.hooks:
+            return
+        entry: InstrumentationEvent = {
+            "event": event,
+            "question": question,
+            "stage": stage,
+            "timestamp": time.time() - duration,
+            "duration": duration,
+        }
+        for hook in self.hooks:
+            hook(entry)
+
+    def time(
+        self, event: str, question: Optional[str] = None, stage: Optional[str] = None
+    ) -> EventTimer:
+        """Return a context manager recording the time spent in its body"""
+        return EventTimer(self, event, question, stage)
+
+    def report(self) -> list[EventStats]:
+        """Return the statistics of each event and question, the longest total first"""
+        report: list[EventStats] = [
+            {
+                "event": event,
+                "question": question,
+                "count": int(count),
+                "total": total,
+                "mean": total / count,
+                "max": maximum,
+            }
+            for (event, question), (count, total, maximum) in self.stats.items()
+        ]
+        report.sort(key=lambda x: x["total"], reverse=True)
+        return report
+
+    def flush(self) -> None:
+        """Flush the hooks buffering the events"""
+        for hook in self.hooks:
+            flush = getattr(hook, "flush", None)
+            if flush is not None:
+                flush()
+
+    def close(self) -> None:
+        """
+        Close the hooks holding resources, like open files, and flush the others.
+        Called when the wizard exits, the hooks can still be used by the next one.
+        """
+        for hook in self.hooks:
+            close = getattr(hook, "close", None) or getattr(hook, "flush", None)
+            if close is not None:
+                close()
+
+
+class JSONLinesExporter:
+    """
+    A hook writing each event as a line of JSON, appended to a file.
+    Lines are buffered, and written when the wizard exits, which closes the file.
+    It is opened again if more events are recorded.
+    """
+
+    path: Path
+    file: Optional[IO[str]] = None
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def __call__(self, event: InstrumentationEvent) -> None:
+        if self.file is None:
+            self.file = self.path.open("a")
+        self.file.write(json.dumps(event) + "\n")
+
+    def flush(self) -> None:
+        if self.file is not None:
+            self.file.flush()
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
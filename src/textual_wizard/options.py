@@ -0,0 +1,188 @@
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    TypeVar,
+    cast,
+    overload,
+)
+
+# Options of Select and SelectionList questions can be loaded page by page while the wizard runs,
+# instead of being supplied up front. The TUI loads a first page when the question is shown,
+# and the following ones as the user scrolls through the options.
+
+OptionType = TypeVar("OptionType")
+
+PagedOptions = Callable[[int], Awaitable[list[OptionType]]]
+"""Return the page of options with provided index, starting at 0. An empty page ends the options"""
+
+
+class OptionProvider(Generic[OptionType]):
+    """
+    Supplies the options of a `Select` or `SelectionList` page by page,
+    from an async iterable of options or from an async function returning a page of options.
+
+    Loaded options are kept by the provider, so running the wizard again doesn't load them again.
+    Use `clear` to load fresh options. Async generators are closed with the event loop of the
+    wizard, so prefer a paged function when the remaining options must be loaded in a later run.
+    """
+
+    source: AsyncIterable[OptionType] | PagedOptions[OptionType]
+    page_size: int
+    loaded: list[OptionType]
+    """Options loaded so far"""
+
+    complete: bool = False
+    """Whether or not all the options were loaded"""
+
+    next_page: int = 0
+    iterator: Optional[AsyncIterator[OptionType]] = None
+
+    def __init__(
+        self,
+        source: AsyncIterable[OptionType] | PagedOptions[OptionType],
+        *,
+        page_size: int = 100,
+    ) -> None:
+        """
+        Initializes an instance of this class.
+
+        Args:
+            source: An async iterable of options, or an async function taking the index
+                of a page and returning its options. Options have the same form as the options
+                supplied to the question.
+            page_size: The number of options read from an async iterable at once.
+        """
+        self.source = source
+        self.page_size = page_size
+        self.loaded = list()
+
+    def clear(self) -> None:
+        """Forget the loaded options, they will be loaded again from the first page"""
+        self.loaded = list()
+        self.complete = False
+        self.next_page = 0
+        self.iterator = None
+
+    async def fetch(self) -> list[OptionType]:
+        """Load the next page of options and return it, an empty page once all are loaded"""
+        if self.complete:
+            return list()
+
+        if isinstance(self.source, AsyncIterable):
+            if self.iterator is None:
+                self.iterator = aiter(self.source)
+            page = list()
+            while len(page) < self.page_size:
+                try:
+                    page.append(await anext(self.iterator))
+                except StopAsyncIteration:
+                    self.complete = True
+                    break
+        else:
+            page = list(await self.source(self.next_page))
+            self.next_page += 1
+            self.complete = len(page) == 0
+
+        self.loaded += page
+        return page
+
+    async def fetch_all(self) -> list[OptionType]:
+        """Load all the remaining options, and return all the options"""
+        while not self.complete:
+            await self.fetch()
+        return self.loaded
+
+
+# -------------------- Option store
+# Wizards generated from templates may define thousands of questions and hundreds of thousands
+# of options. Options are stored in parallel lists rather than one tuple per option,
+# and the tuples are only built when the options are read.
+
+StoredOption = TypeVar("StoredOption", bound=tuple[Any, ...])
+
+
+class OptionStore(Sequence[StoredOption]):
+    """
+    The normalized options of a question, stored as parallel lists of labels and values.
+    The selected flags of the options of a `SelectionList` are stored in a bitset.
+
+    Reading an option returns the same tuple as before it was stored:
+    `(label, value)`, or `(label, value, selected)` when the options have flags.
+    """
+
+    __slots__ = ("labels", "values", "flags")
+
+    labels: list[str]
+    values: list[Any]
+    flags: Optional[bytearray]
+    """One bit per option telling whether or not it is selected, None if options have no flag"""
+
+    def __init__(self, options: Iterable[StoredOption] = (), *, flags: bool = False) -> None:
+        self.labels = list()
+        self.values = list()
+        self.flags = bytearray() if flags else None
+        self.extend(options)
+
+    def extend(self, options: Iterable[StoredOption]) -> None:
+        """Add options after the existing ones"""
+        labels, values, flags = self.labels, self.values, self.flags
+        for option in options:
+            i = len(labels)
+            labels.append(option[0])
+            values.append(option[1])
+            if flags is not None:
+                if i % 8 == 0:
+                    flags.append(0)
+                if option[2]:
+                    flags[i >> 3] |= 1 << (i & 7)
+
+    def __iadd__(self, options: Iterable[StoredOption]) -> "OptionStore[StoredOption]":
+        self.extend(options)
+        return self
+
+    def is_flagged(self, i: int) -> bool:
+        """Whether or not the option with provided index is selected"""
+        return self.flags is not None and bool(self.flags[i >> 3] >> (i & 7) & 1)
+
+    def flagged_values(self) -> list[Any]:
+        """Return the values of the selected options"""
+        return [x for i, x in enumerate(self.values) if self.is_flagged(i)]
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @overload
+    def __getitem__(self, i: int) -> StoredOption: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[StoredOption]: ...
+
+    def __getitem__(self, i: int | slice) -> StoredOption | list[StoredOption]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if self.flags is None:
+            return cast(StoredOption, (self.labels[i], self.values[i]))
+        return cast(StoredOption, (self.labels[i], self.values[i], self.is_flagged(i)))
+
+    def __iter__(self) -> Iterator[StoredOption]:
+        if self.flags is None:
+            return cast(Iterator[StoredOption], zip(self.labels, self.values))
+        flags = (self.is_flagged(i) for i in range(len(self)))
+        return cast(Iterator[StoredOption], zip(self.labels, self.values, flags))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(self) == list(other)
+
+    __hash__ = None  # type: ignore[assignment]
@@ -0,0 +1,79 @@
+from typing import Iterable
+
+# Type to filter search in the options of Select, SelectionList and RadioSet questions.
+# Labels are indexed once, when the question is created, so each keystroke only looks at
+# the options that may match instead of comparing the query to every label.
+
+
+class OptionIndex:
+    """
+    Finds the options whose label contains a query, ignoring the case.
+
+    Each label is indexed by its lowercase characters, bigrams and trigrams: queries of up to
+    3 characters are looked up directly, and longer ones are only compared to the labels
+    containing their rarest trigram. A query extending the previous one is only compared
+    to the previous results, like when the user types.
+    """
+
+    labels: list[str]
+    """Lowercase labels of the options"""
+
+    grams: dict[str, list[int]]
+    """Indexes of the labels containing each character, bigram and trigram, in ascending order"""
+
+    last_query: str = ""
+    last_results: list[int]
+
+    def __init__(self, labels: Iterable[str] = ()) -> None:
+        self.labels = list()
+        self.grams = dict()
+        self.last_results = list()
+        self.add(labels)
+
+    def add(self, labels: Iterable[str]) -> None:
+        """Index the labels of new options, added after the existing ones"""
+        new_labels = [x.lower() for x in labels]
+        grams = self.grams
+        for i, label in enumerate(new_labels, len(self.labels)):
+            bigrams = (label[j : j + 2] for j in range(len(label) - 1))
+            trigrams = (label[j : j + 3] for j in range(len(label) - 2))
+            for gram in {*label, *bigrams, *trigrams}:
+                postings = grams.get(gram)
+                if postings is None:
+                    grams[gram] = [i]
+                else:
+                    postings.append(i)
+        self.labels += new_labels
+
+        # New options may match the last query
+        self.last_query = ""
+
+    def search(self, query: str) -> list[int]:
+        """Return the indexes of the options whose label contains the query, in ascending order"""
+        query = query.lower()
+        if query == "":
+            return list(range(len(self.labels)))
+
+        if len(query) <= 3:
+            results = list(self.grams.get(query, []))
+        else:
+            results = self.search_candidates(query)
+
+        self.last_query = query
+        self.last_results = results
+        return results
+
+    def search_candidates(self, query: str) -> list[int]:
+        """Search a query of more than 3 characters in the labels that may contain it"""
+        # Labels containing the query contain all its trigrams, the rarest one is used
+        candidates = min(
+            (self.grams.get(query[j : j + 3], []) for j in range(len(query) - 2)), key=len
+        )
+        if (
+            self.last_query
+            and self.last_query in query
+            and len(self.last_results) < len(candidates)
+        ):
+            candidates = self.last_results
+        labels = self.labels
+        return [i for i in candidates if query in labels[i]]
@@ -0,0 +1,159 @@
+import json
+from collections import defaultdict
+from pathlib import Path
+from time import perf_counter, process_time
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypedDict
+
+from textual_wizard.exceptions import InvalidSession
+
+if TYPE_CHECKING:
+    from textual_wizard.app import WizardApp
+
+# The keys, pastes and button clicks received by a wizard can be recorded to a file,
+# then replayed through Textual's Pilot against the same questions, at full speed or with
+# the recorded timings. A reported slow interaction then becomes a reproducible test.
+
+SESSION_FORMAT = 1
+
+EventType = Literal["key", "paste", "click"]
+
+
+class SessionEvent(TypedDict):
+    type: EventType
+    time: float
+    """Seconds since the wizard was shown"""
+
+    value: str
+    """Name of the key, pasted text, or id of the clicked button"""
+
+
+class Session(TypedDict):
+    size: tuple[int, int]
+    """Size of the terminal, in cells"""
+
+    events: list[SessionEvent]
+
+
+class SessionRecorder:
+    """Records the events received by a wizard, see `WizardApp.recorder`"""
+
+    events: list[SessionEvent]
+    size: tuple[int, int] = (80, 24)
+    start: float
+
+    def __init__(self) -> None:
+        self.events = list()
+        self.start = perf_counter()
+
+    def restart(self, size: tuple[int, int]) -> None:
+        """Start recording, once the wizard is shown in a terminal of provided size"""
+        self.events = list()
+        self.size = size
+        self.start = perf_counter()
+
+    def record(self, event_type: EventType, value: str) -> None:
+        self.events.append(
+            {"type": event_type, "time": perf_counter() - self.start, "value": value}
+        )
+
+    def session(self) -> Session:
+        return {"size": self.size, "events": list(self.events)}
+
+    def save(self, path: str | Path) -> None:
+        session = self.session()
+        content = {"format": SESSION_FORMAT, "size": session["size"], "events": session["events"]}
+        Path(path).write_text(json.dumps(content, indent=1) + "\n")
+
+
+def read_session(path: str | Path) -> Session:
+    """Read a session saved by a `SessionRecorder`"""
+    try:
+        content = json.loads(Path(path).read_text())
+        if content["format"] != SESSION_FORMAT:
+            raise InvalidSession(f"{path} has an unsupported format: {content['format']}.")
+        width, height = content["size"]
+        events: list[SessionEvent] = [
+            {"type": x["type"], "time": float(x["time"]), "value": str(x["value"])}
+            for x in content["events"]
+        ]
+    except (OSError, ValueError, TypeError, KeyError) as e:
+        raise InvalidSession(f"{path} is not a valid session: {e}") from e
+    return {"size": (int(width), int(height)), "events": events}
+
+
+class ReplayReport(TypedDict):
+    answers: Optional[dict[str, Any]]
+    """Answers returned by the wizard, None if it didn't complete"""
+
+    replayed: int
+    """Number of events replayed, the following ones are ignored once the wizard exits"""
+
+    latencies: dict[str, dict[str, float]]
+    """
+    Statistics of the time taken to handle each type of event, in seconds. It includes
+    the polling of Pilot, which waits for the app to be idle by sleeping a few milliseconds
+    """
+
+    cpu_times: dict[str, dict[str, float]]
+    """Statistics of the CPU time spent handling each type of event, without the sleeps"""
+
+
+async def replay_session(
+    app: "WizardApp", session: Session, *, realtime: bool = False
+) -> ReplayReport:
+    """
+    Replay a recorded session against a wizard, headlessly, and measure the time taken to handle
+    each event, until the screen is refreshed and the app is idle.
+
+    Args:
+        app: The wizard, asking the same questions as the recorded one.
+        session: The recorded events.
+        realtime: Wait between the events like the user did, so timers and background work
+            like async validation or option loading run as they did. Otherwise, each event is
+            sent as soon as the previous one is handled.
+    """
+    import asyncio  # noqa: PLC0415
+
+    from textual.css.query import NoMatches  # noqa: PLC0415
+    from textual.events import Paste  # noqa: PLC0415
+    from textual.widgets import Button  # noqa: PLC0415
+
+    from textual_wizard.benchmark import summarize  # noqa: PLC0415
+
+    samples: dict[str, list[float]] = defaultdict(list)
+    cpu_samples: dict[str, list[float]] = defaultdict(list)
+    replayed = 0
+    async with app.run_test(size=session["size"]) as pilot:
+        await pilot.pause()
+        start = perf_counter()
+        for event in session["events"]:
+            if app.return_code is not None:
+                break
+            if realtime:
+                await asyncio.sleep(max(0, start + event["time"] - perf_counter()))
+
+            begin, begin_cpu = perf_counter(), process_time()
+            if event["type"] == "key":
+                await pilot.press(event["value"])
+            elif event["type"] == "paste":
+                app.post_message(Paste(event["value"]))
+                await pilot.pause()
+            else:
+                try:
+                    button = app.screen.query_one(f"#{event['value']}", Button)
+                except NoMatches as e:
+                    raise InvalidSession(
+                        f"Button {event['value']} was clicked, but it is not on the screen."
+                    ) from e
+                button.press()
+                await pilot.pause()
+            samples[event["type"]].append(perf_counter() - begin)
+            cpu_samples[event["type"]].append(process_time() - begin_cpu)
+            replayed += 1
+
+    return {
+        "answers": app.return_value,
+        "replayed": replayed,
+        "latencies": {x: summarize(durations) for x, durations in samples.items()},
+        "cpu_times": {x: summarize(durations) for x, durations in cpu_samples.items()},
+    }
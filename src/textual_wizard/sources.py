@@ -0,0 +1,203 @@
+import json
+import os
+import re
+import sys
+from abc import ABC, abstractmethod
+from collections.abc import Coroutine
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional, Sequence, TextIO
+
+from textual_wizard.conditions import MISSING, ConditionGraph, compile_conditions
+from textual_wizard.exceptions import InvalidAnswer
+from textual_wizard.inputs import InputType
+
+# Answer sources supply answers without asking the user, when the TUI is disabled.
+# Answers are validated by the questions, and only the missing ones are asked with Inquirer.
+
+AnswerCallback = Callable[[str, Any], object]
+"""
+Called with the name of a question and its answer as soon as it is known, before the wizard
+is completed. Async callbacks run in the background while the user answers the next questions.
+"""
+
+
+class AnswerSource(ABC):
+    """Base class for all answer sources."""
+
+    @abstractmethod
+    def get(self, name: str) -> object:
+        """Return the answer to the question with provided name, None if it is missing."""
+
+
+class DictSource(AnswerSource):
+    """Answers supplied by a mapping of question names to answers."""
+
+    answers: Mapping[str, object]
+
+    def __init__(self, answers: Mapping[str, object]) -> None:
+        self.answers = answers
+
+    def get(self, name: str) -> object:
+        return self.answers.get(name)
+
+
+class FileSource(DictSource):
+    """
+    Answers read from a JSON or YAML file, containing a mapping of question names to answers.
+    YAML files require PyYAML to be installed.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Initializes an instance of this class.
+
+        Args:
+            path: The path of the file, YAML is used if it ends with `.yaml` or `.yml`.
+        """
+        path = Path(path)
+        content = path.read_text()
+
+        if path.suffix in (".yaml", ".yml"):
+            try:
+                import yaml  # noqa: PLC0415
+            except ImportError as e:
+                raise ImportError("PyYAML must be installed to read answers from YAML.") from e
+            answers = yaml.safe_load(content)
+        else:
+            answers = json.loads(content)
+
+        if not isinstance(answers, dict):
+            raise InvalidAnswer(f"{path} must contain a mapping of question names to answers.")
+        super().__init__(answers)
+
+
+class StdinSource(DictSource):
+    """
+    Answers read from a line-delimited stream, standard input by default.
+    Each line has the form `name=value`, and the stream is read until its end on first use.
+    """
+
+    stream: TextIO
+    loaded: bool = False
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        super().__init__(dict())
+        self.stream = sys.stdin if stream is None else stream
+
+    def get(self, name: str) -> object:
+        if not self.loaded:
+            answers = dict()
+            for line in self.stream:
+                key, separator, value = line.rstrip("\r\n").partition("=")
+                if separator:
+                    answers[key.strip()] = value
+            self.answers = answers
+            self.loaded = True
+        return super().get(name)
+
+
+class EnvSource(AnswerSource):
+    """
+    Answers read from environment variables named `PREFIX_NAME`,
+    where NAME is the name of the question in upper case.
+    """
+
+    prefix: str
+    environ: Mapping[str, str]
+
+    def __init__(self, prefix: str, environ: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Initializes an instance of this class.
+
+        Args:
+            prefix: Prefix of the environment variables, without the trailing underscore.
+            environ: The environment variables to use, defaults to `os.environ`.
+        """
+        self.prefix = prefix
+        self.environ = os.environ if environ is None else environ
+
+    def get(self, name: str) -> object:
+        variable = re.sub(r"\W", "_", f"{self.prefix}_{name}").upper()
+        return self.environ.get(variable)
+
+
+def get_answer(sources: Sequence[AnswerSource], name: str) -> object:
+    """Return the answer from the first source that has one, None if it is missing."""
+    for source in sources:
+        value = source.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+def resolve_answers(
+    questions: Sequence[InputType],
+    sources: Sequence[AnswerSource],
+    *,
+    prompt_missing: bool = True,
+    title: Optional[str] = None,
+    on_answer: Optional[AnswerCallback] = None,
+    conditions: Optional[ConditionGraph] = None,
+) -> dict[str, Any]:
+    """
+    Return the answers to the questions, taken from the sources,
+    and asked with Inquirer when they are missing or invalid.
+    Questions whose condition doesn't hold are skipped, and their answer is None.
+
+    Args:
+        questions: The questions to answer.
+        sources: The answer sources, the first one having an answer is used.
+        prompt_missing: Ask missing and invalid answers with Inquirer. If disabled,
+            missing answers use the default value of the question,
+            and an `InvalidAnswer` exception is raised if they are not valid.
+        title: Printed before asking the first question, if any.
+        on_answer: Called with the name and the answer of each question, as soon as it is known.
+            Without the TUI, async callbacks are run to completion before the next question.
+        conditions: The compiled conditions of the questions of all the stages, when they are
+            answered stage by stage. Defaults to the ones of the provided questions.
+    """
+    if conditions is None:
+        conditions = compile_conditions(questions)
+
+    answers = dict()
+    for question in questions:
+        default = None
+        if conditions is not None:
+            conditions.evaluate(question.name)
+            if conditions.is_skipped(question.name):
+                answers[question.name] = None
+                continue
+            computed = conditions.get_default(question.name)
+            default = None if computed is MISSING else computed
+
+        value = get_answer(sources, question.name)
+        answered = False
+
+        if value is not None or not prompt_missing:
+            result, answer = question.validate_answer(default if value is None else value)
+            if result.valid:
+                answers[question.name] = answer
+                answered = True
+            elif not prompt_missing:
+                raise InvalidAnswer(
+                    f"Invalid answer to the question '{question.name}': {result.failure_reason}"
+                )
+            else:
+                print(result.failure_reason)
+
+        if not answered:
+            if title is not None:
+                print(title)
+                title = None
+            answers[question.name] = question.inq_ask(default)
+        if conditions is not None:
+            conditions.update(question.name, answers[question.name])
+
+        if on_answer is not None:
+            callback_result = on_answer(question.name, answers[question.name])
+            if isinstance(callback_result, Coroutine):
+                import asyncio  # noqa: PLC0415
+
+                asyncio.run(callback_result)
+
+    return answers
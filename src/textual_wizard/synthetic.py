@@ -0,0 +1,82 @@
+from typing import Literal, Sequence
+
+from textual_wizard.inputs import (
+    URL,
+    Email,
+    InputType,
+    Integer,
+    Number,
+    RadioSet,
+    Select,
+    SelectionList,
+    Text,
+)
+from textual_wizard.wizard import Stages, WizardStage
+
+# Synthetic wizards, reproducing the scaling problems of large forms. They are generated
+# without loading Textual, so the command line can offer their options at startup.
+
+InputKind = Literal[
+    "text", "email", "url", "integer", "number", "select", "selection_list", "radio_set", "mixed"
+]
+
+MIXED_KINDS: tuple[InputKind, ...] = ("text", "select", "integer", "selection_list", "radio_set")
+"""Input types cycled through by "mixed" wizards"""
+
+
+def synthetic_question(name: str, kind: InputKind, option_count: int) -> InputType:
+    """Create a question of provided type, accepting its default answer"""
+    label = f"Question {name}"
+    options = [f"Option {i}" for i in range(option_count)]
+    match kind:
+        case "text":
+            return Text(name, label, allow_blank=True)
+        case "email":
+            return Email(name, label, allow_blank=True)
+        case "url":
+            return URL(name, label, allow_blank=True)
+        case "integer":
+            return Integer(name, label, allow_blank=True)
+        case "number":
+            return Number(name, label, allow_blank=True)
+        case "select":
+            return Select(name, label, options=options)
+        case "selection_list":
+            return SelectionList(name, label, options=[(x, x, False) for x in options])
+        case "radio_set":
+            return RadioSet(name, label, options=options)
+        case "mixed":
+            raise ValueError("Mixed wizards are built by synthetic_questions.")
+
+
+def synthetic_questions(
+    count: int,
+    kind: InputKind | Sequence[InputKind] = "mixed",
+    option_count: int = 10,
+    prefix: str = "q",
+) -> list[InputType]:
+    """
+    Create questions named `{prefix}{index}`, all of the same type, or cycling through
+    a list of types. "mixed" cycles through the common types.
+    """
+    kinds = (kind,) if isinstance(kind, str) else tuple(kind)
+    if "mixed" in kinds:
+        kinds = MIXED_KINDS
+    return [
+        synthetic_question(f"{prefix}{i}", kinds[i % len(kinds)], option_count)
+        for i in range(count)
+    ]
+
+
+def synthetic_stages(
+    stage_count: int,
+    question_count: int,
+    kind: InputKind | Sequence[InputKind] = "mixed",
+    option_count: int = 10,
+) -> Stages:
+    """Create stages of `question_count` synthetic questions each, with unique names"""
+    stages: list[WizardStage] = list()
+    for i in range(stage_count):
+        questions = synthetic_questions(question_count, kind, option_count, prefix=f"s{i}q")
+        stages.append({"title": f"Stage {i}", "questions": questions})
+    return stages
@@ -0,0 +1,315 @@
+import math
+import re
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import cached_property
+from typing import TYPE_CHECKING, Callable, Generic, Optional, Sequence, TypeVar
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from textual.validation import Validator
+
+# Validation of the answers to text-based questions.
+# The built-in rules don't depend on Textual, so answers can be validated without importing it,
+# when the TUI is disabled. Textual validators supplied by the user are supported as well.
+
+
+class ValidationResult:
+    valid: bool = True
+    failure_reason: str
+
+
+ACCEPTED = ValidationResult()
+"""Shared result returned for every accepted value, it must not be modified"""
+
+
+def rejected(failure_reason: str) -> ValidationResult:
+    """Return the result of a value that is not accepted"""
+    result = ValidationResult()
+    result.failure_reason = failure_reason
+    result.valid = False
+    return result
+
+
+KeyType = TypeVar("KeyType")
+CachedType = TypeVar("CachedType")
+
+
+class LRUCache(Generic[KeyType, CachedType]):
+    """A mapping keeping at most `max_size` items, evicting the least recently used ones."""
+
+    __slots__ = ("max_size", "items")
+
+    max_size: int
+    items: OrderedDict[KeyType, CachedType]
+
+    def __init__(self, max_size: int = 128) -> None:
+        self.max_size = max_size
+        self.items = OrderedDict()
+
+    def get(self, key: KeyType) -> Optional[CachedType]:
+        """Return the item cached for the key, or None"""
+        item = self.items.get(key)
+        if item is not None:
+            self.items.move_to_end(key)
+        return item
+
+    def put(self, key: KeyType, item: CachedType) -> None:
+        self.items[key] = item
+        self.items.move_to_end(key)
+        if len(self.items) > self.max_size:
+            self.items.popitem(last=False)
+
+
+# -------------------- Rules
+# Rules are the built-in validators of the questions, equivalent to the Textual validators
+# with the same name. Their check returns a boolean instead of building a result object.
+
+
+class Rule(ABC):
+    """A validation rule of text-based questions, which doesn't depend on Textual."""
+
+    failure_description: str
+    cost: int = 0
+    """Used to order the rules, the cheapest ones are checked first"""
+
+    pure: bool = True
+    """Rules only depend on the validated value, so their results can be cached"""
+
+    def __init__(self, failure_description: str) -> None:
+        self.failure_description = failure_description
+
+    @abstractmethod
+    def check(self, value: str) -> bool:
+        """Return whether or not the value is valid."""
+
+    def compile(self) -> "Check":
+        """Return a function equivalent to `check`, used when validating values"""
+        return self.check
+
+    def __getstate__(self) -> dict[str, object]:
+        # The compiled check may be a closure, which can't be pickled
+        state = self.__dict__.copy()
+        state.pop("compiled", None)
+        return state
+
+    @cached_property
+    def compiled(self) -> "CompiledValidator":
+        """The compiled check and failure description, shared by the questions using the rule"""
+        failure_description = self.failure_description
+        return self.compile(), lambda _: failure_description
+
+
+class LengthRule(Rule):
+    """Checks the number of characters of the value."""
+
+    minimum: Optional[int]
+    maximum: Optional[int]
+
+    def __init__(
+        self,
+        minimum: Optional[int] = None,
+        maximum: Optional[int] = None,
+        failure_description: str = "Invalid length.",
+    ) -> None:
+        super().__init__(failure_description)
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def check(self, value: str) -> bool:
+        return (self.minimum is None or len(value) >= self.minimum) and (
+            self.maximum is None or len(value) <= self.maximum
+        )
+
+
+class NumberRule(Rule):
+    """Checks that the value is a finite number, optionally an integer within bounds."""
+
+    cost = 1
+    minimum: Optional[float]
+    maximum: Optional[float]
+    integer: bool
+
+    def __init__(
+        self,
+        minimum: Optional[float] = None,
+        maximum: Optional[float] = None,
+        *,
+        integer: bool = False,
+        failure_description: Optional[str] = None,
+    ) -> None:
+        if failure_description is None:
+            kind = "integer" if integer else "number"
+            failure_description = f"Must be a valid {kind}."
+        super().__init__(failure_description)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.integer = integer
+
+    def check(self, value: str) -> bool:
+        try:
+            number = float(value)
+            if self.integer:
+                int(value)
+        except ValueError:
+            return False
+        if math.isnan(number) or math.isinf(number):
+            return False
+        return (self.minimum is None or number >= self.minimum) and (
+            self.maximum is None or number <= self.maximum
+        )
+
+
+class RegexRule(Rule):
+    """Checks that the whole value matches a regular expression."""
+
+    cost = 2
+    regex: str | re.Pattern[str]
+    flags: int | re.RegexFlag
+
+    def __init__(
+        self,
+        regex: str | re.Pattern[str],
+        flags: int | re.RegexFlag = 0,
+        failure_description: str = "Must match the expected format.",
+    ) -> None:
+        super().__init__(failure_description)
+        self.regex = regex
+        self.flags = flags
+
+    @cached_property
+    def pattern(self) -> re.Pattern[str]:
+        # Compiled on first use, the rules of the built-in questions are created on import
+        if isinstance(self.regex, re.Pattern):
+            return self.regex
+        return re.compile(self.regex, self.flags)
+
+    def check(self, value: str) -> bool:
+        return self.pattern.fullmatch(value) is not None
+
+    def compile(self) -> "Check":
+        fullmatch = self.pattern.fullmatch
+        return lambda value: fullmatch(value) is not None
+
+
+class URLRule(Rule):
+    """Checks that the value is an URL with a scheme and a location."""
+
+    cost = 2
+
+    def __init__(self, failure_description: str = "Must be a valid URL.") -> None:
+        super().__init__(failure_description)
+
+    def check(self, value: str) -> bool:
+        try:
+            parsed_url = urlparse(value)
+        except ValueError:
+            return False
+        return bool(parsed_url.scheme and parsed_url.netloc)
+
+
+def is_pure(validator: "Validator | Rule") -> bool:
+    """
+    Whether or not the result of a validator only depends on the validated value.
+    Custom validators can declare it with a `pure` attribute.
+    """
+    pure = getattr(validator, "pure", None)
+    if pure is not None:
+        return pure
+
+    # Textual is already imported, since the validator is a Textual one
+    from textual.validation import URL, Integer, Length, Number, Regex  # noqa: PLC0415
+
+    return isinstance(validator, (Length, Regex, Integer, Number, URL))
+
+
+# -------------------- Compiled validators
+# Textual validators build a ValidationResult for every value they check.
+# Questions compile their validators into plain checks returning a boolean,
+# ordered from the cheapest to the most expensive. The failure is only described
+# when a check fails.
+
+Check = Callable[[str], bool]
+Describe = Callable[[str], Optional[str]]
+"""Return the failure description of a value, None if it is valid"""
+CompiledValidator = tuple[Optional[Check], Describe]
+
+
+def as_rule(validator: "Validator") -> Optional[Rule]:
+    """Return the rule equivalent to a Textual validator, None if there isn't any"""
+    from textual.validation import URL, Integer, Length, Number, Regex  # noqa: PLC0415
+
+    if isinstance(validator, Length):
+        return LengthRule(validator.minimum, validator.maximum)
+    if isinstance(validator, Number):
+        integer = isinstance(validator, Integer)
+        return NumberRule(validator.minimum, validator.maximum, integer=integer)
+    if isinstance(validator, Regex):
+        return RegexRule(validator.regex, validator.flags)
+    if isinstance(validator, URL):
+        return URLRule()
+    return None
+
+
+def describe_with(validator: "Validator") -> Describe:
+    def describe(value: str) -> Optional[str]:
+        validation = validator.validate(value)
+        return None if validation.is_valid else validation.failure_descriptions[0]
+
+    return describe
+
+
+def compile_validator(validator: "Validator | Rule") -> tuple[int, CompiledValidator]:
+    """
+    Return a check equivalent to a validator and the function describing its failures,
+    with its cost used to order the checks. The check is None if the validator can't be
+    compiled, in which case the validator is only called to describe the failure.
+    """
+    if isinstance(validator, Rule):
+        return validator.cost, validator.compiled
+
+    # Textual validators describe their own failures
+    from textual.validation import Function  # noqa: PLC0415
+
+    describe = describe_with(validator)
+    rule = as_rule(validator)
+    if rule is not None:
+        return rule.cost, (rule.compile(), describe)
+    if isinstance(validator, Function):
+        return 3, (validator.function, describe)
+
+    # Unknown validators are called as is, after the others
+    return 4, (None, describe)
+
+
+def compile_validators(validators: "Sequence[Validator | Rule]") -> list[CompiledValidator]:
+    """Compile validators into checks, cheapest first"""
+    compiled = [compile_validator(x) for x in validators]
+    # The sort is stable, so validators of the same cost keep their order
+    compiled.sort(key=lambda x: x[0])
+    return [x for _, x in compiled]
+
+
+class AsyncValidator(ABC):
+    """
+    Base class for validators taking time to run, like checking that a username is available.
+
+    Async validators run in a Textual worker once all the synchronous validators succeeded,
+    so they don't freeze the user interface. Blocking code should be run with
+    `asyncio.to_thread`.
+    """
+
+    failure_description: str
+
+    def __init__(self, failure_description: str = "This value is not valid.") -> None:
+        """
+        Initializes an instance of this class.
+
+        Args:
+            failure_description: The error displayed to the user when the value is not valid.
+        """
+        self.failure_description = failure_description
+
+    @abstractmethod
+    async def is_valid(self, value: str) -> bool:
+        """Return whether or not the value is valid."""
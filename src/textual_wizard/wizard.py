@@ -1,302 +1,85 @@
-from typing import Any, Optional, ReadOnly, Sequence, TypedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Optional, ReadOnly, Sequence, TypedDict
 
-from textual import on
-from textual.app import App, ComposeResult
-from textual.containers import Container, Horizontal
-from textual.reactive import reactive
-from textual.widget import Widget
-from textual.widgets import Button, Header, Input, Label, RadioButton
-from textual.widgets import RadioSet as RadioSet_
-from textual.widgets import Select as Select_
-from textual.widgets import SelectionList as SelectionList_
-from textual.widgets._select import NoSelection
+from textual_wizard.batch import Record, RecordReport, validate_many
+from textual_wizard.checkpoint import Checkpoint
+from textual_wizard.conditions import compile_conditions
+from textual_wizard.inputs import InputType
+from textual_wizard.instrumentation import Instrumentation
+from textual_wizard.sources import AnswerCallback, AnswerSource, resolve_answers
 
-from textual_wizard.exceptions import QuestionNameNotUnique
-from textual_wizard.inputs import BaseText, InputType, ValidationResult
+if TYPE_CHECKING:
+    import asyncio
 
+    from textual_wizard.app import WizardApp
 
-class WizardApp(App[dict[str, Any]]):
-    questions: Sequence[InputType]
-    """Questions supplied by the user"""
+# Textual is only imported when a wizard runs with the TUI, see `textual_wizard.app`.
 
-    answers: dict[str, Any]
-    """Answers to return when the wizard is completed"""
 
-    single_page: bool
-    """Show all the questions on a single page"""
+class WizardStage(TypedDict):
+    title: ReadOnly[str]
+    questions: ReadOnly[Sequence[InputType]]
+
+
+Stages = Sequence[WizardStage]
 
-    allow_back: bool = False
+
+def __getattr__(name: str) -> object:
+    # The Textual application used to be defined in this module
+    if name in ("WizardApp", "WizardScreen"):
+        from textual_wizard import app  # noqa: PLC0415
+
+        return getattr(app, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def open_checkpoint(path: Optional[str | Path], resume: bool) -> Optional[Checkpoint]:
+    """Return the checkpoint of a wizard run, None if checkpoints are disabled"""
+    return None if path is None else Checkpoint(path, resume=resume)
+
+
+def close_checkpoint(
+    checkpoint: Optional[Checkpoint], answers: Optional[dict[str, Any]]
+) -> Optional[dict[str, Any]]:
     """
-    Allow the user to click the previous button while on the first question,
-    which will return None, and set go_back.
+    Remove the checkpoint of a completed wizard, or wait for it to be written if the wizard
+    was cancelled, so it can be resumed. Return the answers.
     """
-
-    go_back: bool
+    if checkpoint is not None:
+        if answers is None:
+            checkpoint.flush()
+        else:
+            checkpoint.clear()
+    return answers
+
+
+def with_checkpoint(
+    checkpoint: Optional[Checkpoint],
+    sources: Sequence[AnswerSource],
+    on_answer: Optional[AnswerCallback],
+) -> tuple[Sequence[AnswerSource], Optional[AnswerCallback]]:
     """
-    True if back button was clicked while on the first question.
-    Used to go back to the previous stage.
+    Return the answer sources and the answer callback used without the TUI:
+    saved answers are taken first, and each new answer is saved before calling on_answer.
     """
+    if checkpoint is None:
+        return sources, on_answer
 
-    CSS_PATH = "wizard.tcss"
-
-    # -------------------- Validation error handling
-    # Validation of the input is triggered:
-    # - On input change
-    # - When the next button is clicked
-
-    error_labels: list[Label]
-    """Widgets showing invalid input errors below the input widgets"""
-
-    error_texts: reactive[list[str | None]] = reactive([])
-    """The description of the currently shown invalid input errors"""
-
-    def set_error(self, error: str | None, index: int) -> None:
-        """Set the input error text for the current input widget"""
-        self.error_texts[index] = error
-        self.error_texts_updated()
-
-    def error_texts_updated(self) -> None:
-        """Update the error labels on the screen when an element inside error_labels changes."""
-        next_button_disabled = False
-
-        for i, error_text in enumerate(self.error_texts):
-            if error_text is None:
-                # If there is no error, hide the error label,
-                # Put the input widget in normal mode
-                self.error_labels[i].add_class("hidden")
-                self.input_widgets[i].remove_class("invalid")
-            else:
-                # If there is an error, put the input widget in invalid mode
-                # Show the error label and update it's content
-                self.input_widgets[i].add_class("invalid")
-                self.error_labels[i].remove_class("hidden")
-                self.error_labels[i].update(error_text)
-                next_button_disabled = True
-        self.next_button.disabled = next_button_disabled
-
-    def on_input_changed(self, message: Input.Changed) -> None:
-        """Validate the input at every change"""
-        qid = self.get_question_id(message.input)
-        if qid is None:
-            raise Exception("Encountered an input widget with id None")
-
-        question = self.questions[qid]
-        if isinstance(question, BaseText):
-            self.handle_validation_result(question.is_value_accepted(message.value), qid)
-
-    def handle_validation_result(self, vr: ValidationResult, qid: int) -> bool:
-        """Handles the result of every input validation"""
-
-        # There is a better way to do that but the linter isnt happy
-        if vr.valid:
-            self.set_error(None, qid)
-            return True
-
-        self.set_error(vr.failure_reason, qid)
-        return False
-
-    def validate_current_input(self) -> bool:
-        """Triggers a validation for the current input"""
-        if self.single_page:
-            raise Exception("validate_current_input should not be called in single_page mode.")
-        return self.validate_input(self.question_index)
-
-    def validate_input(self, qid: int) -> bool:
-        """Triggers a validation for the given question ID"""
-        wid = self.input_widgets[qid]
-
-        if isinstance(wid, Input):
-            question = self.questions[qid]
-            if not isinstance(question, BaseText):
-                raise Exception(
-                    "We assume the current question is text based if the current"
-                    "widget is a textual Input."
-                )
-            results = question.is_value_accepted(wid.value)
-            return self.handle_validation_result(results, self.question_index)
-        # If the current widget is not an Input, it must be a Select, so no validation required.
-        return True
-
-    def validate_all_inputs(self) -> bool:
-        result = True
-        for i in range(len(self.questions)):
-            result = result and self.validate_input(i)
-
-        return result
-
-    # -------------------- Switching between questions
-    back_button: Button
-    next_button: Button
-
-    question_index: int = 0
-    """Index of the current question within self.questions"""
-
-    input_widgets: list[Input | Select_ | SelectionList_ | RadioSet_]
-    """List of all the input widgets, matching the index of items in self.questions"""
-
-    @property
-    def active_input(self) -> Input | Select_ | SelectionList_ | RadioSet_:
-        if self.single_page:
-            raise Exception("active_input should not be called in single_page mode.")
-        return self.input_widgets[self.question_index]
-
-    @property
-    def selected_question(self) -> InputType:
-        if self.single_page:
-            raise Exception("selected_question should not be called in single_page mode.")
-        return self.questions[self.question_index]
-
-    def register_input(self, qid: int) -> None:
-        """Registers the value of the input at the provided index into self.answers"""
-        value: Any = None
-        wid = self.input_widgets[qid]
-        question = self.questions[qid]
-        if isinstance(wid, Select_):
-            value = wid.value
-            if isinstance(value, NoSelection):
-                value = None
-        elif isinstance(wid, SelectionList_):
-            value = wid.selected
-        elif isinstance(wid, RadioSet_) and wid._selected is not None:
-            value = str(wid.query(RadioButton)[wid._selected].label)
-        elif isinstance(question, BaseText) and isinstance(wid, Input):
-            value = question.parse_result(wid.value)
-
-        self.answers[question.name] = value
-
-    def register_all_inputs(self) -> None:
-        """Registers the value of all the inputs into self.answers"""
-        for i in range(len(self.questions)):
-            self.register_input(i)
-
-    def goto(self, question_index: int) -> None:
-        """Go to the question with provided index"""
-        if self.single_page:
-            raise Exception("goto should not be called in single_page mode.")
-
-        # Do nothing if we are trying to go to the next question while the input is invalid
-        if not self.validate_current_input() and question_index >= self.question_index:
-            return
-
-        # If we are going to a precedent question, clear the error on the current input
-        self.set_error(None, self.question_index)
-
-        # Register the value of the input when navigating to the next question
-        if question_index >= self.question_index:
-            self.register_input(self.question_index)
-
-        # If the user clicked next on the last question, return the answers
-        if question_index >= len(self.questions):
-            self.exit(self.answers)
-            return
-
-        # Hide the previous questions
-        self.active_input.add_class("hidden")
-
-        self.question_index = question_index
-
-        # Show the new one
-        self.active_input.remove_class("hidden")
-        self.active_input.focus()
-
-        # Enable the back button if this is not the first question, or if allow_back is enabled
-        self.back_button.disabled = (self.question_index == 0) and (not self.allow_back)
-
-    @on(Button.Pressed, "#next-button")
-    def next_button_pressed(self) -> None:
-        if self.single_page:
-            if self.validate_all_inputs():
-                self.register_all_inputs()
-                self.exit(self.answers)
-            return
-
-        self.next_question()
-
-    def next_question(self) -> None:
-        """Go to the next question when the next button is clicked or an input is 'submitted'"""
-        if self.single_page:
-            self.simulate_key("tab")
-            return
-
-        # go the the next question
-        self.goto(self.question_index + 1)
-
-    @on(Button.Pressed, "#back-button")
-    def back_button_pressed(self) -> None:
-        if self.allow_back and (self.single_page or self.question_index == 0):
-            self.go_back = True
-            self.exit(None)
-            return
-
-        self.previous_question()
-
-    def previous_question(self) -> None:
-        """Go the the previous question when the back button is clicked"""
-        self.goto(self.question_index - 1)
-
-    def on_input_submitted(self, _: Input.Submitted) -> None:
-        """Simulate a click on the next button when enter is pressed on an input"""
-        self.next_question()
-
-    # --------------------
-
-    def set_questions(self, questions: Sequence[InputType]) -> None:
-        self.questions = questions
-
-    def get_question_id(self, wid: Widget) -> int | None:
-        """Return the question id associated with an input widget"""
-        if wid.id is None:
-            return None
-        id_parts = wid.id.split("-")
-        if len(id_parts) != 2:
-            return None
-        return int(id_parts[1])
-
-    def compose(self) -> ComposeResult:
-        # We need to define class properties that are references here to
-        # avoid keeping previous objects when creating a new wizard.
-        self.answers = dict()
-        self.go_back = False
-        self.input_widgets = list()
-        self.back_button = Button(
-            "Back", id="back-button", variant="warning", disabled=(not self.allow_back)
-        )
-        self.next_button = Button("Next", id="next-button", variant="primary")
-        self.error_labels = list()
-        self.error_texts = list()
-
-        yield Header()
-
-        with Container():
-            yield Label(self.sub_title, id="label-step")
-            for i, question in enumerate(self.questions):
-                # Check if the name is not already registered in answers
-                if question.name in self.answers:
-                    raise QuestionNameNotUnique(
-                        "Questions name must be unique but multiple questions "
-                        f"named '{question.name}' were supplied."
-                    )
+    def record(name: str, answer: object) -> object:
+        checkpoint.record(name, answer)
+        checkpoint.save()
+        return None if on_answer is None else on_answer(name, answer)
 
-                # Get a widget for the input
-                _wid = question.as_widget(f"input-{i}")
-                _wid.add_class("input")
-                # Initialize the answer as null
-                self.answers[question.name] = None
-                self.input_widgets.append(_wid)
+    return [checkpoint.as_source(), *sources], record
 
-                # Only show the first input is single_page is disabled
-                if i != 0 and not self.single_page:
-                    _wid.add_class("hidden")
 
-                yield _wid
-                error_label = Label("", classes="hidden error-label")
-                self.error_labels += [error_label]
-                self.error_texts += [None]
-                yield error_label
-
-            with Horizontal(id="buttons"):
-                yield self.back_button
-                yield self.next_button
+def close_app(
+    app: "WizardApp", answers: Optional[dict[str, Any]], record_session: Optional[str | Path]
+) -> Optional[dict[str, Any]]:
+    """Save the session recorded by a wizard that exited and close its checkpoint"""
+    if app.recorder is not None and record_session is not None:
+        app.recorder.save(record_session)
+    return close_checkpoint(app.checkpoint, answers)
 
 
 # This class will add a layer of abstraction
@@ -307,8 +90,20 @@ class Wizard:
     """
 
     questions: Sequence[InputType]
-    wiz_app: WizardApp
+    wiz_app: "WizardApp"
     disable_tui: bool
+    single_page: bool
+    lazy_mount: bool
+    lookahead: int
+    validation_delay: float
+    answer_sources: Sequence[AnswerSource]
+    prompt_missing: bool
+    on_answer: Optional[AnswerCallback]
+    answer_tasks: list["asyncio.Task[Any]"]
+    checkpoint: Optional[str | Path]
+    resume: bool
+    instrumentation: Optional[Instrumentation]
+    record_session: Optional[str | Path]
     title: str
     sub_title: Optional[str]
 
@@ -319,6 +114,16 @@ class Wizard:
         *,
         disable_tui: bool = False,
         single_page: bool = False,
+        lazy_mount: bool = False,
+        lookahead: int = 1,
+        validation_delay: float = 0,
+        answer_sources: Optional[Sequence[AnswerSource]] = None,
+        prompt_missing: bool = True,
+        on_answer: Optional[AnswerCallback] = None,
+        checkpoint: Optional[str | Path] = None,
+        resume: bool = False,
+        instrumentation: Optional[Instrumentation] = None,
+        record_session: Optional[str | Path] = None,
     ) -> None:
         """
         Creates an instance of this class.
@@ -331,12 +136,91 @@ class Wizard:
             sub_title: A more specific title, for example describing the goal of the wizard.
             disable_tui: Disable the Textual User Interface and use Inquirer instead.
             single_page: Show all the questions on the same page.
+            lazy_mount: Only create and mount the widgets of the questions around the current one,
+                useful for wizards with a lot of questions. In single page mode, only the
+                questions in and near the visible area are mounted.
+            lookahead: Number of questions kept mounted before and after the current
+                (or visible) ones, when lazy_mount is enabled.
+            validation_delay: Time to wait after the last change of a text input before
+                validating it, in seconds. Validation always happens when clicking next.
+            answer_sources: Sources supplying answers when the TUI is disabled, like a file,
+                standard input or environment variables. See `textual_wizard.sources`.
+            prompt_missing: When the TUI is disabled, ask the answers that are missing from
+                the sources with Inquirer. If disabled, default values are used instead.
+            on_answer: Called with the name and the answer of each question as soon as it is
+                known, before the wizard is completed. Async callbacks run in the background
+                while the user answers the next questions. With `run_async`, they keep running
+                after the wizard exits, await `answer_tasks` to wait for them. With `run`, the
+                event loop stops with the wizard and the unfinished ones are cancelled.
+            checkpoint: A file where the answers are saved as they are given, so the wizard can
+                be resumed if it is interrupted. It is removed once the wizard is completed.
+            resume: Prefill the answers saved in the checkpoint file, if it exists,
+                and start at the first unanswered question.
+            instrumentation: Records the time spent validating, building widgets and
+                navigating, and the time the user spends on each question, when the TUI is used.
+                See `textual_wizard.instrumentation`.
+            record_session: A file where the keys, pastes and button clicks received by the TUI
+                are saved when the wizard exits, to replay them with
+                `textual_wizard.session.replay_session`.
         """
-        self.wiz_app.single_page = single_page
+        self.single_page = single_page
+        self.lazy_mount = lazy_mount
+        self.lookahead = lookahead
+        self.validation_delay = validation_delay
+        self.answer_sources = answer_sources or list()
+        self.prompt_missing = prompt_missing
+        self.on_answer = on_answer
+        self.answer_tasks = list()
+        self.checkpoint = checkpoint
+        self.resume = resume
+        self.instrumentation = instrumentation
+        self.record_session = record_session
         self.disable_tui = disable_tui
         self.title = title
         self.sub_title = sub_title
 
+    def create_app(self) -> "WizardApp":
+        """Create the Textual app asking self.questions"""
+        from textual_wizard.app import WizardApp  # noqa: PLC0415
+
+        self.wiz_app = WizardApp()
+        self.wiz_app.single_page = self.single_page
+        self.wiz_app.lazy_mount = self.lazy_mount
+        self.wiz_app.lookahead = self.lookahead
+        self.wiz_app.validation_delay = self.validation_delay
+        self.wiz_app.on_answer = self.on_answer
+        self.wiz_app.checkpoint = open_checkpoint(self.checkpoint, self.resume)
+        self.wiz_app.resume = self.resume
+        self.wiz_app.instrumentation = self.instrumentation
+        if self.record_session is not None:
+            from textual_wizard.session import SessionRecorder  # noqa: PLC0415
+
+            self.wiz_app.recorder = SessionRecorder()
+        self.wiz_app.title = self.title
+        if self.sub_title is not None:
+            self.wiz_app.sub_title = self.sub_title
+
+        self.wiz_app.set_questions(self.questions)
+        return self.wiz_app
+
+    def resolve_answers(self) -> dict[str, Any]:
+        """Answer self.questions without the TUI"""
+        checkpoint = open_checkpoint(self.checkpoint, self.resume)
+        sources, on_answer = with_checkpoint(checkpoint, self.answer_sources, self.on_answer)
+        answers: dict[str, Any] = dict()
+        completed = False
+        try:
+            answers = resolve_answers(
+                self.questions,
+                sources,
+                prompt_missing=self.prompt_missing,
+                on_answer=on_answer,
+            )
+            completed = True
+        finally:
+            close_checkpoint(checkpoint, answers if completed else None)
+        return answers
+
     def run(
         self,
         questions: Sequence[InputType],
@@ -347,28 +231,48 @@ class Wizard:
 
         # If we run with the TUI
         if not self.disable_tui:
-            self.wiz_app = WizardApp()
-            self.wiz_app.title = self.title
-            if self.sub_title is not None:
-                self.wiz_app.sub_title = self.sub_title
-
-            self.wiz_app.set_questions(self.questions)
-            return self.wiz_app.run()
+            app = self.create_app()
+            return close_app(app, app.run(), self.record_session)
 
         # Without the TUI
-        answers = dict()
-        for question in self.questions:
-            answers[question.name] = question.inq_ask()
+        return self.resolve_answers()
 
-        return answers
+    async def run_async(
+        self,
+        questions: Sequence[InputType],
+    ) -> dict[str, Any] | None:
+        """
+        Run the app in the current event loop and return answers, so other coroutines keep
+        running while the user answers. Return None if the wizard was cancelled.
+        Without the TUI, answers are resolved in a thread, where `on_answer` is called.
+        """
 
+        self.questions = questions
 
-class WizardStage(TypedDict):
-    title: ReadOnly[str]
-    questions: ReadOnly[Sequence[InputType]]
+        if not self.disable_tui:
+            app = self.create_app()
+            answers = await app.run_async()
+            self.answer_tasks = app.answer_tasks
+            return close_app(app, answers, self.record_session)
 
+        # Inquirer blocks while waiting for the user, so it runs in a thread
+        import asyncio  # noqa: PLC0415
 
-Stages = Sequence[WizardStage]
+        return await asyncio.to_thread(self.resolve_answers)
+
+    @staticmethod
+    def validate_many(
+        questions: Sequence[InputType],
+        records: Iterable[Record],
+        *,
+        processes: Optional[int] = None,
+        chunk_size: int = 10000,
+    ) -> list[RecordReport]:
+        """
+        Validate and parse many records answering the questions, without running the wizard.
+        See [validate_many][textual_wizard.batch.validate_many].
+        """
+        return validate_many(questions, records, processes=processes, chunk_size=chunk_size)
 
 
 class MultiStageWizard:
@@ -378,6 +282,17 @@ class MultiStageWizard:
 
     disable_tui: bool
     single_page: bool
+    lazy_mount: bool
+    lookahead: int
+    validation_delay: float
+    answer_sources: Sequence[AnswerSource]
+    prompt_missing: bool
+    on_answer: Optional[AnswerCallback]
+    answer_tasks: list["asyncio.Task[Any]"]
+    checkpoint: Optional[str | Path]
+    resume: bool
+    instrumentation: Optional[Instrumentation]
+    record_session: Optional[str | Path]
     title: str
 
     def __init__(
@@ -386,6 +301,16 @@ class MultiStageWizard:
         *,
         disable_tui: bool = False,
         single_page: bool = True,
+        lazy_mount: bool = False,
+        lookahead: int = 1,
+        validation_delay: float = 0,
+        answer_sources: Optional[Sequence[AnswerSource]] = None,
+        prompt_missing: bool = True,
+        on_answer: Optional[AnswerCallback] = None,
+        checkpoint: Optional[str | Path] = None,
+        resume: bool = False,
+        instrumentation: Optional[Instrumentation] = None,
+        record_session: Optional[str | Path] = None,
     ) -> None:
         """
         Creates an instance of this class.
@@ -397,12 +322,96 @@ class MultiStageWizard:
                 it will be displayed to the user.
             disable_tui: Disable the Textual User Interface and use Inquirer instead.
             single_page: Show all the questions on the same page.
+            lazy_mount: Only create and mount the widgets of the questions around the current one,
+                useful for wizards with a lot of questions. In single page mode, only the
+                questions in and near the visible area are mounted.
+            lookahead: Number of questions kept mounted before and after the current
+                (or visible) ones, when lazy_mount is enabled.
+            validation_delay: Time to wait after the last change of a text input before
+                validating it, in seconds. Validation always happens when clicking next.
+            answer_sources: Sources supplying answers when the TUI is disabled, like a file,
+                standard input or environment variables. See `textual_wizard.sources`.
+            prompt_missing: When the TUI is disabled, ask the answers that are missing from
+                the sources with Inquirer. If disabled, default values are used instead.
+            on_answer: Called with the name and the answer of each question as soon as it is
+                known, before the wizard is completed. Async callbacks run in the background
+                while the user answers the next questions. With `run_async`, they keep running
+                after the wizard exits, await `answer_tasks` to wait for them. With `run`, the
+                event loop stops with the wizard and the unfinished ones are cancelled.
+            checkpoint: A file where the answers are saved as they are given, so the wizard can
+                be resumed if it is interrupted. It is removed once the wizard is completed.
+            resume: Prefill the answers saved in the checkpoint file, if it exists,
+                and start at the first unanswered question.
+            instrumentation: Records the time spent validating, building widgets and
+                navigating, and the time the user spends on each question, when the TUI is used.
+                See `textual_wizard.instrumentation`.
+            record_session: A file where the keys, pastes and button clicks received by the TUI
+                are saved when the wizard exits, to replay them with
+                `textual_wizard.session.replay_session`.
         """
 
         self.disable_tui = disable_tui
         self.single_page = single_page
+        self.lazy_mount = lazy_mount
+        self.lookahead = lookahead
+        self.validation_delay = validation_delay
+        self.answer_sources = answer_sources or list()
+        self.prompt_missing = prompt_missing
+        self.on_answer = on_answer
+        self.answer_tasks = list()
+        self.checkpoint = checkpoint
+        self.resume = resume
+        self.instrumentation = instrumentation
+        self.record_session = record_session
         self.title = title
 
+    def create_app(self, stages: Sequence[WizardStage]) -> "WizardApp":
+        """Create the Textual app hosting all the stages"""
+        from textual_wizard.app import WizardApp  # noqa: PLC0415
+
+        wiz = WizardApp()
+        wiz.single_page = self.single_page
+        wiz.lazy_mount = self.lazy_mount
+        wiz.lookahead = self.lookahead
+        wiz.validation_delay = self.validation_delay
+        wiz.on_answer = self.on_answer
+        wiz.checkpoint = open_checkpoint(self.checkpoint, self.resume)
+        wiz.resume = self.resume
+        wiz.instrumentation = self.instrumentation
+        if self.record_session is not None:
+            from textual_wizard.session import SessionRecorder  # noqa: PLC0415
+
+            wiz.recorder = SessionRecorder()
+        wiz.title = self.title
+        wiz.set_stages(stages)
+        return wiz
+
+    def resolve_answers(self, stages: Sequence[WizardStage]) -> dict[str, Any]:
+        """Answer the questions of all the stages without the TUI"""
+        checkpoint = open_checkpoint(self.checkpoint, self.resume)
+        sources, on_answer = with_checkpoint(checkpoint, self.answer_sources, self.on_answer)
+        # Questions may depend on the answers of the previous stages
+        conditions = compile_conditions([x for stage in stages for x in stage["questions"]])
+        answers = dict()
+        completed = False
+        try:
+            for stage in stages:
+                answers.update(
+                    resolve_answers(
+                        stage["questions"],
+                        sources,
+                        prompt_missing=self.prompt_missing,
+                        title=stage["title"],
+                        on_answer=on_answer,
+                        conditions=conditions,
+                    )
+                )
+            completed = True
+        finally:
+            close_checkpoint(checkpoint, answers if completed else None)
+
+        return answers
+
     def run(self, stages: Sequence[WizardStage]) -> dict[str, Any] | None:
         """
         Run the multistage wizard and return answers. Return None if the wizard was cancelled.
@@ -414,36 +423,32 @@ class MultiStageWizard:
                 - title: the title of your stage
         """
 
-        # If we run with the TUI
+        # If we run with the TUI, all the stages are hosted by a single app
         if not self.disable_tui:
-            answers = dict()
-            stage_i = 0
-            while stage_i < len(stages):
-                stage = stages[stage_i]
-                wiz = WizardApp()
-                wiz.single_page = self.single_page
-                wiz.title = self.title
-                wiz.set_questions(stage["questions"])
-                wiz.sub_title = stage["title"]
-                if stage_i > 0:
-                    wiz.allow_back = True
-
-                stage_answers = wiz.run()
-                if stage_answers is None:
-                    if wiz.go_back:
-                        stage_i -= 1
-                        continue
-                    return None
-                stage_i += 1
-                answers.update(stage_answers)
-
-            return answers
+            app = self.create_app(stages)
+            return close_app(app, app.run(), self.record_session)
 
         # Without the TUI
-        answers = dict()
-        for stage in stages:
-            print(stage["title"])
-            for question in stage["questions"]:
-                answers[question.name] = question.inq_ask()
+        return self.resolve_answers(stages)
 
-        return answers
+    async def run_async(self, stages: Sequence[WizardStage]) -> dict[str, Any] | None:
+        """
+        Run the multistage wizard in the current event loop and return answers,
+        so other coroutines keep running while the user answers.
+        Return None if the wizard was cancelled.
+        Without the TUI, answers are resolved in a thread, where `on_answer` is called.
+
+        Args:
+            stages: A list containing the different stages of your wizard, see `run`.
+        """
+
+        if not self.disable_tui:
+            app = self.create_app(stages)
+            answers = await app.run_async()
+            self.answer_tasks = app.answer_tasks
+            return close_app(app, answers, self.record_session)
+
+        # Inquirer blocks while waiting for the user, so it runs in a thread
+        import asyncio  # noqa: PLC0415
+
+        return await asyncio.to_thread(self.resolve_answers, stages)
@@ -0,0 +1,20 @@
+import os
+
+import pytest
+
+# Timings depend on the machine and its load, so the tests comparing them are only run
+# when TEXTUAL_WIZARD_TIMING_TESTS is set, e.g. on a dedicated runner.
+TIMING_TESTS = "TEXTUAL_WIZARD_TIMING_TESTS"
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", f"timing: asserts timings, run if {TIMING_TESTS} is set")
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    if os.environ.get(TIMING_TESTS):
+        return
+    skip = pytest.mark.skip(reason=f"Set {TIMING_TESTS} to run the tests asserting timings")
+    for item in items:
+        if "timing" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,71 @@
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_BUDGET = 0.2
+"""Maximum time spent importing the library without the TUI, in seconds"""
+
+HEADLESS_SCRIPT = """
+import sys
+from textual_wizard.inputs import Email, Integer, Select
+from textual_wizard.sources import DictSource, resolve_answers
+from textual_wizard.wizard import Wizard
+
+questions = [Email("email", "Email"), Integer("age", "Age"), Select("os", "OS", options=["Linux"])]
+answers = {"email": "skwal@skwal.net", "age": "20", "os": "Linux"}
+resolve_answers(questions, [DictSource(answers)], prompt_missing=False)
+Wizard.validate_many(questions, [answers])
+print(",".join(sys.modules))
+"""
+
+
+def is_tui_module(module: str) -> bool:
+    return module.split(".", maxsplit=1)[0] in ("textual", "inquirer")
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """Return the cumulative import time of each module imported by a statement, in µs"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = dict()
+    # Lines have the form "import time: self [us] | cumulative | imported package"
+    for line in process.stderr.splitlines():
+        _, _, cumulative, module = (x.strip() for x in line.replace(":", "|", 1).split("|"))
+        if cumulative.isdigit():
+            times[module] = int(cumulative)
+    return times
+
+
+def test_import_does_not_load_the_tui() -> None:
+    times = import_times("import textual_wizard.wizard, textual_wizard.batch")
+    assert not [x for x in times if is_tui_module(x)]
+    # Recording and replaying sessions needs asyncio, which loads ssl
+    assert "asyncio" not in times and "ssl" not in times
+
+
+@pytest.mark.timing
+def test_import_time() -> None:
+    times = import_times("import textual_wizard.wizard, textual_wizard.batch")
+    print(f"Import time: {times['textual_wizard'] / 1000:.1f}ms")
+    assert times["textual_wizard"] < IMPORT_BUDGET * 1e6
+
+
+def test_headless_path_does_not_load_the_tui() -> None:
+    process = subprocess.run(
+        [sys.executable, "-c", HEADLESS_SCRIPT], capture_output=True, text=True, check=True
+    )
+    modules = process.stdout.strip().split(",")
+    assert "textual_wizard.validation" in modules
+    assert not [x for x in modules if is_tui_module(x)]
+
+
+def test_command_line_does_not_load_the_app() -> None:
+    # The benchmarks and the replay of sessions are only imported when they are used
+    times = import_times("import textual_wizard.__main__")
+    assert "textual_wizard.__main__" in times
+    assert "textual_wizard.app" not in times and "textual_wizard.benchmark" not in times
@@ -0,0 +1,44 @@
+import asyncio
+from statistics import median
+from time import perf_counter
+
+import pytest
+from textual.widgets import Input
+
+from textual_wizard.app import WizardApp, WizardScreen
+from textual_wizard.inputs import InputType, Text
+
+
+def measure_keystroke_latency(question_count: int, keystrokes: int = 200) -> float:
+    """Return the median time spent handling an input change, in seconds"""
+    questions: list[InputType] = [Text(f"q{i}", f"Question {i}") for i in range(question_count)]
+
+    async def run() -> float:
+        app = WizardApp()
+        app.single_page = True
+        app.set_questions(questions)
+        async with app.run_test():
+            screen = app.screen
+            assert isinstance(screen, WizardScreen)
+            wid = screen.query_one("#input-0", Input)
+
+            times: list[float] = list()
+            for i in range(keystrokes):
+                # Typing in a valid field, the most common keystroke
+                message = Input.Changed(wid, "a" * (i + 1))
+                start = perf_counter()
+                screen.on_input_changed(message)
+                times.append(perf_counter() - start)
+        return median(times)
+
+    return asyncio.run(run())
+
+
+@pytest.mark.timing
+def test_keystroke_latency_is_flat() -> None:
+    small = measure_keystroke_latency(10)
+    large = measure_keystroke_latency(1000)
+    print(f"Keystroke latency: {small * 1e6:.1f}µs (10 questions), {large * 1e6:.1f}µs (1000)")
+
+    # Before error labels were updated incrementally, this ratio grew with the question count
+    assert large < small * 10
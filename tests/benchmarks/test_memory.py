@@ -0,0 +1,68 @@
+import tracemalloc
+from typing import Callable
+
+from textual_wizard.inputs import InputType, Integer, SelectionList, Text, slot_names
+from textual_wizard.options import OptionStore
+
+QUESTIONS = 2000
+OPTIONS = 100_000
+
+
+class DictQuestion:
+    """Holds the attributes of a question in a dict, like before questions were slotted"""
+
+
+def allocated(build: Callable[[], object]) -> int:
+    """Return the memory allocated by a function and still used by its result, in bytes"""
+    tracemalloc.start()
+    try:
+        result = build()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def test_slotted_questions_are_smaller() -> None:
+    questions: list[InputType] = [
+        Text(f"q{i}", f"Question {i}") if i % 2 else Integer(f"q{i}", f"Question {i}")
+        for i in range(QUESTIONS)
+    ]
+    attributes = [{x: getattr(q, x) for x in slot_names(type(q))} for q in questions]
+
+    # Both representations share the values of the attributes, only the instances are compared
+    def slotted() -> list[object]:
+        copies = list()
+        for question, values in zip(questions, attributes):
+            copy = object.__new__(type(question))
+            for name, value in values.items():
+                setattr(copy, name, value)
+            copies.append(copy)
+        return copies
+
+    def regular() -> list[object]:
+        copies = list()
+        for values in attributes:
+            copy = DictQuestion()
+            copy.__dict__.update(values)
+            copies.append(copy)
+        return copies
+
+    regular_size, slotted_size = allocated(regular), allocated(slotted)
+    print(f"{QUESTIONS} questions: {regular_size / 1024:.0f}KiB -> {slotted_size / 1024:.0f}KiB")
+
+    assert slotted_size < regular_size * 0.75
+
+
+def test_option_store_is_smaller() -> None:
+    # Labels are shared by both representations, only the containers are compared
+    options = [(f"option-{i}", i, i % 3 == 0) for i in range(OPTIONS)]
+    regular = allocated(lambda: [(label, value, flag) for label, value, flag in options])
+    compact = allocated(lambda: OptionStore(options, flags=True))
+    print(f"{OPTIONS} options: {regular / 1024:.0f}KiB -> {compact / 1024:.0f}KiB")
+
+    assert compact * 2 < regular
+
+    selection = SelectionList("options", "Options", options=options, searchable=False)
+    assert list(selection.options) == options
@@ -0,0 +1,35 @@
+from timeit import timeit
+
+import pytest
+from textual.validation import URL as URL_
+from textual.validation import Integer as IntegerValidator
+from textual.validation import Length, Regex, Validator
+from textual.validation import Number as NumberValidator
+
+from textual_wizard.inputs import EMAIL_REGEX, URL, BaseText, Email, Integer, Number, Text
+
+# Questions, with the Textual validators they used before their validators were compiled
+INPUTS: list[tuple[BaseText, list[Validator], str]] = [
+    (Text("", ""), [], "Hello World"),
+    (Email("", ""), [Regex(EMAIL_REGEX)], "skwal@skwal.net"),
+    (URL("", ""), [URL_()], "https://skwal.net"),
+    (Integer("", ""), [IntegerValidator()], "1337"),
+    (Number("", ""), [NumberValidator()], "6.022"),
+]
+
+
+def walk_validators(validators: list[Validator], value: str) -> bool:
+    """Validate a value by calling every Textual validator, like before they were compiled"""
+    return all(validator.validate(value).is_valid for validator in validators)
+
+
+@pytest.mark.timing
+def test_compiled_validators_are_faster() -> None:
+    for inpt, extra_validators, value in INPUTS:
+        validators = [*extra_validators, Length(1)]
+        assert inpt.is_value_accepted(value).valid
+        generic = timeit(lambda: walk_validators(validators, value), number=2000)
+        compiled = timeit(lambda: inpt.is_value_accepted(value), number=2000)
+        print(f"{type(inpt).__name__}: {generic * 500:.2f}µs -> {compiled * 500:.2f}µs")
+
+        assert compiled < generic
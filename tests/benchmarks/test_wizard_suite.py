@@ -0,0 +1,70 @@
+import asyncio
+import os
+import pstats
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from textual_wizard.__main__ import textual_wizard
+from textual_wizard.benchmark import (
+    compare_results,
+    make_case,
+    read_results,
+    run_benchmarks,
+    write_results,
+)
+from textual_wizard.synthetic import synthetic_stages
+
+# A reduced suite, the full one runs DEFAULT_CASES. Set TEXTUAL_WIZARD_BENCHMARK_RESULTS
+# to keep the results, to compare them with another version.
+CASES = [
+    make_case("text", 20),
+    make_case("mixed", 20, 20, single_page=True),
+    make_case("select", 5, 1000, stage_count=1),
+]
+
+
+def test_synthetic_stages() -> None:
+    stages = synthetic_stages(2, 10, "mixed", 5)
+    names = [x.name for stage in stages for x in stage["questions"]]
+    assert len(set(names)) == 20
+    assert {type(x).__name__ for x in stages[0]["questions"]} == {
+        "Text",
+        "Select",
+        "Integer",
+        "SelectionList",
+        "RadioSet",
+    }
+
+
+def test_benchmark_suite(tmp_path: Path) -> None:
+    results = asyncio.run(run_benchmarks(CASES, repeat=1, keystrokes=10, transitions=4))
+    path = Path(os.environ.get("TEXTUAL_WIZARD_BENCHMARK_RESULTS", tmp_path / "results.json"))
+    write_results(results, path)
+    results = read_results(path)
+
+    for result in results["results"]:
+        metrics = result["metrics"]
+        print(result["case"], {k: f"{v['median'] * 1000:.2f}ms" for k, v in metrics.items()})
+        assert {"first_paint", "compose", "mount", "keystroke"} <= metrics.keys()
+        assert all(0 < x["median"] <= x["max"] for x in metrics.values())
+
+    paged, single_page, select = (x["metrics"] for x in results["results"])
+    assert paged["goto"]["count"] == 4 and paged["stage_switch"]["count"] == 4
+    assert "goto" not in single_page
+    assert "stage_switch" not in select and "input_changed" not in select
+
+    assert compare_results(results, results) == []
+    slower = read_results(path)
+    slower["results"][0]["metrics"]["compose"]["median"] *= 2
+    assert len(compare_results(results, slower)) == 1
+
+
+def test_profile_cli(tmp_path: Path) -> None:
+    path = tmp_path / "wizard.prof"
+    arguments = ["-n", "5", "-k", "text", "-k", "select", "--stages", "2", "-p", str(path)]
+    result = CliRunner().invoke(textual_wizard, arguments)
+    assert result.exit_code == 0, result.output
+    assert "s1q4" in result.output
+
+    assert "compose" in pstats.Stats(str(path)).get_stats_profile().func_profiles
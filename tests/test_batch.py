@@ -0,0 +1,80 @@
+from textual_wizard.batch import validate_many
+from textual_wizard.inputs import Email, InputType, Integer, RadioSet, Select, SelectionList, Text
+from textual_wizard.wizard import Wizard
+
+QUESTIONS: list[InputType] = [
+    Text("name", "What is your name ?"),
+    Email("email", "What is your email ?", allow_blank=True, default_value="none"),
+    Integer("age", "How old are you ?"),
+    Select("animal", "Favorite animal ?", options=[("Cats", "cat"), ("Dogs", "dog")]),
+    SelectionList("days", "Days ?", options=[("Monday", 1, True), ("Friday", 5, False)]),
+    RadioSet("color", "Favorite color ?", options=["Red", "Blue"]),
+]
+
+
+def test_validate_many() -> None:
+    reports = validate_many(
+        QUESTIONS,
+        [
+            {"name": "Skwal", "age": "20", "animal": "Dogs", "days": "1, Friday", "color": "Blue"},
+            {"name": "", "email": "skwal.net", "age": "two", "animal": "Birds", "days": [3]},
+        ],
+    )
+    assert reports[0].valid
+    assert reports[0].answers == {
+        "name": "Skwal",
+        "email": "none",
+        "age": 20,
+        "animal": "dog",
+        "days": [1, 5],
+        "color": "Blue",
+    }
+
+    assert not reports[1].valid
+    assert reports[1].index == 1
+    assert set(reports[1].errors) == {"name", "email", "age", "animal", "days"}
+    assert reports[1].answers["color"] == "Red"
+
+
+def test_validate_many_processes() -> None:
+    records = [{"name": f"User {i}", "age": str(i), "email": "a@b.c"} for i in range(1000)]
+    records[500]["age"] = "invalid"
+
+    reports = Wizard.validate_many(QUESTIONS, records, processes=2, chunk_size=300)
+    assert [x.index for x in reports] == list(range(1000))
+    assert [x.index for x in reports if not x.valid] == [500]
+    assert reports[999].answers["age"] == 999
+
+
+def test_equal_values_of_different_types() -> None:
+    reports = validate_many([Text("v", "V")], [{"v": 1}, {"v": True}, {"v": 1.0}])
+    assert [x.answers["v"] for x in reports] == ["1", "True", "1.0"]
+
+
+def has_pet(pet: str) -> bool:
+    return pet != "No"
+
+
+def test_conditional_questions() -> None:
+    questions: list[InputType] = [
+        Select("pet", "Pet ?", options=["No", "Cat", "Dog"]),
+        Text("pet_name", "Its name ?", when=has_pet),
+        Integer("meals", "Meals ?", compute_default=lambda pet: 2 if pet == "Cat" else 3),
+    ]
+    records = [{"pet": "No"}, {"pet": "Cat", "pet_name": "Felix"}, {"pet": "Dog"}, {"pet": "Cow"}]
+
+    reports = validate_many(questions, records)
+    assert reports[0].valid
+    assert reports[0].answers == {"pet": "No", "pet_name": None, "meals": 3}
+    assert reports[1].answers == {"pet": "Cat", "pet_name": "Felix", "meals": 2}
+    assert reports[2].errors.keys() == {"pet_name"}
+    # The functions don't read invalid answers
+    assert reports[3].errors.keys() == {"pet", "pet_name", "meals"}
+
+    # Lambdas can't be sent to other processes, so the records are validated in this one
+    reports = validate_many(questions, records * 3, processes=2, chunk_size=4)
+    assert [x.valid for x in reports] == [True, True, False, False] * 3
+
+    # Functions defined at the top level of a module can
+    reports = validate_many(questions[:2], records * 3, processes=2, chunk_size=4)
+    assert [x.answers["pet_name"] for x in reports[:2]] == [None, "Felix"]
@@ -0,0 +1,73 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from textual_wizard.checkpoint import Checkpoint
+from textual_wizard.inputs import InputType, Integer, RadioSet, Select, SelectionList, Text
+from textual_wizard.sources import DictSource
+from textual_wizard.wizard import Wizard
+
+QUESTIONS: list[InputType] = [
+    Text("name", "What is your name ?"),
+    Integer("age", "How old are you ?"),
+    Select("animal", "Favorite animal ?", options=["Cats", "Dogs"]),
+]
+
+
+def test_writes_are_coalesced(tmp_path: Path) -> None:
+    path = tmp_path / "answers.json"
+    checkpoint = Checkpoint(path)
+    for i in range(1000):
+        checkpoint.record("age", i)
+        checkpoint.save()
+    checkpoint.flush()
+    assert json.loads(path.read_text()) == {"answers": {"age": 999}}
+
+    checkpoint.clear()
+    assert not path.exists()
+
+
+def test_restore(tmp_path: Path) -> None:
+    path = tmp_path / "answers.json"
+    path.write_text(
+        json.dumps({"answers": {"age": "20", "port": 443, "tags": ["a", "c"], "animal": "Birds"}})
+    )
+    checkpoint = Checkpoint(path, resume=True)
+    assert checkpoint.restore(Integer("age", "Age")) == (True, 20)
+    assert checkpoint.restore(RadioSet("port", "Port", options=[("HTTP", 80), ("HTTPS", 443)]))[0]
+    tags = SelectionList("tags", "Tags", options=[("a", False), ("b", False), ("c", False)])
+    assert checkpoint.restore(tags) == (True, ["a", "c"])
+    # Answers which are no longer accepted are asked again
+    assert not checkpoint.restore(Select("animal", "Animal", options=["Cats", "Dogs"]))[0]
+    assert not checkpoint.restore(Text("name", "Name"))[0]
+
+    # An unreadable file is ignored
+    path.write_text("{")
+    assert Checkpoint(path, resume=True).answers == {}
+
+
+def test_headless_resume(tmp_path: Path) -> None:
+    path = tmp_path / "answers.json"
+
+    def interrupt(name: str, _: object) -> None:
+        if name == "age":
+            raise KeyboardInterrupt
+
+    sources = [DictSource({"name": "Skwal", "age": 20})]
+    wiz = Wizard(
+        disable_tui=True,
+        answer_sources=sources,
+        prompt_missing=False,
+        checkpoint=path,
+        on_answer=interrupt,
+    )
+    with pytest.raises(KeyboardInterrupt):
+        wiz.run(QUESTIONS)
+    # Answers registered before the interruption are kept
+    assert json.loads(path.read_text()) == {"answers": {"name": "Skwal", "age": 20}}
+
+    wiz = Wizard(disable_tui=True, prompt_missing=False, checkpoint=path, resume=True)
+    assert wiz.run(QUESTIONS) == {"name": "Skwal", "age": 20, "animal": "Cats"}
+    # The checkpoint is removed once the wizard is completed
+    assert not path.exists()
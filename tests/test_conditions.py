@@ -0,0 +1,116 @@
+import pytest
+
+from textual_wizard.conditions import MISSING, ConditionGraph, compile_conditions
+from textual_wizard.exceptions import InvalidCondition
+from textual_wizard.inputs import InputType, Integer, Select, Text
+from textual_wizard.sources import DictSource
+from textual_wizard.wizard import MultiStageWizard, Stages, Wizard
+
+QUESTIONS: list[InputType] = [
+    Select("country", "Country ?", options=["France", "Spain", "Other"]),
+    Text("city", "City ?", when=lambda country: country != "Other"),
+    Text("zip", "Zip code ?", when=lambda city: city is not None),
+    Integer("age", "Age ?"),
+    Integer(
+        "retirement",
+        "Retirement age ?",
+        compute_default=lambda country: 64 if country == "France" else 65,
+    ),
+]
+
+
+def test_incremental_evaluation() -> None:
+    calls: list[str] = list()
+
+    def adult(age: int) -> bool:
+        calls.append("adult")
+        return age >= 18
+
+    def seen(name: str) -> bool:
+        calls.append("seen")
+        return True
+
+    questions: list[InputType] = [
+        Text("name", "Name ?"),
+        Integer("age", "Age ?"),
+        Text("job", "Job ?", when=adult),
+        Text("nickname", "Nickname ?", when=seen),
+    ]
+    graph = ConditionGraph(questions)
+    assert graph.dependents == {"name": [3], "age": [2]}
+
+    graph.update("name", "Skwal")
+    # Questions are only evaluated once the answers they read are known
+    assert graph.update("age", 12) == ["job"]
+    assert graph.is_skipped("job") and graph.answers["job"] is None
+
+    # Only the questions reading a changed answer are evaluated again
+    calls.clear()
+    assert graph.update("age", 30) == ["job"]
+    assert calls == ["adult"] and not graph.is_skipped("job")
+    assert graph.update("age", 30) == []
+    assert calls == ["adult"]
+
+    # Unknown answers, like invalid ones, leave the questions reading them as they are
+    assert graph.update("age", MISSING) == []
+    assert "age" not in graph.answers and not graph.is_skipped("job")
+    assert graph.update("age", 12) == ["job"]
+
+
+def test_visibility_changes_propagate() -> None:
+    graph = ConditionGraph(QUESTIONS)
+    graph.update("country", "France")
+    graph.update("city", "Paris")
+    assert graph.get_default("retirement") == 64
+    assert graph.get_default("city") is MISSING
+
+    # The answer of a skipped question is None, for the questions reading it
+    assert graph.update("country", "Other") == ["city", "zip", "retirement"]
+    assert graph.skipped == {"city", "zip"}
+    assert graph.get_default("retirement") == 65
+
+    # The answer of a question shown again is given by the wizard
+    assert graph.update("country", "Spain") == ["city"]
+    assert "city" not in graph.answers
+    assert graph.update("city", "Madrid") == ["zip"]
+
+
+def test_invalid_conditions() -> None:
+    assert compile_conditions([Text("name", "Name ?")]) is None
+
+    with pytest.raises(InvalidCondition, match="previous question"):
+        ConditionGraph([Text("a", "A ?", when=lambda b: True), Text("b", "B ?")])
+    with pytest.raises(InvalidCondition, match="previous question"):
+        ConditionGraph([Text("a", "A ?", compute_default=lambda a: a)])
+    with pytest.raises(InvalidCondition, match="must name"):
+        ConditionGraph([Text("a", "A ?"), Text("b", "B ?", when=lambda **answers: True)])
+
+
+def test_headless() -> None:
+    wiz = Wizard(
+        disable_tui=True,
+        answer_sources=[DictSource({"country": "Other", "city": "Paris", "age": 30})],
+        prompt_missing=False,
+    )
+    assert wiz.run(QUESTIONS) == {
+        "country": "Other",
+        "city": None,
+        "zip": None,
+        "age": 30,
+        "retirement": 65,
+    }
+
+    # Questions may depend on the answers of the previous stages
+    stages: Stages = [
+        {"title": "Home", "questions": QUESTIONS[:3]},
+        {"title": "Work", "questions": QUESTIONS[3:]},
+    ]
+    wiz = MultiStageWizard(
+        disable_tui=True,
+        answer_sources=[
+            DictSource({"country": "France", "city": "Paris", "zip": "75001", "age": 40})
+        ],
+        prompt_missing=False,
+    )
+    answers = wiz.run(stages)
+    assert answers is not None and answers["retirement"] == 64
@@ -0,0 +1,138 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from textual_wizard import definitions
+from textual_wizard.definitions import compile_definition, load_definition
+from textual_wizard.exceptions import InvalidDefinition
+from textual_wizard.inputs import Email, Integer, RadioSet, Select, SelectionList
+
+DEFINITION = {
+    "title": "MyApp",
+    "stages": [
+        {
+            "title": "Account",
+            "questions": [
+                {"type": "email", "name": "email", "label": "Email"},
+                {
+                    "type": "integer",
+                    "name": "age",
+                    "label": "Age",
+                    "validators": [{"rule": "number", "minimum": 18}],
+                },
+            ],
+        },
+        {
+            "title": "Preferences",
+            "questions": [
+                {"type": "select", "name": "os", "label": "OS", "options": [["Linux", 1], "BSD"]},
+                {
+                    "type": "selection_list",
+                    "name": "days",
+                    "label": "Days",
+                    "options": [["Monday", True], ["Tuesday", False]],
+                },
+                {"type": "radio_set", "name": "color", "label": "Color", "options": ["Red"]},
+            ],
+        },
+    ],
+}
+
+TOML_DEFINITION = """
+title = "MyApp"
+
+[[stages]]
+title = "Account"
+
+[[stages.questions]]
+type = "email"
+name = "email"
+label = "Email"
+
+[[stages.questions]]
+type = "integer"
+name = "age"
+label = "Age"
+validators = [{ rule = "number", minimum = 18 }]
+
+[[stages]]
+title = "Preferences"
+
+[[stages.questions]]
+type = "select"
+name = "os"
+label = "OS"
+options = [["Linux", 1], "BSD"]
+
+[[stages.questions]]
+type = "selection_list"
+name = "days"
+label = "Days"
+options = [["Monday", true], ["Tuesday", false]]
+
+[[stages.questions]]
+type = "radio_set"
+name = "color"
+label = "Color"
+options = ["Red"]
+"""
+
+
+def test_compile_definition() -> None:
+    definition = compile_definition(DEFINITION)
+    assert definition["title"] == "MyApp"
+    account, preferences = definition["stages"]
+    email, age = account["questions"]
+    os, days, color = preferences["questions"]
+
+    assert isinstance(email, Email) and not email.is_value_accepted("skwal").valid
+    assert isinstance(age, Integer) and not age.is_value_accepted("17").valid
+    assert isinstance(os, Select) and list(os.options) == [("Linux", 1), ("BSD", "BSD")]
+    assert isinstance(days, SelectionList) and days.options.flagged_values() == ["Monday"]
+    assert isinstance(color, RadioSet) and color.default_value == "Red"
+
+
+@pytest.mark.parametrize(
+    "definition",
+    [
+        {"questions": [{"type": "date", "name": "day", "label": "Day"}]},
+        {"questions": [{"type": "text", "name": "name"}]},
+        {"questions": [{"type": "text", "name": "name", "label": "Name", "colour": "red"}]},
+        {"questions": [{"type": "text", "name": "a", "label": "A", "validators": [{"rule": "x"}]}]},
+        {"questions": [{"type": "radio_set", "name": "color", "label": "Color", "options": []}]},
+        {"questions": [{"type": "text", "name": "a", "label": "A"}] * 2},
+        {"stages": {"title": "Stage"}},
+    ],
+)
+def test_invalid_definitions(definition: object) -> None:
+    with pytest.raises(InvalidDefinition):
+        compile_definition(definition)
+
+
+def test_load_definition(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    json_path, toml_path = tmp_path / "wizard.json", tmp_path / "wizard.toml"
+    json_path.write_text(json.dumps(DEFINITION))
+    toml_path.write_text(TOML_DEFINITION)
+    cache_dir = tmp_path / "cache"
+
+    def names(path: Path) -> list[list[str]]:
+        stages = load_definition(path, cache_dir=cache_dir)["stages"]
+        return [[x.name for x in stage["questions"]] for stage in stages]
+
+    expected = [["email", "age"], ["os", "days", "color"]]
+    assert names(json_path) == names(toml_path) == expected
+    assert len(list(cache_dir.glob("*.pickle"))) == 2
+
+    # Cached definitions are not compiled again, until the file changes
+    def fail(*_: object) -> None:
+        raise AssertionError("The definition was compiled again")
+
+    monkeypatch.setattr(definitions, "compile_definition", fail)
+    stages = load_definition(json_path, cache_dir=cache_dir)["stages"]
+    age = stages[0]["questions"][1]
+    assert isinstance(age, Integer) and age.is_value_accepted("18").valid
+
+    json_path.write_text(json.dumps({**DEFINITION, "title": "Other"}))
+    with pytest.raises(AssertionError):
+        load_definition(json_path, cache_dir=cache_dir)
@@ -1,6 +1,22 @@
-from typing import Type
-
-from textual_wizard.inputs import URL, BaseText, Email, Integer, Number, Text
+from typing import AsyncIterator, Type
+
+from textual.validation import Length, Validator
+from textual.validation import Number as NumberValidator
+from textual.validation import ValidationResult as TextualValidationResult
+
+from textual_wizard.inputs import (
+    URL,
+    BaseText,
+    Email,
+    Integer,
+    Number,
+    RadioSet,
+    Select,
+    SelectionList,
+    Text,
+)
+from textual_wizard.options import OptionProvider, OptionStore
+from textual_wizard.search import OptionIndex
 
 INPUTS: list[Type[BaseText]] = [URL, Email, Integer, Number, Text]
 
@@ -64,3 +80,115 @@ def test_default_parsed_values() -> None:
     ]
     for test in tests:
         assert test[0].parse_result("") == test[1]
+
+
+class CountingValidator(Validator):
+    pure = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def validate(self, value: str) -> TextualValidationResult:
+        self.calls += 1
+        return self.success() if value.isalpha() else self.failure("Letters only.")
+
+
+def test_validation_cache() -> None:
+    validator = CountingValidator()
+    inpt = Text("", "", validators=[validator], validation_cache_size=2)
+    for value in ["abc", "ab1", "abc", "ab1"]:
+        inpt.is_value_accepted(value)
+    assert validator.calls == 2
+    assert not inpt.is_value_accepted("ab1").valid
+
+    # The least recently used value is evicted
+    inpt.is_value_accepted("xyz")
+    inpt.is_value_accepted("abc")
+    assert validator.calls == 4
+
+
+def test_validation_cache_needs_pure_validators() -> None:
+    validator = CountingValidator()
+    validator.pure = False
+    inpt = Text("", "", validators=[validator], validation_cache_size=2)
+    inpt.is_value_accepted("abc")
+    inpt.is_value_accepted("abc")
+    assert validator.calls == 2
+    assert Email("", "", validation_cache_size=2).validation_cache is not None
+
+
+def test_compiled_validators_failures() -> None:
+    inpt = Integer("", "", validators=[NumberValidator(0, 100), Length(maximum=3)])
+    assert inpt.is_value_accepted("42").valid
+    assert inpt.is_value_accepted("1000").failure_reason == "Must be shorter than 3 characters."
+    assert inpt.is_value_accepted("200").failure_reason == "Must be between 0 and 100."
+    assert inpt.is_value_accepted("4.2").failure_reason == "Must be a valid integer."
+    assert inpt.is_value_accepted("nan").failure_reason == "Must be a valid number."
+
+    email = Email("", "")
+    assert email.is_value_accepted("skwal.net").failure_reason == "Must be a valid email address."
+
+
+def test_option_providers() -> None:
+    async def hosts() -> AsyncIterator[str]:
+        for i in range(250):
+            yield f"host-{i}"
+
+    provider = OptionProvider(hosts(), page_size=100)
+    select = Select("host", "Host", options=provider)
+    assert select.options == [] and select.default_value is None
+
+    # All the options are loaded when the TUI is not used
+    assert select.validate_answer("host-200")[1] == "host-200"
+    assert select.default_value == "host-0"
+    assert provider.complete and len(select.options) == 250
+
+    async def packages(page: int) -> list[tuple[str, bool]]:
+        return [(f"pkg-{i}", i % 2 == 0) for i in range(page * 10, min(page * 10 + 10, 25))]
+
+    selection = SelectionList("packages", "Packages", options=OptionProvider(packages))
+    assert len(selection.validate_answer(None)[1]) == 13
+
+    # Loaded options are kept for the next runs
+    assert len(Select("host", "Host", options=provider).options) == 250
+
+
+def test_option_index() -> None:
+    labels = [f"{city} {i}" for i, city in enumerate(["Paris", "Lyon", "Marseille"] * 100)]
+    index = OptionIndex(labels)
+
+    def expected(query: str) -> list[int]:
+        return [i for i, x in enumerate(labels) if query.lower() in x.lower()]
+
+    # Typing a query character by character, then removing them
+    for query in ["l", "ly", "lyo", "lyon 2", "lyon", "ar", "s 1", "", "z", "YON 12"]:
+        assert index.search(query) == expected(query)
+
+    index.add(["Lyon Part-Dieu"])
+    assert index.search("lyon p") == [300]
+
+    # Large lists of options are indexed by default
+    assert Select("city", "City", options=labels).index is not None
+    assert Select("city", "City", options=labels[:3]).index is None
+    assert Select("city", "City", options=labels, searchable=False).index is None
+
+
+def test_radio_set_options() -> None:
+    radio_set = RadioSet("port", "Port", options=[("HTTP", 80), ("HTTPS", 443)])
+    assert radio_set.default_value == 80
+    assert radio_set.validate_answer("HTTPS")[1] == 443
+    assert radio_set.validate_answer(443)[1] == 443
+    assert not radio_set.validate_answer("FTP")[0].valid
+
+
+def test_option_store() -> None:
+    options = [(f"option-{i}", i, i % 3 == 0) for i in range(20)]
+    store = OptionStore(options[:9], flags=True)
+    store += options[9:]
+    assert store == options and len(store) == 20
+    assert store[9] == options[9] and store[-1] == options[-1] and store[2:4] == options[2:4]
+    assert store.flagged_values() == [i for i in range(20) if i % 3 == 0]
+
+    pairs = OptionStore([("a", 1), ("b", 2)])
+    assert list(pairs) == [("a", 1), ("b", 2)] and not pairs.is_flagged(0)
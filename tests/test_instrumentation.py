@@ -0,0 +1,42 @@
+import json
+from pathlib import Path
+
+from textual_wizard.instrumentation import (
+    Instrumentation,
+    InstrumentationEvent,
+    JSONLinesExporter,
+)
+
+
+def test_counters() -> None:
+    instrumentation = Instrumentation()
+    instrumentation.record("validation", 0.5, "name")
+    instrumentation.record("validation", 1.5, "name")
+    with instrumentation.time("compose", stage="Stage"):
+        pass
+
+    validation, compose = instrumentation.report()
+    assert validation == {
+        "event": "validation",
+        "question": "name",
+        "count": 2,
+        "total": 2.0,
+        "mean": 1.0,
+        "max": 1.5,
+    }
+    assert compose["event"] == "compose" and compose["count"] == 1
+
+
+def test_hooks(tmp_path: Path) -> None:
+    events: list[InstrumentationEvent] = list()
+    path = tmp_path / "events.jsonl"
+    exporter = JSONLinesExporter(path)
+    instrumentation = Instrumentation(events.append, exporter)
+    instrumentation.record("goto", 0.25, "age", "Stage")
+    instrumentation.record("goto", 0.5, "name", "Stage")
+    instrumentation.flush()
+
+    lines = [json.loads(x) for x in path.read_text().splitlines()]
+    assert lines == events
+    assert [(x["question"], x["duration"]) for x in lines] == [("age", 0.25), ("name", 0.5)]
+    exporter.close()
@@ -0,0 +1,91 @@
+import asyncio
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from textual_wizard.exceptions import InvalidAnswer
+from textual_wizard.inputs import InputType, Integer, Select, Text
+from textual_wizard.sources import DictSource, EnvSource, FileSource, StdinSource
+from textual_wizard.wizard import MultiStageWizard, Wizard
+
+QUESTIONS: list[InputType] = [
+    Text("name", "What is your name ?"),
+    Integer("age", "How old are you ?", allow_blank=True, default_value=18),
+    Select("animal", "Favorite animal ?", options=["Cats", "Dogs"]),
+]
+
+
+def test_sources() -> None:
+    assert EnvSource("app", {"APP_NAME": "Skwal"}).get("name") == "Skwal"
+    assert StdinSource(io.StringIO("name=Skwal\nage = 20\n")).get("name") == "Skwal"
+    assert DictSource({"age": 20}).get("name") is None
+
+
+def test_file_source(tmp_path: Path) -> None:
+    path = tmp_path / "answers.json"
+    path.write_text(json.dumps({"name": "Skwal", "age": 20}))
+    wiz = Wizard(disable_tui=True, answer_sources=[FileSource(path)], prompt_missing=False)
+    assert wiz.run(QUESTIONS) == {"name": "Skwal", "age": 20, "animal": "Cats"}
+
+
+def test_sources_priority() -> None:
+    sources = [EnvSource("app", {"APP_ANIMAL": "Dogs"}), DictSource({"name": "Skwal"})]
+    wiz = MultiStageWizard(disable_tui=True, answer_sources=sources, prompt_missing=False)
+    answers = wiz.run([{"title": "Stage", "questions": QUESTIONS}])
+    assert answers == {"name": "Skwal", "age": 18, "animal": "Dogs"}
+
+
+def test_answers_are_streamed() -> None:
+    streamed = list()
+    source = DictSource({"name": "Skwal"})
+    wiz = Wizard(
+        disable_tui=True,
+        answer_sources=[source],
+        prompt_missing=False,
+        on_answer=lambda name, value: streamed.append((name, value)),
+    )
+    wiz.run(QUESTIONS)
+    assert streamed == [("name", "Skwal"), ("age", 18), ("animal", "Cats")]
+
+
+def test_run_async() -> None:
+    streamed = list()
+    wiz = MultiStageWizard(
+        disable_tui=True,
+        answer_sources=[DictSource({"name": "Skwal"})],
+        prompt_missing=False,
+        on_answer=lambda name, _: streamed.append(name),
+    )
+
+    async def run() -> dict[str, Any] | None:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        # Other coroutines keep running alongside the wizard
+        ticker = asyncio.create_task(tick())
+        answers = await wiz.run_async([{"title": "Stage", "questions": QUESTIONS}])
+        ticker.cancel()
+        assert ticks > 0
+        return answers
+
+    assert asyncio.run(run()) == {"name": "Skwal", "age": 18, "animal": "Cats"}
+    assert streamed == ["name", "age", "animal"]
+
+
+def test_invalid_answers() -> None:
+    wiz = Wizard(disable_tui=True, answer_sources=[DictSource({"age": 20})], prompt_missing=False)
+    with pytest.raises(InvalidAnswer):
+        wiz.run(QUESTIONS)
+
+    sources = [DictSource({"name": "Skwal", "age": "twenty"})]
+    wiz = Wizard(disable_tui=True, answer_sources=sources, prompt_missing=False)
+    with pytest.raises(InvalidAnswer):
+        wiz.run(QUESTIONS)
@@ -0,0 +1,867 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
+
+from textual import events
+from textual.pilot import Pilot
+from textual.widgets import Input, RadioButton
+from textual.widgets import Select as Select_
+from textual.widgets import SelectionList as SelectionList_
+from textual.widgets._select import SelectOverlay
+
+from textual_wizard.app import WizardApp, WizardScreen
+from textual_wizard.checkpoint import Checkpoint
+from textual_wizard.inputs import (
+    AsyncValidator,
+    InputType,
+    Integer,
+    RadioSet,
+    Select,
+    SelectionList,
+    Text,
+)
+from textual_wizard.instrumentation import Instrumentation, JSONLinesExporter
+from textual_wizard.options import OptionProvider
+from textual_wizard.session import SessionRecorder, read_session, replay_session
+from textual_wizard.wizard import Stages
+
+STAGES: Stages = [
+    {
+        "title": "First stage",
+        "questions": [
+            Text("name", "What is your name ?"),
+            Select("animal", "What is your favorite animal ?", options=["Cats", "Dogs"]),
+        ],
+    },
+    {
+        "title": "Second stage",
+        "questions": [Integer("age", "How old are you ?")],
+    },
+]
+
+
+def make_app(stages: Stages, *, single_page: bool = True) -> WizardApp:
+    app = WizardApp()
+    app.single_page = single_page
+    app.set_stages(stages)
+    return app
+
+
+def test_stages_share_one_app() -> None:
+    async def run() -> dict[str, Any] | None:
+        app = make_app(STAGES)
+        async with app.run_test() as pilot:
+            first = app.screen
+            assert isinstance(first, WizardScreen)
+            first.query_one("#input-0", Input).value = "Skwal"
+            await pilot.click("#next-button")
+            await pilot.pause()
+
+            second = app.screen
+            assert isinstance(second, WizardScreen) and second is not first
+            second.query_one("#input-0", Input).value = "20"
+
+            # Going back shows the same, still mounted, screen with its values
+            await pilot.click("#back-button")
+            await pilot.pause()
+            assert app.screen is first
+            assert first.query_one("#input-0", Input).value == "Skwal"
+
+            await pilot.click("#next-button")
+            await pilot.pause()
+            assert app.screen is second
+            assert second.query_one("#input-0", Input).value == "20"
+
+            await pilot.click("#next-button")
+            await pilot.pause()
+        return app.return_value
+
+    assert asyncio.run(run()) == {"name": "Skwal", "animal": "Cats", "age": 20}
+
+
+def test_paged_stage() -> None:
+    async def run() -> dict[str, Any] | None:
+        app = make_app(STAGES, single_page=False)
+        async with app.run_test() as pilot:
+            await pilot.press(*"Skwal", "enter")
+            await pilot.click("#next-button")
+            await pilot.pause()
+            await pilot.press(*"42", "enter")
+            await pilot.pause()
+        return app.return_value
+
+    assert asyncio.run(run()) == {"name": "Skwal", "animal": "Cats", "age": 42}
+
+
+def test_lazy_mount() -> None:
+    questions: list[InputType] = [Text(f"q{i}", f"Question {i}") for i in range(50)]
+    questions.append(RadioSet("last", "Last question", options=["a", "b", "c"]))
+
+    async def run() -> dict[str, Any] | None:
+        app = make_app([{"title": "Lazy", "questions": questions}], single_page=False)
+        app.lazy_mount = True
+        app.lookahead = 1
+        async with app.run_test() as pilot:
+            screen = app.screen
+            assert isinstance(screen, WizardScreen)
+            assert screen.mounted_inputs == {0, 1}
+            assert len(screen.query(Input)) == 2
+
+            await pilot.press("a", "enter", "b", "enter")
+            await pilot.pause()
+            assert screen.mounted_inputs == {1, 2, 3}
+
+            # Values of unmounted questions are restored when going back
+            await pilot.press("c", "enter", "d", "enter")
+            await pilot.pause()
+            assert 0 not in screen.mounted_inputs
+            screen.goto(1)
+            screen.goto(0)
+            await pilot.pause()
+            assert screen.query_one("#input-0", Input).value == "a"
+
+            for i in range(50):
+                screen.query_one(f"#input-{i}", Input).value = str(i)
+                screen.goto(i + 1)
+                await pilot.pause()
+
+            screen.query_one("#input-50").query(RadioButton)[2].value = True
+            await pilot.pause()
+            await pilot.click("#next-button")
+            await pilot.pause()
+        return app.return_value
+
+    answers = asyncio.run(run())
+    assert answers is not None
+    assert answers["q0"] == "0" and answers["q49"] == "49"
+    assert answers["last"] == "c"
+
+
+def test_virtual_single_page() -> None:
+    questions = [Text(f"q{i}", f"Question {i}", allow_blank=i != 300) for i in range(500)]
+
+    async def run() -> dict[str, Any] | None:
+        app = make_app([{"title": "Virtual", "questions": questions}])
+        app.lazy_mount = True
+        async with app.run_test(size=(80, 40)) as pilot:
+            screen = app.screen
+            assert isinstance(screen, WizardScreen)
+            assert len(screen.mounted_inputs) < 20
+
+            screen.scroll_view.scroll_to(y=600, animate=False)
+            await pilot.pause()
+            assert min(screen.mounted_inputs) > 190
+            assert len(screen.mounted_inputs) < 20
+
+            # The tab order follows the questions, even when crossing the window boundary
+            await pilot.press("tab")
+            first = app.focused
+            assert first is not None and first.id is not None
+            for _ in range(15):
+                await pilot.press("tab")
+            await pilot.pause()
+            assert app.focused is not None
+            assert app.focused.id == f"input-{int(first.id.split('-')[1]) + 15}"
+
+            # Validation covers the unmounted questions, and scrolls to the invalid one
+            await pilot.click("#next-button")
+            await pilot.pause()
+            assert screen.error_texts[300] is not None
+            assert screen.query_one("#input-300", Input).has_class("invalid")
+
+            screen.query_one("#input-300", Input).value = "Hello"
+            await pilot.click("#next-button")
+            await pilot.pause()
+        return app.return_value
+
+    answers = asyncio.run(run())
+    assert answers is not None
+    assert len(answers) == 500
+    assert answers["q300"] == "Hello"
+
+
+def test_virtual_single_page_resize() -> None:
+    questions: list[InputType] = [Text(f"q{i}", f"Question {i}") for i in range(100)]
+
+    async def run() -> None:
+        app = make_app([{"title": "Virtual", "questions": questions}])
+        app.lazy_mount = True
+        async with app.run_test(size=(80, 20)) as pilot:
+            screen = app.screen
+            assert isinstance(screen, WizardScreen)
+            small = screen.window
+
+            # The questions filling the larger viewport are mounted
+            await pilot.resize_terminal(80, 80)
+            await pilot.pause()
+            await pilot.pause()
+            height = screen.scroll_view.size.height
+            assert screen.window[1] > small[1]
+            assert screen.offsets[screen.window[1]] >= height
+            assert screen.mounted_inputs == set(range(*screen.window))
+
+    asyncio.run(run())
+
+
+def test_validation_delay() -> None:
+    async def run() -> dict[str, Any] | None:
+        app = make_app([{"title": "Delay", "questions": [Integer("age", "How old are you ?")]}])
+        app.validation_delay = 0.2
+        async with app.run_test() as pilot:
+            screen = app.screen
+            assert isinstance(screen, WizardScreen)
+            wid = screen.query_one("#input-0", Input)
+
+            wid.value = "4"
+            wid.value = ""
+            await pilot.pause()
+            assert screen.error_texts[0] is None
+
+            # Only the latest value is validated once the input settles
+            await pilot.pause(0.3)
+            assert screen.error_texts[0] is not None
+
+            # Clicking next validates immediately
+            wid.value = "42"
+            await pilot.pause()
+            assert not screen.next_button.disabled
+            await pilot.click("#next-button")
+            await pilot.pause()
+        return app.return_value
+
+    assert asyncio.run(run()) == {"age": 42}
+
+
+def test_validation_delay_keeps_other_errors() -> None:
+    async def run() -> None:
+        questions: list[InputType] = [Integer("age", "Age ?"), Integer("size", "Size ?")]
+        app = make_app([{"title": "Delay", "questions": questions}])
+        app.validation_delay = 0.2
+        async with app.run_test() as pilot:
+            screen = app.screen
+            assert isinstance(screen, WizardScreen)
+            screen.query_one("#input-0", Input).value = "x"
+            screen.query_one("#input-1", Input).value = "x"
+            await pilot.pause(0.3)
+            assert screen.invalid_inputs == {0, 1}
+
+            # Typing in a field clears its error, the other one still disables next
+            screen.query_one("#input-1", Input).value = "4"
+            await pilot.pause()
+            assert screen.error_texts[1] is None
+            assert screen.next_button.disabled
+
+    asyncio.run(run())
+
+
+class SlowUsernameValidator(AsyncValidator):
+    def __init__(self, delay: float = 0.1, gate: Optional[asyncio.Event] = None) -> None:
+        super().__init__("This username is already taken.")
+        self.calls: list[str] = list()
+        self.delay = delay
+        # If provided, checks wait until it is set instead of sleeping
+        self.gate = gate
+
+    async def is_valid(self, value: str) -> bool:
+        self.calls.append(value)
+        if self.gate is not None:
+            await self.gate.wait()
+        else:
+            await asyncio.sleep(self.delay)
+        return value != "skwal"
+
+
+def test_async_validators() -> None:
+    gate = asyncio.Event()
+    validator = SlowUsernameValidator(gate=gate)
+    question = Text("username", "Choose a username", async_validators=[validator])
+
+    async def run() -> dict[str, Any] | None:
+        app = make_app([{"title": "Async", "questions": [question]}], single_page=False)
+        async with app.run_test() as pilot:
+            screen = app.screen
+            assert isinstance(screen, WizardScreen)
+            wid = screen.query_one("#input-0", Input)
+
+            # Stale checks are cancelled when the value changes
+            wid.value = "skw"
+            await pilot.pause()
+            assert wid.has_class("pending")
+            wid.value = "skwal"
+            await pilot.pause()
+            assert wid.has_class("pending")
+            gate.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert not wid.has_class("pending")
+            assert screen.error_texts[0] == "This username is already taken."
+
+            # Clicking next waits for the result of the async validators
+            gate.clear()
+            wid.value = "leopold"
+            await pilot.pause()
+            await pilot.click("#next-button")
+            await pilot.pause()
+            assert wid.has_class("pending") and app.return_code is None
+            gate.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+        return app.return_value
+
+    assert asyncio.run(run()) == {"username": "leopold"}
+    assert validator.calls == ["skw", "skwal", "leopold"]
+
+    # Results are cached by value
+    assert question.get_async_result("skwal") is not None
+    assert asyncio.run(question.is_value_accepted_async("leopold")).valid
+    assert validator.calls == ["skw", "skwal", "leopold"]
+
+
+def test_back_cancels_pending_navigation() -> None:
+    questions: list[InputType] = [
+        Text("a", "A", async_validators=[SlowUsernameValidator()]),
+        Text("b", "B", async_validators=[SlowUsernameValidator(delay=0.5)]),
+    ]
+
+    async def run() -> WizardApp:
+        app = make_app([{"title": "Async", "questions": questions}], single_page=False)
+        async with app.run_test() as pilot:
+            screen = app.screen
+            assert isinstance(screen, WizardScreen)
+            await pilot.press("x", "enter")
+            await pilot.pause(0.2)
+            await pilot.press("y")
+            await pilot.click("#next-button")
+            assert screen.after_validation is not None
+            await pilot.click("#back-button")
+            assert screen.question_index == 0
+
+            # The next successful validation doesn't resume the abandoned navigation
+            await pilot.press("z")
+            await pilot.pause(0.6)
+            assert screen.question_index == 0
+            assert app.return_code is None
+        return app
+
+    asyncio.run(run())
+
+
+def test_answers_are_streamed() -> None:
+    streamed: list[tuple[str, Any]] = list()
+    prefetched: list[str] = list()
+
+    async def prefetch(name: str, value: object) -> None:
+        streamed.append((name, value))
+        await asyncio.sleep(0)
+        prefetched.append(name)
+
+    async def run() -> dict[str, Any] | None:
+        app = make_app(STAGES, single_page=False)
+        app.on_answer = prefetch
+        async with app.run_test() as pilot:
+            await pilot.press(*"Skwal", "enter")
+            await pilot.pause()
+            # The answer is known before the wizard is completed
+            assert streamed == [("name", "Skwal")]
+            assert prefetched == ["name"]
+
+            for button in ("#back-button", "#next-button", "#next-button"):
+                await pilot.click(button)
+                # Buttons ignore clicks during their press animation
+                await pilot.pause(0.25)
+            await pilot.press(*"42", "enter")
+            await pilot.pause()
+        return app.return_value
+
+    assert asyncio.run(run()) is not None
+    # Unchanged answers are only streamed once
+    assert streamed == [("name", "Skwal"), ("animal", "Cats"), ("age", 42)]
+
+
+def test_answer_callbacks_outlive_the_wizard() -> None:
+    async def slow_callback(name: str, value: object) -> str:
+        await asyncio.sleep(0.2)
+        return name
+
+    async def run() -> None:
+        app = make_app(STAGES, single_page=False)
+        app.on_answer = slow_callback
+        async with app.run_test() as pilot:
+            await pilot.press(*"Skwal", "enter")
+            await pilot.click("#next-button")
+            await pilot.pause(0.25)
+            await pilot.press(*"42", "enter")
+            await pilot.pause()
+        assert app.return_value is not None
+
+        # The last callback is still running on the event loop of the host after the exit
+        assert not app.answer_tasks[-1].done()
+        assert await asyncio.gather(*app.answer_tasks) == ["name", "animal", "age"]
+
+    asyncio.run(run())
+
+
+def test_next_stage_is_prefetched() -> None:
+    async def run() -> None:
+        app = make_app(STAGES)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            await pilot.pause()
+            # The widgets of the second stage are built while the first one is shown
+            second = app.stage_screens[1]
+            prepared = second.prepared_widgets[0]
+            assert not second.is_mounted
+
+            app.screen.query_one("#input-0", Input).value = "Skwal"
+            await pilot.click("#next-button")
+            await pilot.pause()
+            assert app.screen is second
+            assert second.query_one("#input-0") is prepared
+
+    asyncio.run(run())
+
+
+def test_next_stage_options_are_prefetched() -> None:
+    requested: list[int] = list()
+
+    async def packages(page: int) -> list[tuple[str, bool]]:
+        requested.append(page)
+        await asyncio.sleep(0)
+        return [(f"pkg-{i}", False) for i in range(page * 20, min(page * 20 + 20, 1000))]
+
+    question = SelectionList("packages", "Packages", options=OptionProvider(packages))
+    stages: Stages = [
+        {"title": "Name", "questions": [Text("name", "Name")]},
+        {"title": "Packages", "questions": [question]},
+    ]
+
+    async def run() -> None:
+        app = make_app(stages)
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            # The first page of options of the second stage is loaded while the first one is shown
+            assert requested == [0]
+            assert len(question.options) == 20
+
+            app.screen.query_one("#input-0", Input).value = "Skwal"
+            await pilot.click("#next-button")
+            await pilot.pause()
+            assert app.screen is app.stage_screens[1]
+            selection = app.screen.query_one("#input-0", SelectionList_)
+            assert selection.option_count >= 20
+            assert requested[0] == 0 and len(requested) == len(set(requested))
+
+    asyncio.run(run())
+
+
+def test_options_are_loaded_incrementally() -> None:
+    requested: list[int] = list()
+
+    async def packages(page: int) -> list[tuple[str, bool]]:
+        requested.append(page)
+        await asyncio.sleep(0)
+        return [(f"pkg-{i}", False) for i in range(page * 20, min(page * 20 + 20, 1000))]
+
+    async def hosts() -> AsyncIterator[str]:
+        for i in range(50):
+            yield f"host-{i}"
+
+    questions: list[InputType] = [
+        Select("host", "Host", options=OptionProvider(hosts(), page_size=10)),
+        SelectionList("packages", "Packages", options=OptionProvider(packages)),
+    ]
+
+    async def run() -> None:
+        app = make_app([{"title": "Stage", "questions": questions}])
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            select = app.screen.query_one("#input-0", Select_)
+            assert select.value == "host-0"
+
+            # Only the pages needed to fill the list are loaded
+            selection = app.screen.query_one("#input-1", SelectionList_)
+            loaded = selection.option_count
+            assert 0 < loaded < 1000
+
+            selection.scroll_end(animate=False)
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert selection.option_count > loaded
+            assert len(requested) == len(set(requested))
+
+    asyncio.run(run())
+
+
+def test_filter_loads_more_options() -> None:
+    async def hosts(page: int) -> list[tuple[str, bool]]:
+        await asyncio.sleep(0)
+        return [(f"host-{i}", False) for i in range(page * 100, min(page * 100 + 100, 1000))]
+
+    question = SelectionList("hosts", "Hosts", options=OptionProvider(hosts))
+
+    async def run() -> None:
+        app = make_app([{"title": "Stage", "questions": [question]}])
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            selection = app.screen.query_one("#input-0", SelectionList_)
+            assert len(question.options) == 100
+
+            # The loaded options don't match, so the next pages are loaded until they do
+            selection.focus()
+            await pilot.press(*"host-95")
+            for _ in range(20):
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+            assert len(question.options) == 1000
+            assert selection.option_count == 11
+
+    asyncio.run(run())
+
+
+def test_type_to_filter() -> None:
+    packages = [(f"pkg-{i}", i, i % 100 == 0) for i in range(1000)]
+    questions: list[InputType] = [
+        SelectionList("packages", "Packages", options=packages),
+        RadioSet("color", "Color", options=[f"color-{i}" for i in range(60)]),
+        Select("port", "Port", options=[str(x) for x in range(8000, 8100)], default_value="8001"),
+    ]
+
+    async def run() -> None:
+        app = make_app([{"title": "Stage", "questions": questions}])
+        async with app.run_test() as pilot:
+            screen = app.screen
+            assert isinstance(screen, WizardScreen)
+            selection = screen.query_one("#input-0", SelectionList_)
+            selection.focus()
+            await pilot.press("9", "9", "9")
+            assert selection.option_count == 1
+            assert selection.border_subtitle == "Filter: 999"
+
+            # Selecting a filtered option keeps the hidden ones selected
+            selection.select(999)
+            await pilot.press("backspace")
+            assert selection.option_count == 19
+            await pilot.press("escape")
+            assert selection.option_count == 1000
+            assert selection.border_subtitle is None
+            assert sorted(selection.selected) == [*range(0, 1000, 100), 999]
+
+            await pilot.press("1", "2")
+            screen.register_input(0)
+            assert sorted(screen.answers["packages"]) == [*range(0, 1000, 100), 999]
+
+            radio_set = screen.query_one("#input-1")
+            radio_set.focus()
+            await pilot.press("5", "9")
+            shown = [x for x in radio_set.query(RadioButton) if x.display]
+            assert [str(x.label) for x in shown] == ["color-59"]
+            # The buttons are queried once, not on every keystroke
+            assert screen.radio_buttons[1] == list(radio_set.query(RadioButton))
+
+            # Typing on a select expands it, and its selection stays available
+            select = screen.query_one("#input-2", Select_)
+            select.focus()
+            await pilot.press("8", "0", "5", "0")
+            assert select.expanded
+            assert [x.prompt for x in select.query_one(SelectOverlay).options] == ["8001", "8050"]
+            await pilot.press("escape", "escape")
+            assert not select.expanded and select.value == "8001"
+            assert select.border_subtitle is None
+
+    asyncio.run(run())
+
+
+def test_radio_set_values() -> None:
+    questions: list[InputType] = [
+        RadioSet("port", "Port", options=[("HTTP", 80), ("HTTPS", 443)], default_value=443),
+    ]
+
+    async def run() -> None:
+        app = make_app([{"title": "Stage", "questions": questions}])
+        async with app.run_test() as pilot:
+            screen = app.screen
+            assert isinstance(screen, WizardScreen)
+            screen.register_input(0)
+            assert screen.answers["port"] == 443
+
+            await pilot.click(RadioButton)
+            screen.register_input(0)
+            assert screen.answers["port"] == 80
+
+    asyncio.run(run())
+
+
+def resume_app(stages: Stages, path: Path, answers: dict[str, Any], **kwargs: bool) -> WizardApp:
+    path.write_text(json.dumps({"answers": answers}))
+    app = make_app(stages, **kwargs)
+    app.checkpoint = Checkpoint(path, resume=True)
+    app.resume = True
+    return app
+
+
+def test_resume_paged_stage(tmp_path: Path) -> None:
+    questions: list[InputType] = [
+        Text("name", "What is your name ?"),
+        Integer("age", "How old are you ?"),
+        RadioSet("port", "Port", options=[("HTTP", 80), ("HTTPS", 443)]),
+    ]
+    path = tmp_path / "answers.json"
+    app = resume_app(
+        [{"title": "Stage", "questions": questions}],
+        path,
+        {"name": "Skwal", "port": 443},
+        single_page=False,
+    )
+
+    async def run() -> dict[str, Any] | None:
+        async with app.run_test() as pilot:
+            screen = app.screen
+            assert isinstance(screen, WizardScreen)
+            # Starts at the first unanswered question
+            assert screen.question_index == 1
+            await pilot.press(*"42", "enter")
+            await pilot.pause()
+            assert screen.question_index == 2
+            assert screen.pressed_options[2] == 1
+            await pilot.pause(0.25)
+            await pilot.click("#next-button")
+            await pilot.pause()
+        return app.return_value
+
+    assert asyncio.run(run()) == {"name": "Skwal", "age": 42, "port": 443}
+    assert app.checkpoint is not None
+    app.checkpoint.flush()
+    assert json.loads(path.read_text())["answers"] == {"name": "Skwal", "age": 42, "port": 443}
+
+
+def test_resume_skips_answered_stages(tmp_path: Path) -> None:
+    path = tmp_path / "answers.json"
+    app = resume_app(STAGES, path, {"name": "Skwal", "animal": "Dogs"})
+
+    async def run() -> dict[str, Any] | None:
+        async with app.run_test() as pilot:
+            assert app.screen.query_one("#input-0", Input).value == ""
+            await pilot.press(*"20")
+            await pilot.click("#next-button")
+            await pilot.pause()
+        return app.return_value
+
+    assert asyncio.run(run()) == {"name": "Skwal", "animal": "Dogs", "age": 20}
+
+
+def test_instrumentation(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    app = make_app(STAGES, single_page=False)
+    exporter = JSONLinesExporter(path)
+    app.instrumentation = Instrumentation(exporter)
+
+    async def run() -> None:
+        async with app.run_test() as pilot:
+            await pilot.press(*"Skwal", "enter")
+            await pilot.pause()
+            await pilot.click("#next-button")
+            await pilot.pause()
+            await pilot.press(*"42", "enter")
+            await pilot.pause()
+
+    asyncio.run(run())
+    # The file is closed when the wizard exits
+    assert exporter.file is None
+    events = [json.loads(x) for x in path.read_text().splitlines()]
+    recorded = {(x["event"], x["question"]) for x in events}
+    assert {
+        ("compose", None),
+        ("as_widget", "name"),
+        ("validation", "name"),
+        ("register_input", "name"),
+        ("goto", "animal"),
+        ("question_time", "name"),
+        ("question_time", "animal"),
+        ("question_time", "age"),
+    } <= recorded
+    assert {x["stage"] for x in events} == {"First stage", "Second stage"}
+
+
+async def click_in_terminal(pilot: Pilot[Any], selector: str) -> None:
+    """Click a widget like a terminal does, Pilot.click bypasses the app"""
+    x, y = pilot.app.screen.query_one(selector).region.center
+    for event_type in (events.MouseDown, events.MouseUp):
+        pilot.app.post_message(event_type(None, x, y, 0, 0, 1, False, False, False, x, y))
+    await pilot.pause()
+
+
+def test_record_and_replay(tmp_path: Path) -> None:
+    path = tmp_path / "session.json"
+    app = make_app(STAGES)
+    app.recorder = SessionRecorder()
+
+    async def record() -> dict[str, Any] | None:
+        async with app.run_test(size=(100, 40)) as pilot:
+            await pilot.press(*"Skwal")
+            await click_in_terminal(pilot, "#next-button")
+            await pilot.pause(0.25)
+            await pilot.press(*"42")
+            await click_in_terminal(pilot, "#next-button")
+            await pilot.pause()
+        return app.return_value
+
+    answers = asyncio.run(record())
+    app.recorder.save(path)
+    session = read_session(path)
+    assert session["size"] == (100, 40)
+    assert [(x["type"], x["value"]) for x in session["events"]] == [
+        *(("key", x) for x in "Skwal"),
+        ("click", "next-button"),
+        ("key", "4"),
+        ("key", "2"),
+        ("click", "next-button"),
+    ]
+
+    for realtime in (False, True):
+        report = asyncio.run(replay_session(make_app(STAGES), session, realtime=realtime))
+        assert report["answers"] == answers == {"name": "Skwal", "animal": "Cats", "age": 42}
+        assert report["replayed"] == 9
+        assert report["latencies"]["key"]["count"] == 7
+        assert report["latencies"]["click"]["count"] == 2
+        assert report["cpu_times"].keys() == {"key", "click"}
+
+
+def test_conditional_questions() -> None:
+    stages: Stages = [
+        {
+            "title": "Pet",
+            "questions": [
+                Select("pet", "Do you have a pet ?", options=["No", "Cat", "Dog"]),
+                Text("pet_name", "What is its name ?", when=lambda pet: pet != "No"),
+                Integer(
+                    "meals",
+                    "How many meals a day ?",
+                    when=lambda pet: pet != "No",
+                    compute_default=lambda pet: 2 if pet == "Cat" else 3,
+                ),
+                Text("owner", "What is your name ?"),
+            ],
+        },
+        {
+            "title": "Dog",
+            "questions": [Integer("walks", "How many walks ?", when=lambda pet: pet == "Dog")],
+        },
+    ]
+
+    async def run() -> dict[str, Any] | None:
+        app = make_app(stages)
+        async with app.run_test() as pilot:
+            screen = app.screen
+            assert isinstance(screen, WizardScreen)
+            # Skipped questions are not mounted
+            assert screen.skipped == {1, 2}
+            assert [x is not None for x in screen.input_widgets] == [True, False, False, True]
+
+            screen.query_one("#input-0", Select_).value = "Cat"
+            await pilot.pause()
+            assert screen.skipped == set()
+            assert screen.query_one("#input-2", Input).value == "2"
+            # Mounted in order
+            inputs = [x.id for x in screen.query(".input")]
+            assert inputs == ["input-0", "input-1", "input-2", "input-3"]
+
+            # The computed default follows the answers, until the user changes it
+            screen.query_one("#input-0", Select_).value = "Dog"
+            await pilot.pause()
+            assert screen.query_one("#input-2", Input).value == "3"
+            screen.query_one("#input-2", Input).value = "4"
+            screen.query_one("#input-0", Select_).value = "Cat"
+            await pilot.pause()
+            assert screen.query_one("#input-2", Input).value == "4"
+
+            # Skipped questions are not validated
+            screen.query_one("#input-0", Select_).value = "No"
+            await pilot.pause()
+            assert screen.input_widgets[1] is None
+            screen.query_one("#input-3", Input).value = "Skwal"
+            await pilot.click("#next-button")
+            await pilot.pause()
+        return app.return_value
+
+    # The second stage only has skipped questions, so it is skipped too
+    assert asyncio.run(run()) == {
+        "pet": "No",
+        "pet_name": None,
+        "meals": None,
+        "owner": "Skwal",
+        "walks": None,
+    }
+
+
+def test_conditional_paged_questions() -> None:
+    questions: list[InputType] = [
+        Integer("age", "How old are you ?"),
+        Text("school", "Which school ?", when=lambda age: age is not None and age < 18),
+        Text("job", "What is your job ?", when=lambda age: age is not None and age >= 18),
+    ]
+
+    async def run() -> dict[str, Any] | None:
+        app = make_app([{"title": "Paged", "questions": questions}], single_page=False)
+        async with app.run_test() as pilot:
+            screen = app.screen
+            assert isinstance(screen, WizardScreen)
+            await pilot.press("3", "0", "enter")
+            # The question for minors is skipped
+            assert screen.question_index == 2
+            await pilot.press("D", "e", "v")
+            await pilot.click("#back-button")
+            await pilot.pause()
+            assert screen.question_index == 0
+            await pilot.press("enter")
+            await pilot.press("enter")
+        return app.return_value
+
+    assert asyncio.run(run()) == {"age": 30, "school": None, "job": "Dev"}
+
+
+def test_conditions_read_valid_answers() -> None:
+    questions: list[InputType] = [
+        Integer("age", "How old are you ?"),
+        Text("job", "What is your job ?", when=lambda age: age >= 18),
+    ]
+    stages: Stages = [{"title": "Work", "questions": questions}]
+
+    async def run_single_page() -> None:
+        app = make_app(stages)
+        app.validation_delay = 0.1
+        async with app.run_test() as pilot:
+            screen = app.screen
+            assert isinstance(screen, WizardScreen)
+            # The empty age is not valid, so the condition isn't evaluated yet
+            assert screen.skipped == set()
+
+            await pilot.press("1", "2")
+            assert screen.skipped == set()
+            await pilot.pause(0.2)
+            assert screen.skipped == {1}
+
+            # Invalid answers leave the questions depending on them as they are
+            await pilot.press("backspace", "backspace", "x")
+            await pilot.pause(0.2)
+            assert screen.skipped == {1} and 0 in screen.invalid_inputs
+
+            await pilot.press("backspace", "3", "0")
+            await pilot.pause(0.2)
+            assert screen.skipped == set()
+
+    async def run_paged() -> dict[str, Any] | None:
+        app = make_app(stages, single_page=False)
+        app.validation_delay = 0.1
+        async with app.run_test() as pilot:
+            # Submitted before the delay, the answer is validated before moving on
+            await pilot.press("1", "2", "enter")
+            await pilot.pause()
+        return app.return_value
+
+    asyncio.run(run_single_page())
+    assert asyncio.run(run_paged()) == {"age": 12, "job": None}